@@ -20,7 +20,7 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-db_url = (
+db_url = os.getenv("DATABASE_URL") or (
     f"postgresql://{os.getenv('DB_USER')}:{os.getenv('DB_PASS')}"
     f"@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
 )
@@ -38,6 +38,19 @@ def run_migrations_offline():
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
+        transaction_per_migration=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_on_connection(connection):
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        compare_type=True,
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -45,6 +58,12 @@ def run_migrations_offline():
 
 
 def run_migrations_online():
+    # The application passes its own connection on startup (see app/startup.py)
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        run_migrations_on_connection(connection)
+        return
+
     section = config.get_section(config.config_ini_section)
 
     if section is None:
@@ -57,14 +76,7 @@ def run_migrations_online():
     )
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-            compare_type=True,
-        )
-
-        with context.begin_transaction():
-            context.run_migrations()
+        run_migrations_on_connection(connection)
 
 
 if context.is_offline_mode():
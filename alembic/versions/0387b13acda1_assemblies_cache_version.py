@@ -0,0 +1,43 @@
+"""
+assemblies cache version
+
+Revision ID: 0387b13acda1
+Revises: 9dfa2b24e4d9
+Create Date: 2026-10-18 17:36:58.214467
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0387b13acda1"
+down_revision: Union[str, None] = "9dfa2b24e4d9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Reuses bump_cache_version() from the cache_versions migration
+TRIGGERS = {
+    "assemblies": "assemblies",
+    "assembly_component_association": "assemblies",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, scope in TRIGGERS.items():
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_bump_cache_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_cache_version('{scope}')
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_bump_cache_version ON {table}")
@@ -0,0 +1,41 @@
+"""
+seed fingerprints
+
+Revision ID: 206c2d9e37bd
+Revises: 9b29737a8051
+Create Date: 2026-10-18 10:12:31.402117
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "206c2d9e37bd"
+down_revision: Union[str, None] = "9b29737a8051"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "seed_fingerprints",
+        sa.Column("fingerprint", sa.String(length=64), nullable=False),
+        sa.Column(
+            "applied_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("TIMEZONE('utc', now())"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("fingerprint"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("seed_fingerprints")
@@ -0,0 +1,46 @@
+"""
+catalog indexes
+
+Revision ID: 477a071019d8
+Revises: 206c2d9e37bd
+Create Date: 2026-10-18 11:04:52.118730
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+from app.migration_ops import create_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "477a071019d8"
+down_revision: Union[str, None] = "206c2d9e37bd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_components_type_brand_model", "components", ["component_type", "brand_id", "model"]),
+    ("ix_components_brand_id", "components", ["brand_id"]),
+    ("ix_brands_component_type_name", "brands", ["component_type", "name"]),
+    ("ix_cpus_socket_type_id", "cpus", ["socket_type_id"]),
+    ("ix_motherboards_socket_type_id", "motherboards", ["socket_type_id"]),
+    ("ix_motherboards_memory_type_id", "motherboards", ["memory_type_id"]),
+    ("ix_rams_memory_type_id", "rams", ["memory_type_id"]),
+    ("ix_assembly_component_association_component_id", "assembly_component_association", ["component_id"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY does not block writes but cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            create_index_concurrently(name, table, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,44 @@
+"""
+model trigram search
+
+Revision ID: 55013f9eb1f9
+Revises: 9e9b658b41c6
+Create Date: 2026-10-18 15:52:41.118306
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+from app.migration_ops import create_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "55013f9eb1f9"
+down_revision: Union[str, None] = "9e9b658b41c6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        create_index_concurrently(
+            "ix_components_model_trgm",
+            "components",
+            ["model"],
+            postgresql_using="gin",
+            postgresql_ops={"model": "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_components_model_trgm",
+            table_name="components",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
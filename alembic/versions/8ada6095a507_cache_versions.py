@@ -0,0 +1,83 @@
+"""
+cache versions and invalidation triggers
+
+Revision ID: 8ada6095a507
+Revises: 477a071019d8
+Create Date: 2026-10-18 12:31:07.650214
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8ada6095a507"
+down_revision: Union[str, None] = "477a071019d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGGERS = {
+    "brands": "classificators",
+    "socket_types": "classificators",
+    "memory_types": "classificators",
+    "components": "components",
+    "motherboards": "components",
+    "cpus": "components",
+    "gpus": "components",
+    "rams": "components",
+    "soundcards": "components",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "cache_versions",
+        sa.Column("scope", sa.String(length=50), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("TIMEZONE('utc', now())"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("scope"),
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_cache_version() RETURNS trigger AS $$
+        DECLARE
+            new_version bigint;
+        BEGIN
+            INSERT INTO cache_versions (scope, version, updated_at)
+            VALUES (TG_ARGV[0], 1, TIMEZONE('utc', now()))
+            ON CONFLICT (scope) DO UPDATE
+                SET version = cache_versions.version + 1, updated_at = EXCLUDED.updated_at
+            RETURNING version INTO new_version;
+
+            PERFORM pg_notify('cache_invalidation', TG_ARGV[0] || ':' || new_version);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table, scope in TRIGGERS.items():
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_bump_cache_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_cache_version('{scope}')
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_bump_cache_version ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS bump_cache_version()")
+    op.drop_table("cache_versions")
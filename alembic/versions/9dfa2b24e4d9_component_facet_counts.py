@@ -0,0 +1,130 @@
+"""
+component facet counts
+
+Revision ID: 9dfa2b24e4d9
+Revises: 55013f9eb1f9
+Create Date: 2026-10-18 16:44:12.507931
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9dfa2b24e4d9"
+down_revision: Union[str, None] = "55013f9eb1f9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, facet, value column, component type or None to read it from the row)
+FACET_SOURCES = [
+    ("components", "brand", "brand_id", None),
+    ("motherboards", "socket_type", "socket_type_id", "motherboard"),
+    ("cpus", "socket_type", "socket_type_id", "cpu"),
+    ("motherboards", "memory_type", "memory_type_id", "motherboard"),
+    ("rams", "memory_type", "memory_type_id", "ram"),
+]
+EVENTS = {
+    "insert": "INSERT ON {table} REFERENCING NEW TABLE AS new_rows",
+    "update": "UPDATE ON {table} REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    "delete": "DELETE ON {table} REFERENCING OLD TABLE AS old_rows",
+    "truncate": "TRUNCATE ON {table}",
+}
+
+
+def trigger_names():
+    for table, facet, column, component_type in FACET_SOURCES:
+        for event, clause in EVENTS.items():
+            yield f"{table}_{facet}_facet_{event}", table, clause, column, component_type, facet
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "component_facet_counts",
+        sa.Column("component_type", sa.String(length=50), nullable=False),
+        sa.Column("facet", sa.String(length=50), nullable=False),
+        sa.Column("value_id", sa.Integer(), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("component_type", "facet", "value_id"),
+    )
+    # Statement-level: a bulk insert or delete applies one aggregated delta per (type, value) instead of
+    # one upsert per row. Keys are upserted in a fixed order so concurrent writers cannot deadlock.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION update_component_facet_counts() RETURNS trigger AS $$
+        DECLARE
+            facet_name text := TG_ARGV[0];
+            value_column text := TG_ARGV[1];
+            type_expression text := COALESCE(quote_literal(TG_ARGV[2]), 'component_type');
+            deltas text[] := '{}';
+        BEGIN
+            IF TG_OP = 'TRUNCATE' THEN
+                DELETE FROM component_facet_counts AS counts
+                WHERE counts.facet = facet_name AND (TG_ARGV[2] IS NULL OR counts.component_type = TG_ARGV[2]);
+                RETURN NULL;
+            END IF;
+
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                deltas := deltas || format(
+                    'SELECT %s AS component_type, %I AS value_id, 1 AS delta FROM new_rows',
+                    type_expression,
+                    value_column
+                );
+            END IF;
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                deltas := deltas || format(
+                    'SELECT %s AS component_type, %I AS value_id, -1 AS delta FROM old_rows',
+                    type_expression,
+                    value_column
+                );
+            END IF;
+
+            EXECUTE format(
+                'INSERT INTO component_facet_counts AS counts (component_type, facet, value_id, count) '
+                'SELECT component_type, %L, value_id, sum(delta) FROM (%s) AS deltas '
+                'WHERE value_id IS NOT NULL GROUP BY component_type, value_id HAVING sum(delta) <> 0 '
+                'ORDER BY component_type, value_id '
+                'ON CONFLICT (component_type, facet, value_id) DO UPDATE SET count = counts.count + EXCLUDED.count',
+                facet_name,
+                array_to_string(deltas, ' UNION ALL ')
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for name, table, clause, column, component_type, facet in trigger_names():
+        arguments = ", ".join(f"'{argument}'" for argument in (facet, column, component_type) if argument)
+        op.execute(
+            f"""
+            CREATE TRIGGER {name}
+            AFTER {clause.format(table=table)}
+            FOR EACH STATEMENT EXECUTE FUNCTION update_component_facet_counts({arguments})
+            """
+        )
+
+    # The triggers hold their tables' locks until commit, so the backfill sees a stable catalog
+    for table, facet, column, component_type in FACET_SOURCES:
+        type_expression = f"'{component_type}'" if component_type else "component_type"
+        group_by = column if component_type else f"component_type, {column}"
+        op.execute(
+            f"""
+            INSERT INTO component_facet_counts (component_type, facet, value_id, count)
+            SELECT {type_expression}, '{facet}', {column}, count(*) FROM {table}
+            WHERE {column} IS NOT NULL
+            GROUP BY {group_by}
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, *_ in trigger_names():
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS update_component_facet_counts()")
+    op.drop_table("component_facet_counts")
@@ -0,0 +1,48 @@
+"""
+spec filter indexes
+
+Revision ID: 9e9b658b41c6
+Revises: 8ada6095a507
+Create Date: 2026-10-18 14:37:05.402113
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.migration_ops import create_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "9e9b658b41c6"
+down_revision: Union[str, None] = "8ada6095a507"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns, partial index predicate)
+INDEXES = [
+    ("ix_cpus_cores", "cpus", ["cores", "id"], None),
+    ("ix_cpus_threads", "cpus", ["threads", "id"], None),
+    ("ix_cpus_integrated_graphics", "cpus", ["id"], "has_integrated_graphics"),
+    ("ix_motherboards_integrated_graphics", "motherboards", ["id"], "has_integrated_graphics"),
+    ("ix_gpus_vram", "gpus", ["vram", "id"], None),
+    ("ix_rams_capacity", "rams", ["capacity", "id"], None),
+    ("ix_rams_frequency", "rams", ["frequency", "id"], None),
+    ("ix_soundcards_channels_quantity", "soundcards", ["channels_quantity", "id"], None),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            create_index_concurrently(name, table, columns, postgresql_where=sa.text(where) if where else None)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -1,26 +1,39 @@
+import time
+
 from flask import Flask
 from flask_wtf.csrf import CSRFProtect
 
 from app.api import init_api
-from app.database import drop_all_tables_cascade, engine
-from app.database_data import seed_data
-from app.models import Base
+from app.commands import init_commands
+from app.config import settings
+from app.database import engine, init_request_session, replicas
+from app.invalidation import start_invalidation_listener
+from app.metrics import init_metrics
 from app.routes import init_routes
+from app.startup import prepare_database, track_time_to_first_request
 
 csrf = CSRFProtect()
 
 
 def create_app():
+    started = time.perf_counter()
     app = Flask(__name__)
 
     csrf.init_app(app)
-    init_api(app)
+    init_request_session(app)
+    init_api(app, csrf)
 
     with app.app_context():
-        drop_all_tables_cascade()
-        Base.metadata.create_all(bind=engine)
-        seed_data()
+        prepare_database()
+
+    if settings.cache_listener_enabled:
+        start_invalidation_listener(engine, settings.cache_poll_interval)
+    replicas.start()
 
     init_routes(app)
+    init_commands(app)
+    if settings.metrics_enabled:
+        init_metrics(app, engine)
+    track_time_to_first_request(app, started)
 
     return app
@@ -6,7 +6,10 @@ from .classificators import classificators_ns
 from .components import components_ns
 
 
-def init_api(app):
+def init_api(app, csrf):
+    # 404s raised for missing records must not get flask-restx's "did you mean" route hints appended
+    app.config.setdefault("ERROR_404_HELP", False)
+
     api_bp = Blueprint("api", __name__, url_prefix="/api")
     api = Api(
         api_bp,
@@ -20,4 +23,6 @@ def init_api(app):
     api.add_namespace(classificators_ns, path="/classificators")
     api.add_namespace(assemblies_ns, path="/assemblies")
 
+    # Machine clients authenticate per request and never see a form, so the CSRF check does not apply
+    csrf.exempt(api_bp)
     app.register_blueprint(api_bp)
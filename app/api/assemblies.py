@@ -1,14 +1,50 @@
-from flask_restx import Namespace, Resource, fields
+import json
+
+from flask import Response, stream_with_context
+from flask_restx import Namespace, Resource, fields, inputs
+from flask_restx.reqparse import RequestParser
 
 from app.api.components import status_code
-<<<<<<< HEAD
+from app.builds import RANK_CHOICES, generate_builds
+from app.database import request_session
+from app.exports import assembly_to_json, assembly_to_txt, assembly_to_xml
+from app.forms import get_component_choices
+from app.models import Assembly
+from app.pagination import get_page_size
+from app.queries import assembly_summaries
+from app.services import (
+    ASSEMBLY_SLOTS,
+    NotFoundError,
+    assembly_detail,
+    create_assembly,
+    delete_assembly,
+    update_assembly,
+)
+
 from .common_models import register_common_models
-=======
-from app.common_models import register_common_models
->>>>>>> c5f234ff2ba19e75b2d1e9b596f23c9b79a73b6d
+from .responses import (
+    json_response,
+    register_error_handlers,
+    row_to_dict,
+    rows_to_dicts,
+)
 
 assemblies_ns = Namespace("assemblies", description="Операции со сборками")
 models = register_common_models(assemblies_ns)
+register_error_handlers(assemblies_ns)
+
+generate_parser = RequestParser()
+generate_parser.add_argument("min_cores", type=int, help="Минимальное количество ядер CPU")
+generate_parser.add_argument("min_threads", type=int, help="Минимальное количество потоков CPU")
+generate_parser.add_argument("min_vram", type=int, help="Минимальный объем видеопамяти в ГБ")
+generate_parser.add_argument("min_capacity", type=int, help="Минимальный объем RAM в ГБ")
+generate_parser.add_argument("min_frequency", type=int, help="Минимальная частота RAM в МГц")
+generate_parser.add_argument("brand_id", type=int, action="append", default=[], help="Предпочитаемые бренды")
+generate_parser.add_argument("in_stock", type=inputs.boolean, default=False, help="Только компоненты в наличии")
+generate_parser.add_argument("with_gpu", type=inputs.boolean, default=True, help="Включать дискретную видеокарту")
+generate_parser.add_argument("with_soundcard", type=inputs.boolean, default=True, help="Включать звуковую карту")
+generate_parser.add_argument("rank", type=str, choices=RANK_CHOICES, default="balanced", help="Критерий ранжирования")
+generate_parser.add_argument("limit", type=int, default=50, help="Максимальное количество сборок")
 
 assembly_model = assemblies_ns.model(
     "Assembly",
@@ -39,14 +75,102 @@ assembly_input = assemblies_ns.model(
 )
 
 
+def assembly_to_dict(session, assembly_id):
+    assembly, parts = assembly_detail(session, assembly_id)
+    data = row_to_dict(assembly)
+    data["components"] = rows_to_dicts(parts, drop_none=True)
+    return data
+
+
+def assembly_form_choices():
+    return {
+        component_type: [
+            {"id": choice_id, "label": label} for choice_id, label in get_component_choices(component_type)
+        ]
+        for component_type in ASSEMBLY_SLOTS
+    }
+
+
+def assembly_download(assembly_id, render, mimetype, extension):
+    with request_session() as session:
+        assembly = session.get(Assembly, assembly_id)
+        if assembly is None:
+            raise NotFoundError(f"Assembly {assembly_id} not found")
+
+        return Response(
+            render(assembly),
+            mimetype=mimetype,
+            headers={"Content-Disposition": f"attachment;filename=assembly_{assembly_id}.{extension}"},
+        )
+
+
 @assemblies_ns.route("/")
 class AssembliesListResource(Resource):
     @assemblies_ns.doc("get_assemblies")
-    @assemblies_ns.marshal_list_with(assembly_model)
-    @assemblies_ns.response(200, "Успешно")
+    @assemblies_ns.response(200, "Успешно", [assembly_model])
     def get(self):
         """Получить список всех сборок"""
-        pass
+        with request_session() as session:
+            assemblies = assembly_summaries(session)
+
+        return json_response(
+            [
+                {
+                    "id": assembly.id,
+                    "name": assembly.name,
+                    "quantity": assembly.quantity,
+                    "components": {
+                        component_type: {"id": row.id, "brand_name": row.brand_name, "model": row.model}
+                        for component_type, row in assembly.components.items()
+                    },
+                }
+                for assembly in assemblies
+            ]
+        )
+
+
+BUILD_EXCLUDED_FIELDS = {"component_type", "created_at", "updated_at"}
+
+
+def build_to_json(score, build):
+    return json.dumps(
+        {
+            "score": round(score, 4),
+            "components": {
+                component_type: {
+                    key: value
+                    for key, value in row._asdict().items()
+                    if value is not None and key not in BUILD_EXCLUDED_FIELDS
+                }
+                for component_type, row in build.items()
+            },
+        },
+        ensure_ascii=False,
+    )
+
+
+@assemblies_ns.route("/generate")
+class AssemblyGenerateResource(Resource):
+    @assemblies_ns.doc("generate_assemblies")
+    @assemblies_ns.expect(generate_parser)
+    @assemblies_ns.produces(["application/x-ndjson"])
+    @assemblies_ns.response(200, "Поток совместимых сборок (NDJSON), лучшие первыми")
+    def get(self):
+        """Подобрать совместимые сборки по ограничениям"""
+        args = generate_parser.parse_args()
+        limit = get_page_size(args.pop("limit"))
+        args["brand_ids"] = args.pop("brand_id")
+
+        with request_session() as session:
+            builds = generate_builds(session, **args)
+
+        def stream():
+            for count, (score, build) in enumerate(builds):
+                if count == limit:
+                    break
+                yield build_to_json(score, build) + "\n"
+
+        return Response(stream_with_context(stream()), mimetype="application/x-ndjson")
 
 
 @assemblies_ns.route("/add/select")
@@ -55,27 +179,29 @@ class AssemblyAddResource(Resource):
     @assemblies_ns.response(200, "Форма создания сборки")
     def get(self):
         """Получить форму для создания новой сборки"""
-        pass
+        return json_response({"choices": assembly_form_choices()})
 
     @assemblies_ns.doc("add_assembly")
-    @assemblies_ns.expect(assembly_input)
-    @assemblies_ns.marshal_with(assembly_model, code=status_code["201"])
-    @assemblies_ns.response(201, "Сборка успешно создана")
+    @assemblies_ns.expect(assembly_input, validate=True)
+    @assemblies_ns.response(201, "Сборка успешно создана", assembly_model)
     @assemblies_ns.response(400, "Ошибка валидации или несовместимые компоненты")
+    @assemblies_ns.response(409, "Сборка с таким названием уже существует")
     def post(self):
         """Создать новую сборку из выбранных компонентов"""
-        pass
+        with request_session() as session:
+            assembly_id = create_assembly(session, assemblies_ns.payload)
+            return json_response(assembly_to_dict(session, assembly_id), status_code["201"])
 
 
 @assemblies_ns.route("/<int:assembly_id>")
 class AssemblyResource(Resource):
     @assemblies_ns.doc("get_assembly")
-    @assemblies_ns.marshal_with(assembly_model)
-    @assemblies_ns.response(200, "Успешно")
+    @assemblies_ns.response(200, "Успешно", assembly_model)
     @assemblies_ns.response(404, "Сборка не найдена")
     def get(self, assembly_id):
         """Получить детальную информацию о сборке"""
-        pass
+        with request_session() as session:
+            return json_response(assembly_to_dict(session, assembly_id))
 
 
 @assemblies_ns.route("/<int:assembly_id>/delete")
@@ -85,7 +211,9 @@ class AssemblyDeleteResource(Resource):
     @assemblies_ns.response(404, "Сборка не найдена")
     def post(self, assembly_id):
         """Удалить сборку"""
-        pass
+        with request_session() as session:
+            delete_assembly(session, assembly_id)
+        return {"message": "Сборка успешно удалена"}
 
 
 @assemblies_ns.route("/edit/<int:assembly_id>")
@@ -95,17 +223,21 @@ class AssemblyEditResource(Resource):
     @assemblies_ns.response(404, "Сборка не найдена")
     def get(self, assembly_id):
         """Получить форму для редактирования сборки"""
-        pass
+        with request_session() as session:
+            assembly = assembly_to_dict(session, assembly_id)
+        return json_response({"assembly": assembly, "choices": assembly_form_choices()})
 
     @assemblies_ns.doc("edit_assembly")
-    @assemblies_ns.expect(assembly_input)
-    @assemblies_ns.marshal_with(assembly_model)
-    @assemblies_ns.response(200, "Сборка успешно обновлена")
+    @assemblies_ns.expect(assembly_input, validate=True)
+    @assemblies_ns.response(200, "Сборка успешно обновлена", assembly_model)
     @assemblies_ns.response(400, "Ошибка валидации или несовместимые компоненты")
     @assemblies_ns.response(404, "Сборка не найдена")
+    @assemblies_ns.response(409, "Сборка с таким названием уже существует")
     def post(self, assembly_id):
         """Обновить сборку"""
-        pass
+        with request_session() as session:
+            update_assembly(session, assembly_id, assemblies_ns.payload)
+            return json_response(assembly_to_dict(session, assembly_id))
 
 
 @assemblies_ns.route("/<int:assembly_id>/download/xml")
@@ -115,7 +247,7 @@ class AssemblyDownloadXMLResource(Resource):
     @assemblies_ns.response(404, "Сборка не найдена")
     def get(self, assembly_id):
         """Скачать сборку в формате XML"""
-        pass
+        return assembly_download(assembly_id, assembly_to_xml, "application/xml", "xml")
 
 
 @assemblies_ns.route("/<int:assembly_id>/download/json")
@@ -125,7 +257,7 @@ class AssemblyDownloadJSONResource(Resource):
     @assemblies_ns.response(404, "Сборка не найдена")
     def get(self, assembly_id):
         """Скачать сборку в формате JSON"""
-        pass
+        return assembly_download(assembly_id, assembly_to_json, "application/json", "json")
 
 
 @assemblies_ns.route("/<int:assembly_id>/download/txt")
@@ -135,4 +267,4 @@ class AssemblyDownloadTXTResource(Resource):
     @assemblies_ns.response(404, "Сборка не найдена")
     def get(self, assembly_id):
         """Скачать сборку в формате TXT"""
-        pass
+        return assembly_download(assembly_id, assembly_to_txt, "text/plain", "txt")
@@ -1,9 +1,30 @@
-from flask_restx import Namespace, Resource
+from flask_restx import Namespace, Resource, fields
+
+from app.api.components import status_code
+from app.database import request_session
+from app.queries import brand_rows, memory_type_rows, socket_type_rows
+from app.services import (
+    CLASSIFICATOR_MODELS,
+    COMPONENT_MODELS,
+    create_classificator,
+    delete_classificator,
+)
 
 from .common_models import register_common_models
+from .responses import json_response, register_error_handlers, rows_to_dicts
 
 classificators_ns = Namespace("classificators", description="Операции с классификаторами")
 models = register_common_models(classificators_ns)
+register_error_handlers(classificators_ns)
+
+classificator_input = classificators_ns.model(
+    "ClassificatorInput",
+    {
+        "kind": fields.String(required=True, description="Вид классификатора", enum=list(CLASSIFICATOR_MODELS)),
+        "name": fields.String(required=True, description="Название"),
+        "component_type": fields.String(description="Тип компонента (только для брендов)", enum=list(COMPONENT_MODELS)),
+    },
+)
 
 
 @classificators_ns.route("/")
@@ -12,15 +33,35 @@ class ClassificatorsResource(Resource):
     @classificators_ns.response(200, "Страница управления классификаторами")
     def get(self):
         """Получить страницу управления классификаторами (бренды, сокеты, типы памяти)"""
-        pass
+        with request_session() as session:
+            return json_response(
+                {
+                    "brands": rows_to_dicts(brand_rows(session)),
+                    "socket_types": rows_to_dicts(socket_type_rows(session)),
+                    "memory_types": rows_to_dicts(memory_type_rows(session)),
+                }
+            )
 
     @classificators_ns.doc("add_classificator")
+    @classificators_ns.expect(classificator_input, validate=True)
     @classificators_ns.response(201, "Классификатор успешно добавлен")
     @classificators_ns.response(400, "Ошибка валидации")
     @classificators_ns.response(409, "Классификатор уже существует")
     def post(self):
         """Добавить новый классификатор (бренд, сокет или тип памяти)"""
-        pass
+        payload = classificators_ns.payload
+        with request_session() as session:
+            classificator_id = create_classificator(
+                session,
+                payload["kind"],
+                payload["name"],
+                payload.get("component_type"),
+            )
+
+        data = {"id": classificator_id, "name": payload["name"]}
+        if payload["kind"] == "brand":
+            data["component_type"] = payload["component_type"]
+        return data, status_code["201"]
 
 
 @classificators_ns.route("/brand_<int:brand_id>/delete")
@@ -31,7 +72,9 @@ class BrandDeleteResource(Resource):
     @classificators_ns.response(409, "Невозможно удалить - бренд используется в компонентах")
     def post(self, brand_id):
         """Удалить бренд"""
-        pass
+        with request_session() as session:
+            delete_classificator(session, "brand", brand_id)
+        return {"message": "Бренд успешно удален"}
 
 
 @classificators_ns.route("/socket_type_<int:socket_type_id>/delete")
@@ -42,7 +85,9 @@ class SocketTypeDeleteResource(Resource):
     @classificators_ns.response(409, "Невозможно удалить - тип сокета используется в компонентах")
     def post(self, socket_type_id):
         """Удалить тип сокета"""
-        pass
+        with request_session() as session:
+            delete_classificator(session, "socket_type", socket_type_id)
+        return {"message": "Тип сокета успешно удален"}
 
 
 @classificators_ns.route("/memory_type_<int:memory_type_id>/delete")
@@ -53,4 +98,6 @@ class MemoryTypeDeleteResource(Resource):
     @classificators_ns.response(409, "Невозможно удалить - тип памяти используется в компонентах")
     def post(self, memory_type_id):
         """Удалить тип памяти"""
-        pass
+        with request_session() as session:
+            delete_classificator(session, "memory_type", memory_type_id)
+        return {"message": "Тип памяти успешно удален"}
@@ -1,22 +1,142 @@
+import io
 from http import HTTPStatus
 
-from flask_restx import Namespace, Resource, fields
+from flask import request
+from flask_restx import Namespace, Resource, fields, inputs
 from flask_restx.reqparse import RequestParser
+from werkzeug.datastructures import FileStorage
+
+from app.compatibility import get_compatibility_index
+from app.database import request_session
+from app.facets import facet_counts
+from app.forms import (
+    get_brand_choices_for,
+    get_memory_type_choices,
+    get_socket_type_choices,
+)
+from app.imports import IMPORT_FORMATS, MODEL_MAX_LENGTH
+from app.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    InvalidCursorError,
+    get_page_size,
+    keyset_page,
+)
+from app.queries import (
+    SPEC_FILTERS,
+    component_projection,
+    component_sort_columns,
+    components,
+    filter_components,
+    filter_specs,
+)
+from app.search import get_autocomplete_index, ranked_search, search_components
+from app.services import (
+    COMPONENT_FIELDS,
+    COMPONENT_MODELS,
+    NotFoundError,
+    bulk_import_components,
+    component_row,
+    delete_component,
+    update_component,
+    write_component,
+)
 
-<<<<<<< HEAD
 from .common_models import register_common_models
-=======
-from app.common_models import register_common_models
->>>>>>> c5f234ff2ba19e75b2d1e9b596f23c9b79a73b6d
+from .responses import (
+    json_response,
+    nest_includes,
+    register_error_handlers,
+    row_to_dict,
+    rows_to_dicts,
+)
 
 components_ns = Namespace("components", description="Операции с компонентами")
 models = register_common_models(components_ns)
+register_error_handlers(components_ns)
 
-components_parser = RequestParser()
+projection_parser = RequestParser()
+projection_parser.add_argument(
+    "fields",
+    type=str,
+    help="Поля компонента через запятую, например id,model (по умолчанию все)",
+)
+projection_parser.add_argument(
+    "include",
+    type=str,
+    help="Встроить связанные записи через запятую: brand, socket, memory_type",
+)
+
+components_parser = projection_parser.copy()
 components_parser.add_argument("component_type", type=str, help="Тип компонента для фильтрации")
 components_parser.add_argument("brand_id", type=int, help="ID бренда для фильтрации")
+components_parser.add_argument("q", type=str, help="Поиск по модели и бренду (подстрока, допускает опечатки)")
+components_parser.add_argument("cursor", type=str, help="Курсор следующей страницы (next_cursor из прошлого ответа)")
+components_parser.add_argument(
+    "limit",
+    type=int,
+    default=DEFAULT_PAGE_SIZE,
+    help=f"Размер страницы (не больше {MAX_PAGE_SIZE})",
+)
+for name, spec in SPEC_FILTERS.items():
+    components_parser.add_argument(
+        name,
+        type=inputs.boolean if spec.type is bool else spec.type,
+        action="append" if spec.operation is None else "store",
+        help=spec.description,
+    )
+
+search_parser = RequestParser()
+search_parser.add_argument("q", type=str, required=True, help="Строка поиска по модели и бренду")
+search_parser.add_argument("limit", type=int, default=20, help=f"Количество результатов (не больше {MAX_PAGE_SIZE})")
+
+autocomplete_parser = RequestParser()
+autocomplete_parser.add_argument("prefix", type=str, required=True, help="Начало названия модели или бренда")
+autocomplete_parser.add_argument("component_type", type=str, help="Тип компонента")
+autocomplete_parser.add_argument(
+    "limit",
+    type=int,
+    default=10,
+    help=f"Количество подсказок (не больше {MAX_PAGE_SIZE})",
+)
+
+facets_parser = RequestParser()
+facets_parser.add_argument(
+    "component_type",
+    type=str,
+    help="Посчитать бренды, сокеты и типы памяти только для этого типа",
+)
+
+write_parser = RequestParser()
+write_parser.add_argument(
+    "upsert",
+    type=inputs.boolean,
+    location="args",
+    default=False,
+    help="Обновить компонент, если модель уже есть в каталоге (201 - добавлен, 200 - обновлен)",
+)
+
+import_parser = write_parser.copy()
+import_parser.add_argument("format", type=str, choices=IMPORT_FORMATS, default="csv", help="Формат файла")
+import_parser.replace_argument(
+    "upsert",
+    type=inputs.boolean,
+    location="args",
+    default=False,
+    help="Обновлять компоненты, модели которых уже есть в каталоге",
+)
+import_parser.add_argument("file", type=FileStorage, location="files", help="Файл (или передайте его телом запроса)")
+
+compatible_parser = RequestParser()
+compatible_parser.add_argument(
+    "component_type",
+    type=str,
+    required=True,
+    help="Тип совместимых компонентов (например, cpu для материнской платы)",
+)
 
 status_code: dict = {
+    "200": HTTPStatus.OK,
     "201": HTTPStatus.CREATED,
     "400": HTTPStatus.BAD_REQUEST,
     "404": HTTPStatus.NOT_FOUND,
@@ -35,6 +155,55 @@ base_component_model = components_ns.model(
     },
 )
 
+components_page_model = components_ns.model(
+    "ComponentsPage",
+    {
+        "items": fields.List(fields.Nested(base_component_model)),
+        "next_cursor": fields.String(description="Курсор следующей страницы, null на последней странице"),
+    },
+)
+
+search_result_model = components_ns.model(
+    "ComponentSearchResult",
+    {
+        "id": fields.Integer(required=True, description="ID компонента"),
+        "component_type": fields.String(required=True, description="Тип компонента"),
+        "brand_name": fields.String(required=True, description="Бренд"),
+        "model": fields.String(required=True, description="Модель"),
+        "rank": fields.Float(description="Релевантность (только в поиске)"),
+    },
+)
+
+import_row_model = components_ns.model(
+    "ComponentImportRow",
+    {
+        "row": fields.Integer(description="Номер строки в файле"),
+        "model": fields.String(description="Модель"),
+        "status": fields.String(description="Итог строки", enum=["updated", "skipped", "failed"]),
+        "errors": fields.List(fields.String, description="Ошибки строки"),
+    },
+)
+
+import_report_model = components_ns.model(
+    "ComponentImportReport",
+    {
+        "created": fields.Integer(description="Добавлено компонентов"),
+        "updated": fields.Integer(description="Обновлено компонентов (upsert)"),
+        "skipped": fields.Integer(description="Пропущено (модель уже есть в каталоге)"),
+        "failed": fields.Integer(description="Строк с ошибками"),
+        "rows": fields.List(fields.Nested(import_row_model), description="Строки, которые не были добавлены"),
+    },
+)
+
+compatible_components_model = components_ns.model(
+    "CompatibleComponents",
+    {
+        "component_id": fields.Integer(required=True, description="ID выбранного компонента"),
+        "component_type": fields.String(required=True, description="Тип совместимых компонентов"),
+        "ids": fields.List(fields.Integer, description="ID совместимых компонентов"),
+    },
+)
+
 motherboard_model = components_ns.inherit(
     "Motherboard",
     base_component_model,
@@ -81,11 +250,11 @@ soundcard_model = components_ns.inherit(
 motherboard_input = components_ns.model(
     "MotherboardInput",
     {
-        "brand_id": fields.Integer(required=True, description="ID бренда"),
-        "model": fields.String(required=True, description="Модель"),
-        "quantity": fields.Integer(required=True, description="Количество"),
-        "socket_type_id": fields.Integer(required=True, description="ID типа сокета"),
-        "memory_type_id": fields.Integer(required=True, description="ID типа памяти"),
+        "brand_id": fields.Integer(required=True, min=1, description="ID бренда"),
+        "model": fields.String(required=True, min_length=1, max_length=MODEL_MAX_LENGTH, description="Модель"),
+        "quantity": fields.Integer(required=True, min=0, description="Количество"),
+        "socket_type_id": fields.Integer(required=True, min=1, description="ID типа сокета"),
+        "memory_type_id": fields.Integer(required=True, min=1, description="ID типа памяти"),
         "has_integrated_graphics": fields.Boolean(description="Наличие встроенной графики"),
     },
 )
@@ -93,12 +262,12 @@ motherboard_input = components_ns.model(
 cpu_input = components_ns.model(
     "CPUInput",
     {
-        "brand_id": fields.Integer(required=True, description="ID бренда"),
-        "model": fields.String(required=True, description="Модель"),
-        "quantity": fields.Integer(required=True, description="Количество"),
-        "socket_type_id": fields.Integer(required=True, description="ID типа сокета"),
-        "cores": fields.Integer(required=True, description="Количество ядер"),
-        "threads": fields.Integer(required=True, description="Количество потоков"),
+        "brand_id": fields.Integer(required=True, min=1, description="ID бренда"),
+        "model": fields.String(required=True, min_length=1, max_length=MODEL_MAX_LENGTH, description="Модель"),
+        "quantity": fields.Integer(required=True, min=0, description="Количество"),
+        "socket_type_id": fields.Integer(required=True, min=1, description="ID типа сокета"),
+        "cores": fields.Integer(required=True, min=1, description="Количество ядер"),
+        "threads": fields.Integer(required=True, min=1, description="Количество потоков"),
         "has_integrated_graphics": fields.Boolean(description="Наличие встроенной графики"),
     },
 )
@@ -106,45 +275,180 @@ cpu_input = components_ns.model(
 gpu_input = components_ns.model(
     "GPUInput",
     {
-        "brand_id": fields.Integer(required=True, description="ID бренда"),
-        "model": fields.String(required=True, description="Модель"),
-        "quantity": fields.Integer(required=True, description="Количество"),
-        "vram": fields.Integer(required=True, description="Объем видеопамяти в ГБ"),
+        "brand_id": fields.Integer(required=True, min=1, description="ID бренда"),
+        "model": fields.String(required=True, min_length=1, max_length=MODEL_MAX_LENGTH, description="Модель"),
+        "quantity": fields.Integer(required=True, min=0, description="Количество"),
+        "vram": fields.Integer(required=True, min=1, description="Объем видеопамяти в ГБ"),
     },
 )
 
 ram_input = components_ns.model(
     "RAMInput",
     {
-        "brand_id": fields.Integer(required=True, description="ID бренда"),
-        "model": fields.String(required=True, description="Модель"),
-        "quantity": fields.Integer(required=True, description="Количество"),
-        "memory_type_id": fields.Integer(required=True, description="ID типа памяти"),
-        "capacity": fields.Integer(required=True, description="Объем в ГБ"),
-        "frequency": fields.Integer(required=True, description="Частота в МГц"),
+        "brand_id": fields.Integer(required=True, min=1, description="ID бренда"),
+        "model": fields.String(required=True, min_length=1, max_length=MODEL_MAX_LENGTH, description="Модель"),
+        "quantity": fields.Integer(required=True, min=0, description="Количество"),
+        "memory_type_id": fields.Integer(required=True, min=1, description="ID типа памяти"),
+        "capacity": fields.Integer(required=True, min=1, description="Объем в ГБ"),
+        "frequency": fields.Integer(required=True, min=1, description="Частота в МГц"),
     },
 )
 
 soundcard_input = components_ns.model(
     "SoundcardInput",
     {
-        "brand_id": fields.Integer(required=True, description="ID бренда"),
-        "model": fields.String(required=True, description="Модель"),
-        "quantity": fields.Integer(required=True, description="Количество"),
-        "channels_quantity": fields.Integer(required=True, description="Количество каналов"),
+        "brand_id": fields.Integer(required=True, min=1, description="ID бренда"),
+        "model": fields.String(required=True, min_length=1, max_length=MODEL_MAX_LENGTH, description="Модель"),
+        "quantity": fields.Integer(required=True, min=0, description="Количество"),
+        "channels_quantity": fields.Integer(required=True, min=1, description="Количество каналов"),
+    },
+)
+
+
+component_edit_input = components_ns.model(
+    "ComponentEditInput",
+    {
+        "brand_id": fields.Integer(min=1, description="ID бренда"),
+        "model": fields.String(min_length=1, max_length=MODEL_MAX_LENGTH, description="Модель"),
+        "quantity": fields.Integer(min=0, description="Количество"),
+        "socket_type_id": fields.Integer(min=1, description="ID типа сокета (материнская плата, процессор)"),
+        "memory_type_id": fields.Integer(min=1, description="ID типа памяти (материнская плата, ОЗУ)"),
+        "has_integrated_graphics": fields.Boolean(description="Наличие встроенной графики"),
+        "cores": fields.Integer(min=1, description="Количество ядер"),
+        "threads": fields.Integer(min=1, description="Количество потоков"),
+        "vram": fields.Integer(min=1, description="Объем видеопамяти в ГБ"),
+        "capacity": fields.Integer(min=1, description="Объем в ГБ"),
+        "frequency": fields.Integer(min=1, description="Частота в МГц"),
+        "channels_quantity": fields.Integer(min=1, description="Количество каналов"),
     },
 )
 
 
+def choices_to_dicts(choices):
+    return [{"id": choice_id, "name": name} for choice_id, name in choices]
+
+
+def component_form_choices(component_type):
+    choices = {"brands": choices_to_dicts(get_brand_choices_for(component_type))}
+    if "socket_type_id" in COMPONENT_FIELDS[component_type]:
+        choices["socket_types"] = choices_to_dicts(get_socket_type_choices())
+    if "memory_type_id" in COMPONENT_FIELDS[component_type]:
+        choices["memory_types"] = choices_to_dicts(get_memory_type_choices())
+    return choices
+
+
+def split_names(value):
+    return [name.strip() for name in (value or "").split(",") if name.strip()]
+
+
+def projection_args(args):
+    return split_names(args["fields"]), split_names(args["include"])
+
+
+def component_dicts(rows, include, hidden=()):
+    items = nest_includes(rows_to_dicts(rows, drop_none=True), include)
+    for item in items:
+        for key in hidden:
+            item.pop(key, None)
+    return items
+
+
+def add_component(component_type):
+    upsert = write_parser.parse_args()["upsert"]
+    with request_session() as session:
+        component_id, inserted = write_component(session, component_type, components_ns.payload, upsert)
+        return component_row(session, component_id), status_code["201" if inserted else "200"]
+
+
 @components_ns.route("/")
 class ComponentsListResource(Resource):
     @components_ns.doc("get_components")
     @components_ns.expect(components_parser)
-    @components_ns.marshal_list_with(base_component_model)
-    @components_ns.response(200, "Успешно")
+    @components_ns.response(200, "Успешно", components_page_model)
+    @components_ns.response(400, "Некорректный курсор или неизвестные поля")
+    def get(self):
+        """Получить страницу компонентов с возможностью фильтрации"""
+        args = components_parser.parse_args()
+        fields, include = projection_args(args)
+        sort_columns = component_sort_columns()
+        # The keyset cursor is read off the sort columns, select them even when they are not requested
+        hidden = [column.key for column in sort_columns if fields and column.key not in fields]
+
+        with request_session() as session:
+            query = filter_components(
+                component_projection(fields + hidden if fields else None, include),
+                component_type=args["component_type"],
+                brand_id=args["brand_id"],
+            )
+            query = filter_specs(query, {name: args[name] for name in SPEC_FILTERS})
+            query = search_components(query, args["q"])
+            try:
+                items, next_cursor = keyset_page(
+                    session,
+                    query,
+                    sort_columns,
+                    cursor=args["cursor"],
+                    limit=get_page_size(args["limit"]),
+                )
+            except InvalidCursorError:
+                components_ns.abort(status_code["400"], "Некорректный курсор")
+
+        return json_response({"items": component_dicts(items, include, hidden), "next_cursor": next_cursor})
+
+
+@components_ns.route("/search")
+class ComponentsSearchResource(Resource):
+    @components_ns.doc("search_components")
+    @components_ns.expect(search_parser)
+    @components_ns.response(200, "Успешно", [search_result_model])
     def get(self):
-        """Получить список всех компонентов с возможностью фильтрации"""
-        pass
+        """Найти компоненты по части названия модели или бренда, лучшие совпадения первыми"""
+        args = search_parser.parse_args()
+        with request_session() as session:
+            rows = session.execute(ranked_search(args["q"], get_page_size(args["limit"]))).all()
+        return json_response(rows_to_dicts(rows))
+
+
+@components_ns.route("/autocomplete")
+class ComponentsAutocompleteResource(Resource):
+    @components_ns.doc("autocomplete_components")
+    @components_ns.expect(autocomplete_parser)
+    @components_ns.response(200, "Успешно", [search_result_model])
+    def get(self):
+        """Подсказки моделей по началу названия модели или бренда"""
+        args = autocomplete_parser.parse_args()
+        with request_session() as session:
+            index = get_autocomplete_index(session)
+        return json_response(index.complete(args["prefix"], get_page_size(args["limit"]), args["component_type"]))
+
+
+@components_ns.route("/facets")
+class ComponentsFacetsResource(Resource):
+    @components_ns.doc("get_component_facets")
+    @components_ns.expect(facets_parser)
+    @components_ns.response(200, "Количество компонентов по типам, брендам, сокетам и типам памяти")
+    def get(self):
+        """Получить количество компонентов для фильтров каталога"""
+        args = facets_parser.parse_args()
+        with request_session() as session:
+            return json_response(facet_counts(session, args["component_type"]))
+
+
+@components_ns.route("/import")
+class ComponentsImportResource(Resource):
+    @components_ns.doc("import_components")
+    @components_ns.expect(import_parser)
+    @components_ns.response(200, "Отчет об импорте", import_report_model)
+    @components_ns.response(400, "Неизвестный формат")
+    def post(self):
+        """Импортировать компоненты любых типов из CSV или NDJSON"""
+        args = import_parser.parse_args()
+        upload = args["file"].stream if args["file"] else request.stream
+        stream = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+
+        with request_session() as session:
+            report = bulk_import_components(session, stream, args["format"], args["upsert"])
+        return json_response(report.to_dict())
 
 
 @components_ns.route("/add")
@@ -153,7 +457,7 @@ class ComponentsAddResource(Resource):
     @components_ns.response(200, "Страница добавления компонента")
     def get(self):
         """Получить страницу выбора типа компонента для добавления"""
-        pass
+        return {"component_types": list(COMPONENT_MODELS)}
 
 
 @components_ns.route("/add/motherboard")
@@ -162,17 +466,18 @@ class MotherboardAddResource(Resource):
     @components_ns.response(200, "Форма добавления материнской платы")
     def get(self):
         """Получить форму для добавления материнской платы"""
-        pass
+        return component_form_choices("motherboard")
 
     @components_ns.doc("add_motherboard")
-    @components_ns.expect(motherboard_input)
+    @components_ns.expect(motherboard_input, write_parser, validate=True)
     @components_ns.marshal_with(motherboard_model, code=status_code["201"])
     @components_ns.response(201, "Материнская плата успешно добавлена")
+    @components_ns.response(200, "Компонент обновлен (upsert)")
+    @components_ns.response(409, "Компонент уже существует")
     @components_ns.response(400, "Ошибка валидации")
-    @components_ns.response(409, "Конфликт - компонент уже существует")
     def post(self):
         """Добавить новую материнскую плату"""
-        pass
+        return add_component("motherboard")
 
 
 @components_ns.route("/add/cpu")
@@ -181,16 +486,18 @@ class CPUAddResource(Resource):
     @components_ns.response(200, "Форма добавления процессора")
     def get(self):
         """Получить форму для добавления процессора"""
-        pass
+        return component_form_choices("cpu")
 
     @components_ns.doc("add_cpu")
-    @components_ns.expect(cpu_input)
+    @components_ns.expect(cpu_input, write_parser, validate=True)
     @components_ns.marshal_with(cpu_model, code=status_code["201"])
     @components_ns.response(201, "Процессор успешно добавлен")
+    @components_ns.response(200, "Компонент обновлен (upsert)")
+    @components_ns.response(409, "Компонент уже существует")
     @components_ns.response(400, "Ошибка валидации")
     def post(self):
         """Добавить новый процессор"""
-        pass
+        return add_component("cpu")
 
 
 @components_ns.route("/add/gpu")
@@ -199,16 +506,18 @@ class GPUAddResource(Resource):
     @components_ns.response(200, "Форма добавления видеокарты")
     def get(self):
         """Получить форму для добавления видеокарты"""
-        pass
+        return component_form_choices("gpu")
 
     @components_ns.doc("add_gpu")
-    @components_ns.expect(gpu_input)
+    @components_ns.expect(gpu_input, write_parser, validate=True)
     @components_ns.marshal_with(gpu_model, code=status_code["201"])
     @components_ns.response(201, "Видеокарта успешно добавлена")
+    @components_ns.response(200, "Компонент обновлен (upsert)")
+    @components_ns.response(409, "Компонент уже существует")
     @components_ns.response(400, "Ошибка валидации")
     def post(self):
         """Добавить новую видеокарту"""
-        pass
+        return add_component("gpu")
 
 
 @components_ns.route("/add/ram")
@@ -217,16 +526,18 @@ class RAMAddResource(Resource):
     @components_ns.response(200, "Форма добавления оперативной памяти")
     def get(self):
         """Получить форму для добавления оперативной памяти"""
-        pass
+        return component_form_choices("ram")
 
     @components_ns.doc("add_ram")
-    @components_ns.expect(ram_input)
+    @components_ns.expect(ram_input, write_parser, validate=True)
     @components_ns.marshal_with(ram_model, code=status_code["201"])
     @components_ns.response(201, "Оперативная память успешно добавлена")
+    @components_ns.response(200, "Компонент обновлен (upsert)")
+    @components_ns.response(409, "Компонент уже существует")
     @components_ns.response(400, "Ошибка валидации")
     def post(self):
         """Добавить новую оперативную память"""
-        pass
+        return add_component("ram")
 
 
 @components_ns.route("/add/soundcard")
@@ -235,27 +546,63 @@ class SoundcardAddResource(Resource):
     @components_ns.response(200, "Форма добавления звуковой карты")
     def get(self):
         """Получить форму для добавления звуковой карты"""
-        pass
+        return component_form_choices("soundcard")
 
     @components_ns.doc("add_soundcard")
-    @components_ns.expect(soundcard_input)
+    @components_ns.expect(soundcard_input, write_parser, validate=True)
     @components_ns.marshal_with(soundcard_model, code=status_code["201"])
     @components_ns.response(201, "Звуковая карта успешно добавлена")
+    @components_ns.response(200, "Компонент обновлен (upsert)")
+    @components_ns.response(409, "Компонент уже существует")
     @components_ns.response(400, "Ошибка валидации")
     def post(self):
         """Добавить новую звуковую карту"""
-        pass
+        return add_component("soundcard")
 
 
 @components_ns.route("/<int:component_id>")
 class ComponentResource(Resource):
     @components_ns.doc("get_component")
-    @components_ns.marshal_with(base_component_model)
-    @components_ns.response(200, "Успешно")
+    @components_ns.expect(projection_parser)
+    @components_ns.response(200, "Успешно", base_component_model)
+    @components_ns.response(400, "Неизвестные поля")
     @components_ns.response(404, "Компонент не найден")
     def get(self, component_id):
         """Получить информацию о компоненте по ID"""
-        pass
+        fields, include = projection_args(projection_parser.parse_args())
+
+        with request_session() as session:
+            query = component_projection(fields or None, include).where(components.c.id == component_id)
+            row = session.execute(query).first()
+
+        if row is None:
+            raise NotFoundError(f"Component {component_id} not found")
+        return json_response(component_dicts([row], include)[0])
+
+
+@components_ns.route("/<int:component_id>/compatible")
+class ComponentCompatibleResource(Resource):
+    @components_ns.doc("get_compatible_components")
+    @components_ns.expect(compatible_parser)
+    @components_ns.marshal_with(compatible_components_model)
+    @components_ns.response(200, "Успешно")
+    @components_ns.response(400, "Для этих типов компонентов нет правил совместимости")
+    @components_ns.response(404, "Компонент не найден")
+    def get(self, component_id):
+        """Получить ID компонентов заданного типа, совместимых с выбранным компонентом"""
+        args = compatible_parser.parse_args()
+
+        with request_session() as session:
+            index = get_compatibility_index(session)
+
+        try:
+            ids = index.compatible(component_id, args["component_type"])
+        except ValueError:
+            components_ns.abort(status_code["400"], "Для этих типов компонентов нет правил совместимости")
+        if ids is None:
+            components_ns.abort(status_code["404"], "Компонент не найден")
+
+        return {"component_id": component_id, "component_type": args["component_type"], "ids": ids}
 
 
 @components_ns.route("/<int:component_id>/edit")
@@ -265,15 +612,21 @@ class ComponentEditResource(Resource):
     @components_ns.response(404, "Компонент не найден")
     def get(self, component_id):
         """Получить форму для редактирования компонента"""
-        pass
+        with request_session() as session:
+            row = component_row(session, component_id)
+        return json_response({"component": row_to_dict(row), "choices": component_form_choices(row.component_type)})
 
     @components_ns.doc("edit_component")
+    @components_ns.expect(component_edit_input, validate=True)
     @components_ns.response(200, "Компонент успешно обновлен")
     @components_ns.response(400, "Ошибка валидации")
     @components_ns.response(404, "Компонент не найден")
+    @components_ns.response(409, "Компонент с такой моделью уже существует")
     def post(self, component_id):
         """Обновить информацию о компоненте"""
-        pass
+        with request_session() as session:
+            update_component(session, component_id, components_ns.payload or {})
+            return json_response(row_to_dict(component_row(session, component_id)))
 
 
 @components_ns.route("/<int:component_id>/delete")
@@ -284,4 +637,6 @@ class ComponentDeleteResource(Resource):
     @components_ns.response(409, "Невозможно удалить - компонент используется в сборках")
     def post(self, component_id):
         """Удалить компонент"""
-        pass
+        with request_session() as session:
+            delete_component(session, component_id)
+        return {"message": "Компонент успешно удален"}
@@ -0,0 +1,64 @@
+import json
+from datetime import date, datetime
+from http import HTTPStatus
+
+from flask import Response
+
+from app.services import ConflictError, IncompatibleBuildError, NotFoundError
+
+
+def json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def json_response(data, status=HTTPStatus.OK):
+    """Serialize `data` straight to compact JSON, without flask-restx marshalling."""
+    body = json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=json_default)
+    return Response(body, status=status, mimetype="application/json")
+
+
+def rows_to_dicts(rows, drop_none=False):
+    """Plain dicts of result rows; the column names are looked up once for the whole list."""
+    if not rows:
+        return []
+
+    keys = rows[0]._fields
+    if drop_none:
+        return [{key: value for key, value in zip(keys, row) if value is not None} for row in rows]
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def nest_includes(items, include):
+    """Fold the `<include>__<column>` keys of `component_projection()` rows into embedded objects."""
+    prefixes = [(name, f"{name}__") for name in include]
+    for item in items:
+        for name, prefix in prefixes:
+            keys = [key for key in item if key.startswith(prefix)]
+            embedded = {key[len(prefix) :]: item.pop(key) for key in keys}
+            if embedded:
+                item[name] = embedded
+    return items
+
+
+def row_to_dict(row):
+    return rows_to_dicts([row], drop_none=True)[0]
+
+
+def register_error_handlers(ns):
+    @ns.errorhandler(NotFoundError)
+    def handle_not_found(error):
+        return {"message": str(error)}, HTTPStatus.NOT_FOUND
+
+    @ns.errorhandler(ConflictError)
+    def handle_conflict(error):
+        return {"message": str(error)}, HTTPStatus.CONFLICT
+
+    @ns.errorhandler(IncompatibleBuildError)
+    def handle_incompatible(error):
+        return {"message": str(error), "errors": error.errors}, HTTPStatus.BAD_REQUEST
+
+    @ns.errorhandler(ValueError)
+    def handle_invalid(error):
+        return {"message": str(error)}, HTTPStatus.BAD_REQUEST
@@ -0,0 +1,190 @@
+import heapq
+from collections import namedtuple
+
+from sqlalchemy import select
+
+from app.models import Brand
+from app.queries import (
+    component_rows_query,
+    components,
+    cpus,
+    filter_components,
+    gpus,
+    rams,
+)
+
+BuildPart = namedtuple("BuildPart", "score row")
+
+# Per component type score of a candidate, higher is better. A build scores the sum of its parts, which
+# is what lets the generator walk builds in rank order without materializing combinations.
+RANKINGS = {
+    "cores": {"cpu": lambda row: row.cores},
+    "threads": {"cpu": lambda row: row.threads},
+    "vram": {"gpu": lambda row: row.vram},
+    "capacity": {"ram": lambda row: row.capacity},
+    "frequency": {"ram": lambda row: row.frequency},
+    "stock": {component_type: lambda row: row.quantity for component_type in ("motherboard", "cpu", "gpu", "ram")},
+}
+# "balanced" normalizes threads, VRAM and RAM capacity against the best candidate of each type
+BALANCED = {"cpu": "threads", "gpu": "vram", "ram": "capacity"}
+RANK_CHOICES = ["balanced", *RANKINGS]
+
+
+def load_candidates(session, component_type, conditions, brand_ids, in_stock):
+    query = filter_components(component_rows_query(), component_type=component_type).where(*conditions)
+
+    if brand_ids:
+        type_brand_ids = session.scalars(
+            select(Brand.id).where(Brand.id.in_(brand_ids), Brand.component_type == component_type)
+        ).all()
+        # Preferred brands only narrow down the component types they belong to
+        if type_brand_ids:
+            query = query.where(components.c.brand_id.in_(type_brand_ids))
+
+    if in_stock:
+        query = query.where(components.c.quantity > 0)
+
+    return session.execute(query.order_by(components.c.id)).all()
+
+
+def score_parts(candidates, rank):
+    if rank == "balanced":
+        scorers = {}
+        for component_type, attribute in BALANCED.items():
+            best = max((getattr(row, attribute) or 0 for row in candidates.get(component_type, [])), default=0) or 1
+            scorers[component_type] = lambda row, attribute=attribute, best=best: (getattr(row, attribute) or 0) / best
+    else:
+        scorers = RANKINGS[rank]
+
+    parts = {}
+    for component_type, rows in candidates.items():
+        scorer = scorers.get(component_type, lambda row: 0)
+        parts[component_type] = sorted((BuildPart(scorer(row), row) for row in rows), key=lambda part: -part.score)
+    return parts
+
+
+def group_slots(parts, with_gpu, with_soundcard):
+    """
+    Split the search space into independent groups of per-slot candidate lists.
+
+    Motherboards are grouped by socket and memory type, so CPUs and RAM are only ever paired with boards
+    they fit. Without a discrete GPU the build needs integrated graphics, so boards without it only get
+    CPUs that have it.
+    """
+    cpus_by_socket, rams_by_memory_type = {}, {}
+    for part in parts["cpu"]:
+        cpus_by_socket.setdefault(part.row.socket_type, []).append(part)
+    for part in parts["ram"]:
+        rams_by_memory_type.setdefault(part.row.memory_type, []).append(part)
+
+    boards = {}
+    for part in parts["motherboard"]:
+        integrated = bool(part.row.has_integrated_graphics) and not with_gpu
+        boards.setdefault((part.row.socket_type, part.row.memory_type, integrated), []).append(part)
+
+    extra_slots = []
+    if with_gpu:
+        extra_slots.append(("gpu", parts["gpu"]))
+    if with_soundcard:
+        extra_slots.append(("soundcard", parts["soundcard"]))
+
+    groups = []
+    for (socket_type, memory_type, integrated), motherboards in boards.items():
+        cpu_parts = cpus_by_socket.get(socket_type, [])
+        if not with_gpu and not integrated:
+            cpu_parts = [part for part in cpu_parts if part.row.has_integrated_graphics]
+
+        slots = [
+            ("motherboard", motherboards),
+            ("cpu", cpu_parts),
+            ("ram", rams_by_memory_type.get(memory_type, [])),
+            *extra_slots,
+        ]
+        if all(candidates for _, candidates in slots):
+            groups.append(slots)
+    return groups
+
+
+def ranked_combinations(groups):
+    """
+    Yield `(score, {slot: part})` in descending score order across all groups.
+
+    Every slot list is sorted by score, so the best unseen build is always a neighbour (one slot moved one
+    position down) of a build already yielded. Only that frontier is kept in a heap, so the first builds
+    come out immediately even when the full cross product is astronomically large.
+    """
+    heap, seen = [], set()
+
+    def push(group_index, positions):
+        if (group_index, positions) in seen:
+            return
+        seen.add((group_index, positions))
+        slots = groups[group_index]
+        score = sum(slots[slot][1][position].score for slot, position in enumerate(positions))
+        heapq.heappush(heap, (-score, group_index, positions))
+
+    for group_index, slots in enumerate(groups):
+        push(group_index, (0,) * len(slots))
+
+    while heap:
+        score, group_index, positions = heapq.heappop(heap)
+        slots = groups[group_index]
+        yield -score, {name: candidates[position] for (name, candidates), position in zip(slots, positions)}
+
+        for slot, position in enumerate(positions):
+            if position + 1 < len(slots[slot][1]):
+                push(group_index, (*positions[:slot], position + 1, *positions[slot + 1 :]))
+
+
+def generate_builds(
+    session,
+    min_cores=None,
+    min_threads=None,
+    min_vram=None,
+    min_capacity=None,
+    min_frequency=None,
+    brand_ids=(),
+    in_stock=False,
+    with_gpu=True,
+    with_soundcard=True,
+    rank="balanced",
+):
+    """
+    Search compatible builds (motherboard + CPU + RAM + optional GPU and soundcard) under the given constraints.
+
+    Numeric constraints and brand/stock filters are applied in SQL while loading candidates; the returned
+    generator then lazily yields `(score, {component_type: row})` best first and no longer needs `session`.
+    """
+    if rank not in RANK_CHOICES:
+        raise ValueError(f"Unknown ranking {rank!r}, expected one of {', '.join(RANK_CHOICES)}")
+
+    conditions = {
+        "motherboard": [],
+        "cpu": [
+            cpus.c.cores >= min_cores if min_cores else None,
+            cpus.c.threads >= min_threads if min_threads else None,
+        ],
+        "gpu": [gpus.c.vram >= min_vram if min_vram else None],
+        "ram": [
+            rams.c.capacity >= min_capacity if min_capacity else None,
+            rams.c.frequency >= min_frequency if min_frequency else None,
+        ],
+        "soundcard": [],
+    }
+    candidates = {
+        component_type: load_candidates(
+            session,
+            component_type,
+            [condition for condition in type_conditions if condition is not None],
+            brand_ids,
+            in_stock,
+        )
+        for component_type, type_conditions in conditions.items()
+        if (component_type != "gpu" or with_gpu) and (component_type != "soundcard" or with_soundcard)
+    }
+
+    groups = group_slots(score_parts(candidates, rank), with_gpu, with_soundcard)
+    return (
+        (score, {component_type: part.row for component_type, part in build.items()})
+        for score, build in ranked_combinations(groups)
+    )
@@ -0,0 +1,54 @@
+import threading
+
+# Invalidation scopes, kept in sync with the triggers in the cache_versions migration
+CLASSIFICATORS = "classificators"
+COMPONENTS = "components"
+ASSEMBLIES = "assemblies"
+
+
+class VersionedCache:
+    """
+    In-process cache for values derived from rarely changing tables.
+
+    Every entry is stored together with the versions of the scopes it was built from; bumping a scope
+    makes all entries that depend on it stale, and they are rebuilt on the next read.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions = {}
+        self._entries = {}
+        self._local = threading.local()
+
+    @property
+    def building(self):
+        """Whether the current thread is running a builder."""
+        return getattr(self._local, "depth", 0) > 0
+
+    def version(self, *scopes):
+        return tuple(self._versions.get(scope, 0) for scope in scopes)
+
+    def get(self, key, builder, scopes):
+        version = self.version(*scopes)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        self._local.depth = getattr(self._local, "depth", 0) + 1
+        try:
+            value = builder()
+        finally:
+            self._local.depth -= 1
+        with self._lock:
+            # A bump that happened while building means the value may already be stale
+            if self.version(*scopes) == version:
+                self._entries[key] = (version, value)
+        return value
+
+    def bump(self, *scopes):
+        with self._lock:
+            for scope in scopes:
+                self._versions[scope] = self._versions.get(scope, 0) + 1
+
+
+catalog_cache = VersionedCache()
@@ -0,0 +1,76 @@
+import json
+import time
+
+import click
+from loguru import logger
+
+from app.database import maintenance_engine
+from app.database_data import (
+    COMPONENT_SECTIONS,
+    fixture_fingerprint,
+    load_fixture,
+    seed_data,
+)
+from app.datagen import generate_catalog
+from app.facets import rebuild_facet_counts
+from app.query_plans import check_query_plans
+
+
+def init_commands(app):
+    @app.cli.command("load-fixture")
+    @click.argument("path", type=click.Path(exists=True, dir_okay=False))
+    @click.option("--force", is_flag=True, help="Load even if the fixture fingerprint is already recorded.")
+    def load_fixture_command(path, force):
+        """Bulk-load a JSON fixture (same format as app/fixtures/seed.json)."""
+        started = time.perf_counter()
+        if not seed_data(path, force=force):
+            raise click.ClickException(f"Fixture {fixture_fingerprint(path)[:12]} was not loaded, see log.")
+        logger.info(f"Loaded {path} in {time.perf_counter() - started:.2f}s")
+
+    @app.cli.command("generate-catalog")
+    @click.option("--scale", type=float, default=1.0, show_default=True, help="Multiplier of the shipped seed size.")
+    @click.option("--seed", type=int, default=0, show_default=True, help="Random seed.")
+    @click.option("--output", type=click.Path(dir_okay=False, writable=True), help="Write the fixture to a file.")
+    @click.option("--load", is_flag=True, help="Load the generated catalog into the database.")
+    def generate_catalog_command(scale, seed, output, load):
+        """Generate a deterministic synthetic catalog with compatible assemblies."""
+        if not output and not load:
+            raise click.UsageError("Pass --output and/or --load.")
+
+        started = time.perf_counter()
+        fixture = generate_catalog(scale, seed)
+        components = sum(len(fixture[section]) for section in COMPONENT_SECTIONS)
+        logger.info(
+            f"Generated {components} components and {len(fixture['assemblies'])} assemblies "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+
+        if output:
+            with open(output, "w", encoding="utf-8") as f:
+                json.dump(fixture, f, ensure_ascii=False)
+
+        if load:
+            started = time.perf_counter()
+            with maintenance_engine.begin() as connection:
+                counts = load_fixture(connection, fixture)
+            logger.info(f"Loaded {counts} in {time.perf_counter() - started:.2f}s")
+
+    @app.cli.command("check-query-plans")
+    def check_query_plans_command():
+        """Verify that the hot catalog queries are served by their indexes."""
+        with maintenance_engine.connect() as connection:
+            results = check_query_plans(connection)
+
+        for description, expected, used, ok in results:
+            click.echo(f"{'OK  ' if ok else 'FAIL'} {description}: expected {expected}, used {sorted(used) or 'none'}")
+
+        if not all(ok for *_, ok in results):
+            raise click.ClickException("Some queries do not use their indexes.")
+
+    @app.cli.command("rebuild-facet-counts")
+    def rebuild_facet_counts_command():
+        """Recompute the catalog facet counts rollup from the component tables."""
+        started = time.perf_counter()
+        with maintenance_engine.begin() as connection:
+            rebuild_facet_counts(connection)
+        logger.info(f"Rebuilt facet counts in {time.perf_counter() - started:.2f}s")
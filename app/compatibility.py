@@ -0,0 +1,266 @@
+import hashlib
+import json
+import threading
+from typing import NamedTuple
+
+from sqlalchemy import func, select, union_all
+
+from app.cache import COMPONENTS, catalog_cache
+from app.database import READ_PRIMARY
+from app.models import CPU, GPU, RAM, Component, Motherboard, Soundcard
+
+COMPONENT_TABLES = {
+    "motherboard": Motherboard.__table__,
+    "cpu": CPU.__table__,
+    "gpu": GPU.__table__,
+    "ram": RAM.__table__,
+    "soundcard": Soundcard.__table__,
+}
+
+
+class Rule(NamedTuple):
+    """Components in the `left` and `right` slots of a build must have equal `attribute` values."""
+
+    name: str
+    left: str
+    right: str
+    attribute: str
+    message: str
+
+
+class CompatibilityPayload(NamedTuple):
+    body: bytes
+    etag: str
+
+
+class Violation(NamedTuple):
+    rule: str
+    message: str
+
+
+RULES: list[Rule] = []
+
+
+def register_rule(name, left, right, attribute, message):
+    if any(rule.name == name for rule in RULES):
+        raise ValueError(f"Compatibility rule {name!r} is already registered")
+
+    for component_type in (left, right):
+        if attribute not in COMPONENT_TABLES[component_type].c:
+            raise ValueError(f"{component_type} has no attribute {attribute!r}")
+
+    rule = Rule(name, left, right, attribute, message)
+    RULES.append(rule)
+    return rule
+
+
+register_rule(
+    "cpu_socket",
+    "cpu",
+    "motherboard",
+    "socket_type_id",
+    "❌ CPU and Motherboard have incompatible sockets.",
+)
+register_rule(
+    "ram_memory_type",
+    "ram",
+    "motherboard",
+    "memory_type_id",
+    "❌ RAM and Motherboard have incompatible memory types.",
+)
+
+
+def rule_attributes(rules=None):
+    return sorted({rule.attribute for rule in rules or RULES})
+
+
+def component_attributes_query(rules=None):
+    """Select `(id, component_type, <rule attributes>)` with attributes coalesced across the per-type tables."""
+    components = Component.__table__
+    columns, tables = [], set()
+    for attribute in rule_attributes(rules):
+        sources = [table for table in COMPONENT_TABLES.values() if attribute in table.c]
+        tables.update(sources)
+        columns.append(func.coalesce(*(table.c[attribute] for table in sources)).label(attribute))
+
+    query = select(components.c.id, components.c.component_type, *columns).select_from(components)
+    for table in sorted(tables, key=lambda table: table.name):
+        query = query.outerjoin(table, table.c.id == components.c.id)
+    return query
+
+
+def load_components(session, component_ids, rules=None):
+    """Load `id -> row(id, component_type, <rule attributes>)` for all ids in a single query."""
+    component_ids = {component_id for component_id in component_ids if component_id}
+    if not component_ids:
+        return {}
+
+    query = component_attributes_query(rules).where(Component.__table__.c.id.in_(component_ids))
+    return {row.id: row for row in session.execute(query)}
+
+
+def evaluate_many(session, builds, rules=None):
+    """
+    Check many builds at once; a build maps a component type to a component id.
+
+    All referenced components are loaded in one query and every rule is applied to all builds in one
+    pass. Returns a list of violations per build, in the order of `builds`.
+    """
+    rules = rules or RULES
+    components = load_components(session, (cid for build in builds for cid in build.values()), rules)
+
+    violations = [[] for _ in builds]
+    for rule in rules:
+        for index, build in enumerate(builds):
+            left = components.get(build.get(rule.left))
+            right = components.get(build.get(rule.right))
+            if left is None or right is None:
+                continue
+            if getattr(left, rule.attribute) != getattr(right, rule.attribute):
+                violations[index].append(Violation(rule.name, rule.message))
+    return violations
+
+
+def evaluate(session, build, rules=None):
+    return evaluate_many(session, [build], rules)[0]
+
+
+class CompatibilityIndex:
+    """
+    In-memory answer to "which components of type X fit component Y".
+
+    Components of every type that takes part in a rule are grouped by `(type, attribute, value)`, so a
+    lookup is one set intersection per applicable rule. The index is stamped with the 'components'
+    cache version it reflects: local writes are applied incrementally with `refresh()`, any other change
+    of the version (e.g. a write in another worker) makes the next `get_compatibility_index()` rebuild it.
+    """
+
+    def __init__(self, rules=None):
+        self.rules = rules or RULES
+        self.component_types = sorted({rule.left for rule in self.rules} | {rule.right for rule in self.rules})
+        self.version = None
+        self._components = {}
+        self._groups = {}
+        self._lock = threading.Lock()
+
+    def _load(self, session, where):
+        query = component_attributes_query(self.rules).where(where)
+        # The index is stamped with the primary's 'components' version, so it must reflect the primary
+        return session.execute(query, bind_arguments=READ_PRIMARY).all()
+
+    def _add(self, row):
+        attributes = {attribute: getattr(row, attribute) for attribute in rule_attributes(self.rules)}
+        self._components[row.id] = (row.component_type, attributes)
+        for attribute, value in attributes.items():
+            if value is not None:
+                self._groups.setdefault((row.component_type, attribute, value), set()).add(row.id)
+
+    def _discard(self, component_id):
+        component = self._components.pop(component_id, None)
+        if component is None:
+            return
+        component_type, attributes = component
+        for attribute, value in attributes.items():
+            self._groups.get((component_type, attribute, value), set()).discard(component_id)
+
+    def rebuild(self, session, version):
+        rows = self._load(session, Component.__table__.c.component_type.in_(self.component_types))
+        with self._lock:
+            self._components, self._groups = {}, {}
+            for row in rows:
+                self._add(row)
+            self.version = version
+
+    def refresh(self, session, component_ids, version):
+        component_ids = set(component_ids)
+        with self._lock:
+            # Only a single bump (the caller's own write) may separate the index from the current version
+            if self.version is None or self.version[0] + 1 != version[0]:
+                return
+
+            rows = self._load(session, Component.__table__.c.id.in_(component_ids))
+            for component_id in component_ids:
+                self._discard(component_id)
+            for row in rows:
+                if row.component_type in self.component_types:
+                    self._add(row)
+            self.version = version
+
+    def groups(self):
+        """`attribute -> value -> component_type -> sorted ids`, the index in a JSON-friendly shape."""
+        with self._lock:
+            groups = {}
+            for (component_type, attribute, value), ids in sorted(self._groups.items()):
+                if ids:
+                    groups.setdefault(attribute, {}).setdefault(str(value), {})[component_type] = sorted(ids)
+            return groups
+
+    def compatible(self, component_id, component_type):
+        """
+        Sorted ids of `component_type` compatible with `component_id`.
+
+        Returns None for unknown components and raises ValueError when no rule relates the two types.
+        """
+        with self._lock:
+            component = self._components.get(component_id)
+            if component is None:
+                return None
+
+            source_type, attributes = component
+            rules = [rule for rule in self.rules if {rule.left, rule.right} == {source_type, component_type}]
+            if not rules:
+                raise ValueError(f"No compatibility rules between {source_type} and {component_type}")
+
+            candidates = None
+            for rule in rules:
+                group = self._groups.get((component_type, rule.attribute, attributes[rule.attribute]), set())
+                candidates = group if candidates is None else candidates & group
+            return sorted(candidates)
+
+
+compatibility_index = CompatibilityIndex()
+
+
+def get_compatibility_index(session):
+    version = catalog_cache.version(COMPONENTS)
+    if compatibility_index.version != version:
+        compatibility_index.rebuild(session, version)
+    return compatibility_index
+
+
+def refresh_compatibility_index(session, component_ids):
+    """Apply a local component write to the index; call after committing it and bumping 'components'."""
+    compatibility_index.refresh(session, component_ids, catalog_cache.version(COMPONENTS))
+
+
+def integrated_graphics_ids(session):
+    sources = [table for table in COMPONENT_TABLES.values() if "has_integrated_graphics" in table.c]
+    query = union_all(*(select(table.c.id).where(table.c.has_integrated_graphics.is_(True)) for table in sources))
+    return sorted(session.scalars(query))
+
+
+def build_compatibility_payload(session):
+    index = get_compatibility_index(session)
+    document = {
+        "rules": [
+            {"name": rule.name, "left": rule.left, "right": rule.right, "attribute": rule.attribute}
+            for rule in index.rules
+        ],
+        "groups": index.groups(),
+        "integrated_graphics": integrated_graphics_ids(session),
+    }
+    body = json.dumps(document, separators=(",", ":")).encode()
+    return CompatibilityPayload(body, hashlib.sha256(body).hexdigest()[:32])
+
+
+def get_compatibility_payload(session):
+    """
+    Compact JSON of the compatibility groups and iGPU flags for client-side filtering of the assembly form.
+
+    The serialized body and its content hash (used as a strong ETag) are built once per catalog version.
+    """
+    return catalog_cache.get(
+        "compatibility_payload",
+        lambda: build_compatibility_payload(session),
+        scopes=(COMPONENTS,),
+    )
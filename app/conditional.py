@@ -0,0 +1,77 @@
+import hashlib
+import time
+from functools import wraps
+
+from flask import current_app, make_response, request, session
+from sqlalchemy import select
+
+from app.database import request_session
+from app.models import CacheVersion
+
+
+def scope_versions(scopes):
+    """Versions of the scopes, as counted by the cache_versions triggers."""
+    with request_session() as db_session:
+        rows = db_session.execute(
+            select(CacheVersion.scope, CacheVersion.version).where(CacheVersion.scope.in_(scopes))
+        ).all()
+
+    versions = {row.scope: row.version for row in rows}
+    return [versions.get(scope, 0) for scope in scopes]
+
+
+def page_validators(versions):
+    """
+    ETag of a page rendered from data at `versions`.
+
+    Pages embed a CSRF token, so the ETag also depends on the session's token and on a time bucket of half
+    the token lifetime: a revalidated copy never carries a token that is about to expire. No Last-Modified
+    is sent, as a date cannot tell one session's token from another's.
+    """
+    token = session.get(current_app.config.get("WTF_CSRF_FIELD_NAME", "csrf_token"))
+    time_limit = current_app.config.get("WTF_CSRF_TIME_LIMIT", 3600)
+    bucket = int(time.time() // (time_limit / 2)) if time_limit else 0
+    return hashlib.sha256(f"{request.full_path}:{versions}:{token}:{bucket}".encode()).hexdigest()[:32]
+
+
+def set_validators(response, etag):
+    response.set_etag(etag, weak=True)
+    # Browsers may keep the page, but have to revalidate it on every use
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def not_modified(etag):
+    # If-Modified-Since is ignored: these pages are validated by their ETag only
+    return bool(request.if_none_match) and request.if_none_match.contains_weak(etag)
+
+
+def conditional_page(*scopes):
+    """
+    Answer GETs of a page with `304 Not Modified` while none of the cache `scopes` it renders changed.
+
+    Validation costs one primary key lookup in `cache_versions`, made before the view runs. Pages with
+    pending flash messages are always rendered and never get validators, since the messages are one-off.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method not in ("GET", "HEAD") or "_flashes" in session:
+                return view(*args, **kwargs)
+
+            versions = scope_versions(scopes)
+            etag = page_validators(versions)
+            if not_modified(etag):
+                return set_validators(current_app.response_class(status=304), etag)
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                # Rendering may have issued the session's first CSRF token
+                set_validators(response, page_validators(versions))
+            return response
+
+        return wrapper
+
+    return decorator
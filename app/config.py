@@ -0,0 +1,41 @@
+from typing import Literal
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    database_url: str | None = None
+    # Read replicas for GET requests, as a JSON list: DATABASE_REPLICA_URLS='["postgresql://...", ...]'
+    database_replica_urls: list[str] = []
+    # Replicas lagging behind the primary by more than replica_max_lag seconds are not read from. A replica
+    # within replica_max_gap bytes of the primary's WAL position counts as current.
+    replica_max_lag: float = 5.0
+    replica_max_gap: int = 16 * 1024 * 1024
+    replica_check_interval: float = 2.0
+
+    # migrate - apply pending Alembic revisions and seed once per fixture fingerprint
+    # reset   - drop the public schema and rebuild it from scratch (local development only)
+    # skip    - do not touch the database on startup
+    startup_mode: Literal["migrate", "reset", "skip"] = "migrate"
+    seed_on_startup: bool = True
+    seed_fixture_path: str | None = None
+
+    # Connection pool of the web process, see sqlalchemy.create_engine() for the meaning of each value
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    # statement_timeout of pooled connections in milliseconds, 0 disables it.
+    # Migrations, seeding and CLI commands use unpooled connections without it.
+    db_statement_timeout: int = 30000
+
+    metrics_enabled: bool = True
+
+    cache_listener_enabled: bool = True
+    cache_poll_interval: float = 5.0
+
+
+settings = Settings()
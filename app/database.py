@@ -1,19 +1,143 @@
-import os
+import time
+from contextlib import contextmanager
 
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from flask import g, has_app_context, has_request_context, request
+from flask import session as client_session
+from loguru import logger
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import NullPool
+from sqlalchemy.sql.dml import UpdateBase
 
+from app.cache import catalog_cache
+from app.config import settings
+from app.metrics import InstrumentedQueuePool, instrument_statements
+from app.replicas import ReplicaSet
 
-database_url = os.getenv("DATABASE_URL")
+READ_METHODS = ("GET", "HEAD")
+# Flask session key holding the time of the client's last write
+LAST_WRITE_KEY = "db_last_write"
+# bind_arguments of reads that must see the primary even in a request routed to a replica
+READ_PRIMARY = {"primary": True}
 
-engine = create_engine(
-    url=database_url,
-    echo=False,
-    pool_size=5,
-    max_overflow=10,
+
+def connect_args():
+    if not settings.db_statement_timeout:
+        return {}
+    return {"options": f"-c statement_timeout={settings.db_statement_timeout}"}
+
+
+def count_statements(conn, cursor, statement, parameters, context, executemany):
+    if has_app_context():
+        g.sql_statements = g.get("sql_statements", 0) + 1
+
+
+def create_pooled_engine(url):
+    pooled_engine = create_engine(
+        url=url,
+        echo=False,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args=connect_args(),
+    )
+    instrument_statements(pooled_engine)
+    event.listen(pooled_engine, "before_cursor_execute", count_statements)
+    return pooled_engine
+
+
+engine = create_pooled_engine(settings.database_url)
+replicas = ReplicaSet(
+    engine,
+    [create_pooled_engine(url) for url in settings.database_replica_urls],
+    max_lag=settings.replica_max_lag,
+    max_gap=settings.replica_max_gap,
+    check_interval=settings.replica_check_interval,
 )
 
-session_factory = sessionmaker(engine, autoflush=False, autocommit=False, future=True)
+# Migrations, fixture loads and CLI maintenance may run for minutes: they get their own connections
+# without the statement timeout and never compete with requests for the pool
+maintenance_engine = create_engine(url=settings.database_url, echo=False, poolclass=NullPool)
+
+
+class RoutingSession(Session):
+    """
+    Session that reads from the replica in `info["replica"]`, if any.
+
+    Flushes and INSERT/UPDATE/DELETE statements always go to the primary. So do the reads of cache
+    builders, and of other in-memory structures passing `bind_arguments=READ_PRIMARY`: they are stamped
+    with versions the invalidation listener takes from the primary, and one built from a lagging replica
+    would stay stale until the next bump.
+    """
+
+    def get_bind(self, mapper=None, clause=None, primary=False, **kwargs):
+        replica = self.info.get("replica")
+        if replica is None or primary or self._flushing or catalog_cache.building or isinstance(clause, UpdateBase):
+            return super().get_bind(mapper, clause=clause, **kwargs)
+        return replica
+
+
+session_factory = sessionmaker(engine, class_=RoutingSession, autoflush=False, autocommit=False, future=True)
+
+
+def read_replica():
+    """
+    A replica for the current request, or None to use the primary.
+
+    Only GETs read from replicas, and only for clients that have not written recently: the page a POST
+    redirects to must show the write.
+    """
+    if not replicas.engines or not has_request_context() or request.method not in READ_METHODS:
+        return None
+    last_write = client_session.get(LAST_WRITE_KEY)
+    if last_write is not None and time.time() - last_write < replicas.read_your_writes_window:
+        return None
+    return replicas.choose()
+
+
+def get_request_session():
+    """The session of the current request, opened on first use and closed when the app context tears down."""
+    if "db_session" not in g:
+        g.db_session = session_factory(info={"replica": read_replica()})
+    return g.db_session
+
+
+@contextmanager
+def request_session():
+    """
+    Use the request's session for a block.
+
+    The session and its pooled connection outlive the block, so routes, form helpers and cache loaders of
+    one request share a single checkout. A failing block rolls the transaction back, leaving the session
+    usable for rendering the error.
+    """
+    session = get_request_session()
+    try:
+        yield session
+    except Exception:
+        session.rollback()
+        raise
+
+
+def remember_write(response):
+    if replicas.engines and "db_session" in g and request.method not in READ_METHODS:
+        client_session[LAST_WRITE_KEY] = time.time()
+    return response
+
+
+def close_request_session(exception=None):
+    session = g.pop("db_session", None)
+    if session is not None:
+        session.close()
+        logger.debug(f"Request session closed after {g.pop('sql_statements', 0)} SQL statements")
+
+
+def init_request_session(app):
+    app.after_request(remember_write)
+    app.teardown_appcontext(close_request_session)
 
 
 class BaseModel(DeclarativeBase):
@@ -43,7 +167,7 @@ Base = BaseModel
 
 
 def drop_all_tables_cascade():
-    with engine.connect() as conn:
+    with maintenance_engine.connect() as conn:
         conn.execute(text("DROP SCHEMA public CASCADE"))
         conn.execute(text("CREATE SCHEMA public"))
         conn.commit()
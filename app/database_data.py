@@ -1,7 +1,14 @@
+import hashlib
+import json
+from pathlib import Path
+
 from loguru import logger
+from sqlalchemy import literal_column, select, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.database import session_factory
+from app.config import settings
+from app.database import maintenance_engine
 from app.models import (
     CPU,
     GPU,
@@ -9,378 +16,250 @@ from app.models import (
     Assembly,
     AssemblyComponentAssociation,
     Brand,
+    Component,
     MemoryType,
     Motherboard,
+    SeedFingerprint,
     SocketType,
     Soundcard,
 )
 
+SEED_FIXTURE_PATH = Path(__file__).parent / "fixtures" / "seed.json"
+
+# Rows per INSERT statement; keeps parameter lists and RETURNING results bounded on huge fixtures
+CHUNK_SIZE = 10_000
+
+# fixture section -> (model, per-type columns, classificator references)
+COMPONENT_SECTIONS = {
+    "motherboards": (
+        Motherboard,
+        ("has_integrated_graphics",),
+        {"socket_type": "socket_type_id", "memory_type": "memory_type_id"},
+    ),
+    "cpus": (CPU, ("cores", "threads", "has_integrated_graphics"), {"socket_type": "socket_type_id"}),
+    "gpus": (GPU, ("vram",), {}),
+    "rams": (RAM, ("capacity", "frequency"), {"memory_type": "memory_type_id"}),
+    "soundcards": (Soundcard, ("channels_quantity",), {}),
+}
+
+
+class FixtureError(ValueError):
+    pass
+
+
+def chunked(items, size=CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def fixture_fingerprint(path=SEED_FIXTURE_PATH):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_fixture(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def name_to_id(connection, model):
+    return dict(connection.execute(select(model.name, model.id)).all())
+
+
+def insert_classificators(connection, fixture):
+    socket_types = [{"name": name} for name in fixture.get("socket_types", [])]
+    memory_types = [{"name": name} for name in fixture.get("memory_types", [])]
+    brands = [{"name": b["name"], "component_type": b["component_type"]} for b in fixture.get("brands", [])]
+
+    for model, rows in ((SocketType, socket_types), (MemoryType, memory_types), (Brand, brands)):
+        for chunk in chunked(rows):
+            connection.execute(insert(model).on_conflict_do_nothing(index_elements=["name"]), chunk)
+
+    return {
+        "brand": name_to_id(connection, Brand),
+        "socket_type": name_to_id(connection, SocketType),
+        "memory_type": name_to_id(connection, MemoryType),
+    }
+
+
+def resolve_component_rows(section, items, ids):
+    model, columns, references = COMPONENT_SECTIONS[section]
+    component_type = model.__mapper_args__["polymorphic_identity"]
+
+    base_rows, type_rows, missing = [], {}, set()
+    for item in items:
+        brand_id = ids["brand"].get(item["brand"])
+        if brand_id is None:
+            missing.add(f"brand {item['brand']!r}")
+
+        type_row = {column: item[column] for column in columns}
+        for reference, column in references.items():
+            type_row[column] = ids[reference].get(item[reference])
+            if type_row[column] is None:
+                missing.add(f"{reference} {item[reference]!r}")
+
+        base_rows.append(
+            {
+                "brand_id": brand_id,
+                "model": item["model"],
+                "quantity": item.get("quantity", 1),
+                "component_type": component_type,
+            }
+        )
+        type_rows[item["model"]] = type_row
+
+    if missing:
+        raise FixtureError(f"Unknown classificators in {section}: {', '.join(sorted(missing))}")
+
+    return base_rows, type_rows
+
+
+def insert_component_rows(connection, model, base_rows, type_rows):
+    """
+    Insert `components` rows and the per-type rows of the ones that were created.
+
+    `type_rows` maps model names to their per-type columns. Returns `(id, model)` of the created
+    components; models that already existed are skipped.
+    """
+    created = []
+    for chunk in chunked(base_rows):
+        stmt = (
+            insert(Component)
+            .on_conflict_do_nothing(index_elements=["model"])
+            .returning(Component.id, Component.model)
+        )
+        new_ids = connection.execute(stmt, chunk).all()
+        if not new_ids:
+            continue
+
+        # Components that already existed keep their per-type rows untouched
+        rows = [{"id": component_id, **type_rows[model_name]} for component_id, model_name in new_ids]
+        connection.execute(insert(model.__table__).on_conflict_do_nothing(index_elements=["id"]), rows)
+        created.extend(new_ids)
+
+    return created
+
+
+def upsert_component_rows(connection, model, base_rows, type_rows):
+    """
+    Insert or update components by model name, together with their per-type rows.
+
+    `type_rows` maps model names to their per-type columns. Returns `(id, model, inserted)` per written
+    component, `inserted` being false for updated ones (the new row version has `xmax = 0` only when it
+    was inserted). A model that exists with another component type is left alone and not returned.
+    """
+    table = model.__table__
+    written = []
+    for chunk in chunked(base_rows):
+        stmt = insert(Component)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["model"],
+            set_={
+                "brand_id": stmt.excluded.brand_id,
+                "quantity": stmt.excluded.quantity,
+                "updated_at": text("TIMEZONE('utc', now())"),
+            },
+            # The per-type row lives in another table, a component cannot change its type in place
+            where=Component.component_type == stmt.excluded.component_type,
+        ).returning(Component.id, Component.model, literal_column("xmax = 0").label("inserted"))
+        rows = connection.execute(stmt, chunk).all()
+        if not rows:
+            continue
+
+        type_stmt = insert(table)
+        columns = [column for column in type_rows[rows[0].model] if column != "id"]
+        type_stmt = type_stmt.on_conflict_do_update(
+            index_elements=["id"],
+            set_={column: type_stmt.excluded[column] for column in columns},
+        )
+        connection.execute(type_stmt, [{"id": row.id, **type_rows[row.model]} for row in rows])
+        written.extend((row.id, row.model, row.inserted) for row in rows)
+
+    return written
+
+
+def insert_components(connection, section, items, ids):
+    model = COMPONENT_SECTIONS[section][0]
+    base_rows, type_rows = resolve_component_rows(section, items, ids)
+    return len(insert_component_rows(connection, model, base_rows, type_rows))
+
+
+def insert_assemblies(connection, assemblies):
+    if not assemblies:
+        return 0
+
+    rows = [{"name": a["name"], "quantity": a.get("quantity", 1)} for a in assemblies]
+    assembly_ids = {}
+    for chunk in chunked(rows):
+        stmt = insert(Assembly).on_conflict_do_nothing(index_elements=["name"]).returning(Assembly.id, Assembly.name)
+        assembly_ids.update((name, assembly_id) for assembly_id, name in connection.execute(stmt, chunk))
+
+    models = sorted({item["model"] for a in assemblies if a["name"] in assembly_ids for item in a["components"]})
+    component_ids = {}
+    for chunk in chunked(models):
+        component_ids.update(
+            connection.execute(select(Component.model, Component.id).where(Component.model.in_(chunk))).all()
+        )
+
+    missing = sorted(set(models) - component_ids.keys())
+    if missing:
+        raise FixtureError(f"Unknown components in assemblies: {', '.join(missing)}")
+
+    associations = [
+        {
+            "assembly_id": assembly_ids[a["name"]],
+            "component_id": component_ids[item["model"]],
+            "quantity": item.get("quantity", 1),
+        }
+        for a in assemblies
+        if a["name"] in assembly_ids
+        for item in a["components"]
+    ]
+    for chunk in chunked(associations):
+        connection.execute(insert(AssemblyComponentAssociation).on_conflict_do_nothing(), chunk)
+
+    return len(assembly_ids)
+
+
+def load_fixture(connection, fixture):
+    """
+    Load a fixture document into the database with set-based inserts.
+
+    Classificator names are resolved to ids once per table, components are inserted in chunks with
+    `INSERT ... ON CONFLICT DO NOTHING RETURNING` and only newly created components get per-type rows.
+    Rows that already exist (by unique name/model) are left as is, so loading is idempotent.
+    Returns the number of inserted rows per fixture section.
+    """
+    ids = insert_classificators(connection, fixture)
+
+    counts = {}
+    for section in COMPONENT_SECTIONS:
+        counts[section] = insert_components(connection, section, fixture.get(section, []), ids)
+    counts["assemblies"] = insert_assemblies(connection, fixture.get("assemblies", []))
+    return counts
+
+
+def seed_data(path=None, force=False):
+    path = path or settings.seed_fixture_path or SEED_FIXTURE_PATH
+    fingerprint = fixture_fingerprint(path)
+
+    try:
+        with maintenance_engine.begin() as connection:
+            recorded = connection.execute(
+                select(SeedFingerprint.fingerprint).where(SeedFingerprint.fingerprint == fingerprint)
+            ).first()
+            if recorded and not force:
+                logger.info(f"Seed fixture {fingerprint[:12]} is already applied, skipping.")
+                return False
+
+            counts = load_fixture(connection, read_fixture(path))
+            connection.execute(insert(SeedFingerprint).values(fingerprint=fingerprint).on_conflict_do_nothing())
 
-def seed_data():
-    with session_factory() as session:
-        try:
-            # Seed socket types
-            socket_types = ["LGA1151", "LGA1700", "LGA1200", "AM4", "AM5"]
-            for name in socket_types:
-                if not session.query(SocketType).filter_by(name=name).first():
-                    session.add(SocketType(name=name))
-            session.commit()
-
-            # Seed memory types
-            memory_types = ["DDR3", "DDR4", "DDR5"]
-            for name in memory_types:
-                if not session.query(MemoryType).filter_by(name=name).first():
-                    session.add(MemoryType(name=name))
-            session.commit()
-
-            # Seed brands
-            brands = [
-                {"name": "ASUS", "type": "motherboard"},
-                {"name": "MSI", "type": "motherboard"},
-                {"name": "GIGABYTE", "type": "motherboard"},
-                {"name": "INTEL", "type": "cpu"},
-                {"name": "AMD", "type": "cpu"},
-                {"name": "NVIDIA", "type": "gpu"},
-                {"name": "ZOTAC", "type": "gpu"},
-                {"name": "CORSAIR", "type": "ram"},
-                {"name": "KINGSTON", "type": "ram"},
-                {"name": "G.SKILL", "type": "ram"},
-                {"name": "CREATIVE", "type": "soundcard"},
-                {"name": "BEHRINGER", "type": "soundcard"},
-                {"name": "FOCUSRITE", "type": "soundcard"},
-            ]
-            for brand in brands:
-                if not session.query(Brand).filter_by(name=brand["name"]).first():
-                    session.add(Brand(name=brand["name"], component_type=brand["type"]))
-            session.commit()
-
-            # Helper functions
-            def get_id(model, name):
-                item = session.query(model).filter_by(name=name).first()
-                return item.id if item else None
-
-            # Seed motherboards
-            motherboards = [
-                {
-                    "brand": "ASUS",
-                    "model": "ROG Strix Z790-E",
-                    "socket": "LGA1700",
-                    "memory": "DDR5",
-                    "graphics": True,
-                    "quantity": 10,
-                },
-                {
-                    "brand": "MSI",
-                    "model": "MAG B550 Tomahawk",
-                    "socket": "AM4",
-                    "memory": "DDR4",
-                    "graphics": False,
-                    "quantity": 7,
-                },
-                {
-                    "brand": "GIGABYTE",
-                    "model": "Z490 AORUS ULTRA",
-                    "socket": "LGA1200",
-                    "memory": "DDR4",
-                    "graphics": True,
-                    "quantity": 5,
-                },
-                {
-                    "brand": "ASUS",
-                    "model": "PRIME B650M-A WIFI",
-                    "socket": "AM5",
-                    "memory": "DDR5",
-                    "graphics": True,
-                    "quantity": 5,
-                },
-                {
-                    "brand": "MSI",
-                    "model": "B550M PRO-VDH WIFI",
-                    "socket": "AM4",
-                    "memory": "DDR4",
-                    "graphics": False,
-                    "quantity": 5,
-                },
-                {
-                    "brand": "GIGABYTE",
-                    "model": "B650 AORUS Elite AX",
-                    "socket": "AM5",
-                    "memory": "DDR5",
-                    "graphics": True,
-                    "quantity": 5,
-                },
-                {
-                    "brand": "MSI",
-                    "model": "B650E Tomahawk WIFI",
-                    "socket": "AM5",
-                    "memory": "DDR5",
-                    "graphics": False,
-                    "quantity": 5,
-                },
-                {
-                    "brand": "ASUS",
-                    "model": "ROG Crosshair X670E Hero",
-                    "socket": "AM5",
-                    "memory": "DDR5",
-                    "graphics": True,
-                    "quantity": 4,
-                },
-                {
-                    "brand": "MSI",
-                    "model": "Z790 ACE",
-                    "socket": "LGA1700",
-                    "memory": "DDR5",
-                    "graphics": True,
-                    "quantity": 3,
-                },
-                {
-                    "brand": "GIGABYTE",
-                    "model": "B650M DS3H",
-                    "socket": "AM5",
-                    "memory": "DDR5",
-                    "graphics": True,
-                    "quantity": 3,
-                },
-            ]
-            motherboard_objects = [
-                Motherboard(
-                    component_type="motherboard",
-                    brand_id=get_id(Brand, m["brand"]),
-                    model=m["model"],
-                    socket_type_id=get_id(SocketType, m["socket"]),
-                    memory_type_id=get_id(MemoryType, m["memory"]),
-                    has_integrated_graphics=m["graphics"],
-                    quantity=m["quantity"],
-                )
-                for m in motherboards
-            ]
-            session.add_all(motherboard_objects)
-            session.commit()
-
-            # Seed CPUs
-            cpus = [
-                {
-                    "brand": "INTEL",
-                    "model": "Core i7-12700K",
-                    "socket": "LGA1700",
-                    "cores": 12,
-                    "threads": 20,
-                    "graphics": True,
-                    "quantity": 15,
-                },
-                {
-                    "brand": "AMD",
-                    "model": "Ryzen 5 5600X",
-                    "socket": "AM4",
-                    "cores": 6,
-                    "threads": 12,
-                    "graphics": False,
-                    "quantity": 20,
-                },
-                {
-                    "brand": "INTEL",
-                    "model": "Core i9-10900K",
-                    "socket": "LGA1200",
-                    "cores": 10,
-                    "threads": 20,
-                    "graphics": True,
-                    "quantity": 10,
-                },
-                {
-                    "brand": "AMD",
-                    "model": "Ryzen 5 8500G",
-                    "socket": "AM5",
-                    "cores": 6,
-                    "threads": 12,
-                    "graphics": True,
-                    "quantity": 5,
-                },
-                {
-                    "brand": "AMD",
-                    "model": "Ryzen 5 7600",
-                    "socket": "AM4",
-                    "cores": 6,
-                    "threads": 12,
-                    "graphics": True,
-                    "quantity": 4,
-                },
-                {
-                    "brand": "INTEL",
-                    "model": "Core i5-13400F",
-                    "socket": "LGA1700",
-                    "cores": 10,
-                    "threads": 16,
-                    "graphics": False,
-                    "quantity": 3,
-                },
-            ]
-            cpu_objects = [
-                CPU(
-                    component_type="cpu",
-                    brand_id=get_id(Brand, c["brand"]),
-                    model=c["model"],
-                    socket_type_id=get_id(SocketType, c["socket"]),
-                    cores=c["cores"],
-                    threads=c["threads"],
-                    has_integrated_graphics=c["graphics"],
-                    quantity=c["quantity"],
-                )
-                for c in cpus
-            ]
-            session.add_all(cpu_objects)
-            session.commit()
-
-            # Seed GPUs
-            gpus = [
-                {"brand": "NVIDIA", "model": "RTX 3080", "vram": 10, "quantity": 8},
-                {"brand": "NVIDIA", "model": "RTX 3070", "vram": 8, "quantity": 10},
-                {"brand": "NVIDIA", "model": "GTX 1660", "vram": 6, "quantity": 12},
-                {"brand": "NVIDIA", "model": "RTX 4060", "vram": 8, "quantity": 10},
-                {"brand": "AMD", "model": "Radeon RX 7700 XT", "vram": 12, "quantity": 5},
-                {"brand": "AMD", "model": "Radeon RX 7900 XTX", "vram": 24, "quantity": 7},
-                {"brand": "AMD", "model": "Radeon RX 7800 XT", "vram": 16, "quantity": 6},
-                {"brand": "AMD", "model": "Radeon RX 7600", "vram": 8, "quantity": 3},
-            ]
-            gpu_objects = [
-                GPU(
-                    component_type="gpu",
-                    brand_id=get_id(Brand, g["brand"]),
-                    model=g["model"],
-                    vram=g["vram"],
-                    quantity=g["quantity"],
-                )
-                for g in gpus
-            ]
-            session.add_all(gpu_objects)
-            session.commit()
-
-            # Seed RAMs
-            rams = [
-                {
-                    "brand": "CORSAIR",
-                    "model": "Vengeance LPX",
-                    "memory": "DDR4",
-                    "capacity": 16,
-                    "frequency": 3200,
-                    "quantity": 30,
-                },
-                {
-                    "brand": "KINGSTON",
-                    "model": "HyperX Fury",
-                    "memory": "DDR4",
-                    "capacity": 8,
-                    "frequency": 2666,
-                    "quantity": 25,
-                },
-                {
-                    "brand": "CORSAIR",
-                    "model": "Dominion Platinum",
-                    "memory": "DDR5",
-                    "capacity": 32,
-                    "frequency": 5200,
-                    "quantity": 10,
-                },
-                {
-                    "brand": "G.SKILL",
-                    "model": "Trident Z5 Neo",
-                    "memory": "DDR5",
-                    "capacity": 32,
-                    "frequency": 600,
-                    "quantity": 15,
-                },
-                {
-                    "brand": "G.SKILL",
-                    "model": "Ripjaws S5",
-                    "memory": "DDR5",
-                    "capacity": 32,
-                    "frequency": 6400,
-                    "quantity": 10,
-                },
-            ]
-            ram_objects = [
-                RAM(
-                    component_type="ram",
-                    brand_id=get_id(Brand, r["brand"]),
-                    model=r["model"],
-                    memory_type_id=get_id(MemoryType, r["memory"]),
-                    capacity=r["capacity"],
-                    frequency=r["frequency"],
-                    quantity=r["quantity"],
-                )
-                for r in rams
-            ]
-            session.add_all(ram_objects)
-            session.commit()
-
-            # Seed soundcards
-            soundcards = [
-                {"brand": "CREATIVE", "model": "Sound BlasterX AE-5", "channels": 5, "quantity": 15},
-                {"brand": "BEHRINGER", "model": "U-PHORIA UMC404HD", "channels": 4, "quantity": 12},
-                {"brand": "CREATIVE", "model": "Sound Blaster Z", "channels": 5, "quantity": 10},
-                {"brand": "BEHRINGER", "model": "U-PHORIA UMC22", "channels": 2, "quantity": 20},
-                {"brand": "FOCUSRITE", "model": "Scarlett 2i2", "channels": 2, "quantity": 15},
-            ]
-            soundcard_objects = [
-                Soundcard(
-                    component_type="soundcard",
-                    brand_id=get_id(Brand, s["brand"]),
-                    model=s["model"],
-                    channels_quantity=s["channels"],
-                    quantity=s["quantity"],
-                )
-                for s in soundcards
-            ]
-            session.add_all(soundcard_objects)
-            session.commit()
-
-            # Seed assemblies
-            assemblies = [
-                {
-                    "name": "Gaming Build",
-                    "quantity": 3,
-                    "components": [
-                        (motherboard_objects[0], 1),
-                        (cpu_objects[0], 1),
-                        (gpu_objects[0], 1),
-                        (ram_objects[2], 2),
-                        (soundcard_objects[0], 1),
-                    ],
-                },
-                {
-                    "name": "Budget Build",
-                    "quantity": 5,
-                    "components": [
-                        (motherboard_objects[1], 1),
-                        (cpu_objects[1], 1),
-                        (gpu_objects[2], 1),
-                        (ram_objects[0], 2),
-                        (soundcard_objects[1], 1),
-                    ],
-                },
-                {
-                    "name": "Workstation Build",
-                    "quantity": 2,
-                    "components": [
-                        (motherboard_objects[2], 1),
-                        (cpu_objects[2], 1),
-                        (gpu_objects[1], 1),
-                        (ram_objects[1], 4),
-                        (soundcard_objects[0], 1),
-                    ],
-                },
-            ]
-            for assembly_data in assemblies:
-                assembly = Assembly(name=assembly_data["name"], quantity=assembly_data["quantity"])
-                assembly.components_association.extend(
-                    [
-                        AssemblyComponentAssociation(component=comp, quantity=qty)
-                        for comp, qty in assembly_data["components"]
-                    ]
-                )
-                session.add(assembly)
-            session.commit()
-
-            logger.info("Seed data and compatible assemblies added successfully.")
-        except SQLAlchemyError as e:
-            session.rollback()
-            logger.error(f"Error during seeding: {e}")
+        logger.info(f"Fixture {Path(path).name} loaded: {counts}")
+        return True
+    except (SQLAlchemyError, FixtureError) as e:
+        logger.error(f"Error during seeding: {e}")
+        return False
@@ -0,0 +1,168 @@
+import math
+import random
+
+# Row counts of the shipped app/fixtures/seed.json, i.e. scale factor 1
+BASE_COUNTS = {
+    "motherboards": 10,
+    "cpus": 6,
+    "gpus": 8,
+    "rams": 5,
+    "soundcards": 5,
+    "assemblies": 3,
+}
+
+BASE_BRANDS = {
+    "motherboard": ["ASUS", "MSI", "GIGABYTE"],
+    "cpu": ["INTEL", "AMD"],
+    "gpu": ["NVIDIA", "ZOTAC"],
+    "ram": ["CORSAIR", "KINGSTON", "G.SKILL"],
+    "soundcard": ["CREATIVE", "BEHRINGER", "FOCUSRITE"],
+}
+BASE_SOCKET_TYPES = ["LGA1151", "LGA1700", "LGA1200", "AM4", "AM5"]
+
+# Values match the choices offered by the forms in app/forms.py so generated rows stay editable
+FREQUENCIES = {
+    "DDR3": [1600, 1866],
+    "DDR4": [2400, 2666, 3000, 3200, 3600],
+    "DDR5": [4800, 5200, 5600, 6000, 6400],
+}
+CAPACITIES = [4, 8, 16, 32]
+CORES_THREADS = [(2, 4), (4, 8), (6, 12), (8, 16), (10, 16), (10, 20), (12, 20), (12, 24), (16, 24), (16, 32), (24, 32)]
+VRAMS = [2, 3, 4, 6, 8, 10, 12, 16, 20, 24]
+CHANNELS = [2, 4, 6, 7, 8, 16]
+
+
+def scaled(count, scale):
+    return max(1, round(count * scale))
+
+
+def generate_classificators(scale):
+    growth = math.ceil(math.sqrt(scale))
+
+    brands = []
+    for component_type, names in BASE_BRANDS.items():
+        brands.extend({"name": name, "component_type": component_type} for name in names)
+        brands.extend(
+            {"name": f"{component_type.upper()}-BRAND-{i:04d}", "component_type": component_type}
+            for i in range(len(names) * (growth - 1))
+        )
+
+    extra_sockets = len(BASE_SOCKET_TYPES) * (math.ceil(scale**0.25) - 1)
+    socket_types = BASE_SOCKET_TYPES + [f"SKT-{i:03d}" for i in range(extra_sockets)]
+
+    return {"socket_types": socket_types, "memory_types": list(FREQUENCIES), "brands": brands}
+
+
+def generate_catalog(scale=1.0, seed=0):
+    """
+    Build a deterministic fixture document (same format as app/fixtures/seed.json).
+
+    Row counts are the shipped seed counts multiplied by `scale`; classificators grow sublinearly.
+    CPUs only use sockets and RAM kits only use memory types that some motherboard has, and every assembly
+    pairs a motherboard with a CPU of the same socket and RAM of the same memory type, so all generated
+    builds pass `check_compatibility`. The same `scale` and `seed` always produce the same document.
+    """
+    rng = random.Random(seed)
+    fixture = generate_classificators(scale)
+
+    brands = {component_type: [] for component_type in BASE_BRANDS}
+    for brand in fixture["brands"]:
+        brands[brand["component_type"]].append(brand["name"])
+
+    motherboards = []
+    for i in range(scaled(BASE_COUNTS["motherboards"], scale)):
+        motherboards.append(
+            {
+                "brand": rng.choice(brands["motherboard"]),
+                "model": f"MB-{i:07d}",
+                "socket_type": rng.choice(fixture["socket_types"]),
+                "memory_type": rng.choices(list(FREQUENCIES), weights=[1, 9, 10])[0],
+                "has_integrated_graphics": rng.random() < 0.6,
+                "quantity": rng.randint(0, 50),
+            }
+        )
+
+    board_sockets = sorted({mb["socket_type"] for mb in motherboards})
+    board_memory_types = sorted({mb["memory_type"] for mb in motherboards})
+
+    cpus = []
+    for i in range(scaled(BASE_COUNTS["cpus"], scale)):
+        cores, threads = rng.choice(CORES_THREADS)
+        cpus.append(
+            {
+                "brand": rng.choice(brands["cpu"]),
+                "model": f"CPU-{i:07d}",
+                "socket_type": rng.choice(board_sockets),
+                "cores": cores,
+                "threads": threads,
+                "has_integrated_graphics": rng.random() < 0.5,
+                "quantity": rng.randint(0, 50),
+            }
+        )
+
+    gpus = [
+        {
+            "brand": rng.choice(brands["gpu"]),
+            "model": f"GPU-{i:07d}",
+            "vram": rng.choice(VRAMS),
+            "quantity": rng.randint(0, 50),
+        }
+        for i in range(scaled(BASE_COUNTS["gpus"], scale))
+    ]
+
+    rams = []
+    for i in range(scaled(BASE_COUNTS["rams"], scale)):
+        memory_type = rng.choice(board_memory_types)
+        rams.append(
+            {
+                "brand": rng.choice(brands["ram"]),
+                "model": f"RAM-{i:07d}",
+                "memory_type": memory_type,
+                "capacity": rng.choice(CAPACITIES),
+                "frequency": rng.choice(FREQUENCIES[memory_type]),
+                "quantity": rng.randint(0, 50),
+            }
+        )
+
+    soundcards = [
+        {
+            "brand": rng.choice(brands["soundcard"]),
+            "model": f"SND-{i:07d}",
+            "channels_quantity": rng.choice(CHANNELS),
+            "quantity": rng.randint(0, 50),
+        }
+        for i in range(scaled(BASE_COUNTS["soundcards"], scale))
+    ]
+
+    fixture.update(motherboards=motherboards, cpus=cpus, gpus=gpus, rams=rams, soundcards=soundcards)
+    fixture["assemblies"] = generate_assemblies(rng, fixture, scaled(BASE_COUNTS["assemblies"], scale))
+    return fixture
+
+
+def generate_assemblies(rng, fixture, count):
+    cpus_by_socket, rams_by_memory_type = {}, {}
+    for cpu in fixture["cpus"]:
+        cpus_by_socket.setdefault(cpu["socket_type"], []).append(cpu["model"])
+    for ram in fixture["rams"]:
+        rams_by_memory_type.setdefault(ram["memory_type"], []).append(ram["model"])
+
+    buildable = [
+        mb
+        for mb in fixture["motherboards"]
+        if mb["socket_type"] in cpus_by_socket and mb["memory_type"] in rams_by_memory_type
+    ]
+    if not buildable:
+        return []
+
+    assemblies = []
+    for i in range(count):
+        mb = rng.choice(buildable)
+        components = [
+            {"model": mb["model"], "quantity": 1},
+            {"model": rng.choice(cpus_by_socket[mb["socket_type"]]), "quantity": 1},
+            {"model": rng.choice(rams_by_memory_type[mb["memory_type"]]), "quantity": rng.choice([1, 2, 4])},
+            {"model": rng.choice(fixture["gpus"])["model"], "quantity": 1},
+            {"model": rng.choice(fixture["soundcards"])["model"], "quantity": 1},
+        ]
+        assemblies.append({"name": f"Build {i:07d}", "quantity": rng.randint(1, 10), "components": components})
+    return assemblies
@@ -0,0 +1,193 @@
+import csv
+import io
+import json
+import xml.etree.ElementTree as ET
+import zlib
+from datetime import date, datetime
+
+from app.queries import component_rows_query, components
+
+CATALOG_EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+CATALOG_EXPORT_BATCH_SIZE = 1000
+
+
+def assembly_to_xml(assembly):
+    root = ET.Element("assembly", attrib={"id": str(assembly.id), "name": assembly.name})
+
+    for component in assembly.components:
+        comp_el = ET.SubElement(
+            root,
+            "component",
+            attrib={
+                "type": component.component_type,
+                "brand": component.brand_rel.name,
+                "model": component.model,
+            },
+        )
+
+        if component.component_type == "cpu":
+            ET.SubElement(comp_el, "cores").text = str(component.cores)
+            ET.SubElement(comp_el, "threads").text = str(component.threads)
+            ET.SubElement(comp_el, "integrated_graphics").text = str(component.has_integrated_graphics)
+
+        elif component.component_type == "motherboard":
+            ET.SubElement(comp_el, "socket").text = component.socket_type_rel.name
+            ET.SubElement(comp_el, "memory_type").text = component.memory_type_rel.name
+            ET.SubElement(comp_el, "integrated_graphics").text = str(component.has_integrated_graphics)
+
+        elif component.component_type == "ram":
+            ET.SubElement(comp_el, "capacity").text = str(component.capacity)
+            ET.SubElement(comp_el, "frequency").text = str(component.frequency)
+            ET.SubElement(comp_el, "memory_type").text = component.memory_type_rel.name
+
+        elif component.component_type == "gpu":
+            ET.SubElement(comp_el, "vram").text = str(component.vram)
+
+        elif component.component_type == "soundcard":
+            ET.SubElement(comp_el, "channels").text = str(component.channels_quantity)
+
+    return ET.tostring(root, encoding="utf-8", method="xml")
+
+
+def assembly_to_json(assembly):
+    data = {"id": assembly.id, "name": assembly.name, "components": []}
+
+    for component in assembly.components:
+        comp = {
+            "type": component.component_type,
+            "brand": component.brand_rel.name,
+            "model": component.model,
+        }
+
+        if component.component_type == "cpu":
+            comp.update(
+                {
+                    "cores": component.cores,
+                    "threads": component.threads,
+                    "integrated_graphics": component.has_integrated_graphics,
+                }
+            )
+        elif component.component_type == "motherboard":
+            comp.update(
+                {
+                    "socket": component.socket_type_rel.name,
+                    "memory_type": component.memory_type_rel.name,
+                    "integrated_graphics": component.has_integrated_graphics,
+                }
+            )
+        elif component.component_type == "ram":
+            comp.update(
+                {
+                    "capacity": component.capacity,
+                    "frequency": component.frequency,
+                    "memory_type": component.memory_type_rel.name,
+                }
+            )
+        elif component.component_type == "gpu":
+            comp.update({"vram": component.vram})
+        elif component.component_type == "soundcard":
+            comp.update({"channels": component.channels_quantity})
+
+        data["components"].append(comp)
+
+    return json.dumps(data, indent=2)
+
+
+def assembly_to_txt(assembly):
+    lines = [f"Assembly Name: {assembly.name}", "Components:"]
+
+    for component in assembly.components:
+        lines.append(f"\n  - Type: {component.component_type.upper()}")
+        lines.append(f"    Brand: {component.brand_rel.name}")
+        lines.append(f"    Model: {component.model}")
+
+        if component.component_type == "cpu":
+            lines.append(f"    Cores: {component.cores}")
+            lines.append(f"    Threads: {component.threads}")
+            lines.append(f"    Integrated Graphics: {'Yes' if component.has_integrated_graphics else 'No'}")
+
+        elif component.component_type == "motherboard":
+            lines.append(f"    Socket: {component.socket_type_rel.name}")
+            lines.append(f"    Memory Type: {component.memory_type_rel.name}")
+            lines.append(f"    Integrated Graphics: {'Yes' if component.has_integrated_graphics else 'No'}")
+
+        elif component.component_type == "ram":
+            lines.append(f"    Capacity: {component.capacity} GB")
+            lines.append(f"    Frequency: {component.frequency} MHz")
+            lines.append(f"    Memory Type: {component.memory_type_rel.name}")
+
+        elif component.component_type == "gpu":
+            lines.append(f"    VRAM: {component.vram} GB")
+
+        elif component.component_type == "soundcard":
+            lines.append(f"    Channels: {component.channels_quantity}")
+
+    return "\n".join(lines)
+
+
+def catalog_export_query(component_type=None):
+    query = component_rows_query()
+    if component_type:
+        query = query.where(components.c.component_type == component_type)
+    return query.order_by(components.c.id)
+
+
+def export_value(value):
+    return value.isoformat() if isinstance(value, (datetime, date)) else value
+
+
+def ndjson_batches(keys, batches):
+    for rows in batches:
+        yield "".join(
+            json.dumps(
+                {key: export_value(value) for key, value in zip(keys, row) if value is not None},
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            + "\n"
+            for row in rows
+        )
+
+
+def csv_batches(keys, batches):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(keys)
+    for rows in batches:
+        writer.writerows([export_value(value) for value in row] for row in rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # Header of an empty export
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def gzip_chunks(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def stream_catalog(session, export_format, component_type=None, compress=False):
+    """
+    Yield the catalog (see `component_rows_query()`) as NDJSON or CSV chunks, one per fetched batch.
+
+    Rows are read through a server-side cursor `CATALOG_EXPORT_BATCH_SIZE` at a time, so memory use does
+    not depend on the catalog size. `session` must stay open until the generator is exhausted.
+    """
+    result = session.execute(
+        catalog_export_query(component_type),
+        execution_options={"yield_per": CATALOG_EXPORT_BATCH_SIZE},
+    )
+    batches = result.partitions()
+    chunks = (ndjson_batches if export_format == "ndjson" else csv_batches)(list(result.keys()), batches)
+    if compress:
+        return gzip_chunks(chunks)
+    return (chunk.encode() for chunk in chunks)
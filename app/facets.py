@@ -0,0 +1,75 @@
+from sqlalchemy import delete, func, insert, literal, select, text
+
+from app.models import Brand, ComponentFacetCount, MemoryType, SocketType
+from app.queries import components, cpus, motherboards, rams
+
+facet_counts_table = ComponentFacetCount.__table__
+
+# facet -> (lookup table, sources); a source is (table, column, component type or None to read it from the row).
+# Kept in sync with the triggers of the component_facet_counts migration.
+FACETS = {
+    "brand": (Brand.__table__, [(components, "brand_id", None)]),
+    "socket_type": (
+        SocketType.__table__,
+        [(motherboards, "socket_type_id", "motherboard"), (cpus, "socket_type_id", "cpu")],
+    ),
+    "memory_type": (
+        MemoryType.__table__,
+        [(motherboards, "memory_type_id", "motherboard"), (rams, "memory_type_id", "ram")],
+    ),
+}
+
+
+def facet_count_selects():
+    """Statements computing the rollup from scratch, one per facet source."""
+    statements = []
+    for facet, (_, sources) in FACETS.items():
+        for table, column, component_type in sources:
+            type_column = components.c.component_type if component_type is None else literal(component_type)
+            statement = select(type_column, literal(facet), table.c[column], func.count())
+            if table is not components:
+                statement = statement.select_from(table)
+            statements.append(statement.group_by(type_column, table.c[column]))
+    return statements
+
+
+def rebuild_facet_counts(connection):
+    """Recompute the whole rollup, e.g. after loading data with the triggers disabled."""
+    # Writers are blocked until commit, so no trigger delta can be lost between the delete and the insert
+    connection.execute(text("LOCK TABLE components, motherboards, cpus, rams IN SHARE MODE"))
+    connection.execute(delete(facet_counts_table))
+    for statement in facet_count_selects():
+        connection.execute(
+            insert(facet_counts_table).from_select(["component_type", "facet", "value_id", "count"], statement)
+        )
+
+
+def facet_counts(session, component_type=None):
+    """
+    Component counts per type, brand, socket type and memory type, read from the rollup table.
+
+    With `component_type` the brand, socket and memory type counts only cover that type; the type counts
+    always cover the whole catalog so a client can offer switching between types.
+    """
+    rollup = facet_counts_table.c
+    type_counts = session.execute(
+        select(rollup.component_type, func.sum(rollup.count).label("count"))
+        .where(rollup.facet == "brand", rollup.count > 0)
+        .group_by(rollup.component_type)
+        .order_by(rollup.component_type)
+    ).all()
+    facets = {"component_type": [{"value": row.component_type, "count": int(row.count)} for row in type_counts]}
+
+    for facet, (lookup, _) in FACETS.items():
+        query = (
+            select(lookup.c.id, lookup.c.name, func.sum(rollup.count).label("count"))
+            .select_from(facet_counts_table)
+            .join(lookup, lookup.c.id == rollup.value_id)
+            .where(rollup.facet == facet, rollup.count > 0)
+            .group_by(lookup.c.id, lookup.c.name)
+            .order_by(lookup.c.name)
+        )
+        if component_type:
+            query = query.where(rollup.component_type == component_type)
+        facets[facet] = [{"id": row.id, "name": row.name, "count": int(row.count)} for row in session.execute(query)]
+    return facets
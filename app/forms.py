@@ -9,26 +9,75 @@ from wtforms import (
 )
 from wtforms.validators import DataRequired, InputRequired, NumberRange
 
-from app.database import session_factory
-from app.models import Brand, MemoryType, SocketType
+from app.cache import CLASSIFICATORS, COMPONENTS, catalog_cache
+from app.database import request_session
+from app.queries import (
+    brand_rows,
+    component_rows_query,
+    components,
+    filter_components,
+    memory_type_rows,
+    socket_type_rows,
+)
+
+COMPONENT_LABELS = {
+    "motherboard": lambda c: f"{c.brand_name} {c.model} | Socket: {c.socket_type} | RAM: {c.memory_type}",
+    "cpu": lambda c: (
+        f"{c.brand_name} {c.model} | Socket: {c.socket_type} | "
+        f"Cores: {c.cores} | Threads: {c.threads} | iGPU: {'Yes' if c.has_integrated_graphics else 'No'}"
+    ),
+    "gpu": lambda c: f"{c.brand_name} {c.model} | VRAM: {c.vram}GB",
+    "ram": lambda c: f"{c.brand_name} {c.model} | {c.memory_type} | {c.capacity}GB @ {c.frequency}MHz",
+    "soundcard": lambda c: f"{c.brand_name} {c.model} | Channels: {c.channels_quantity}",
+}
+
+
+def load_choices(rows_query, *args):
+    with request_session() as session:
+        return [(row.id, row.name) for row in rows_query(session, *args)]
 
 
 def get_brand_choices_for(component_type: str):
-    with session_factory() as session:
-        return [
-            (b.id, b.name)
-            for b in session.query(Brand).filter_by(component_type=component_type).order_by(Brand.name).all()
-        ]
+    choices = catalog_cache.get(
+        ("brand_choices", component_type),
+        lambda: load_choices(brand_rows, component_type),
+        scopes=(CLASSIFICATORS,),
+    )
+    return list(choices)
 
 
 def get_socket_type_choices():
-    with session_factory() as session:
-        return [(st.id, st.name) for st in session.query(SocketType).order_by(SocketType.name).all()]
+    choices = catalog_cache.get(
+        "socket_type_choices",
+        lambda: load_choices(socket_type_rows),
+        scopes=(CLASSIFICATORS,),
+    )
+    return list(choices)
 
 
 def get_memory_type_choices():
-    with session_factory() as session:
-        return [(mt.id, mt.name) for mt in session.query(MemoryType).order_by(MemoryType.name).all()]
+    choices = catalog_cache.get(
+        "memory_type_choices",
+        lambda: load_choices(memory_type_rows),
+        scopes=(CLASSIFICATORS,),
+    )
+    return list(choices)
+
+
+def load_component_choices(component_type):
+    label = COMPONENT_LABELS[component_type]
+    query = filter_components(component_rows_query(), component_type=component_type).order_by(components.c.id)
+    with request_session() as session:
+        return tuple((row.id, label(row)) for row in session.execute(query))
+
+
+def get_component_choices(component_type: str):
+    """Pre-rendered `(id, label)` choices of one component type, rebuilt only when the catalog changes."""
+    return catalog_cache.get(
+        ("component_choices", component_type),
+        lambda: load_component_choices(component_type),
+        scopes=(COMPONENTS, CLASSIFICATORS),
+    )
 
 
 class BaseComponentForm(FlaskForm):
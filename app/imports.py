@@ -0,0 +1,219 @@
+import csv
+import json
+from itertools import islice
+
+from app.database_data import (
+    COMPONENT_SECTIONS,
+    insert_component_rows,
+    name_to_id,
+    upsert_component_rows,
+)
+from app.models import Brand, MemoryType, SocketType
+from app.queries import BOOLEAN_VALUES
+
+IMPORT_FORMATS = ("csv", "ndjson")
+IMPORT_BATCH_SIZE = 2000
+MODEL_MAX_LENGTH = 100
+
+# component_type -> fixture section, e.g. "cpu" -> "cpus"
+SECTIONS = {
+    model.__mapper_args__["polymorphic_identity"]: section for section, (model, *_) in COMPONENT_SECTIONS.items()
+}
+BOOLEAN_COLUMNS = {"has_integrated_graphics"}
+
+
+class ImportReport:
+    """Outcome of an import: counters and one entry per row that was not created."""
+
+    def __init__(self):
+        self.created = 0
+        self.updated = 0
+        self.skipped = 0
+        self.failed = 0
+        self.rows = []
+        self.component_ids = []
+
+    def update(self, line, model):
+        self.updated += 1
+        self.rows.append({"row": line, "model": model, "status": "updated", "errors": []})
+
+    def skip(self, line, model, reason):
+        self.skipped += 1
+        self.rows.append({"row": line, "model": model, "status": "skipped", "errors": [reason]})
+
+    def fail(self, line, model, errors):
+        self.failed += 1
+        self.rows.append({"row": line, "model": model, "status": "failed", "errors": errors})
+
+    def to_dict(self):
+        return {
+            "created": self.created,
+            "updated": self.updated,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "rows": sorted(self.rows, key=lambda row: row["row"]),
+        }
+
+
+def read_rows(stream, import_format):
+    """Yield `(line, raw row)` from a text stream; unparsable NDJSON lines come back as strings."""
+    if import_format == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line, text in enumerate(stream, start=1):
+        if not text.strip():
+            continue
+        try:
+            row = json.loads(text)
+        except ValueError as e:
+            row = f"Invalid JSON: {e}"
+        yield line, row if isinstance(row, (dict, str)) else "Row must be a JSON object"
+
+
+def parse_int(value, column, errors, minimum=1, default=None):
+    if value is None or value == "":
+        if default is None:
+            errors.append(f"{column} is required")
+        return default
+    try:
+        if isinstance(value, (bool, float)):
+            raise TypeError(value)
+        number = int(value)
+    except (TypeError, ValueError):
+        errors.append(f"{column} must be an integer")
+        return None
+    if number < minimum:
+        errors.append(f"{column} must be >= {minimum}")
+        return None
+    return number
+
+
+def parse_bool(value, column, errors):
+    if value is None or value == "":
+        return False
+    if isinstance(value, bool):
+        return value
+    if str(value).lower() not in BOOLEAN_VALUES:
+        errors.append(f"{column} must be a boolean")
+        return None
+    return BOOLEAN_VALUES[str(value).lower()]
+
+
+def load_lookups(connection):
+    """Every classificator name resolved once per import."""
+    return {
+        "brand": name_to_id(connection, Brand),
+        "socket_type": name_to_id(connection, SocketType),
+        "memory_type": name_to_id(connection, MemoryType),
+    }
+
+
+def parse_row(row, lookups):
+    """Validate one row; returns `(component_type, base row, per-type row, errors)`."""
+    errors = []
+    component_type = row.get("component_type")
+    if component_type not in SECTIONS:
+        return None, None, None, [f"component_type must be one of {', '.join(SECTIONS)}"]
+    _, columns, references = COMPONENT_SECTIONS[SECTIONS[component_type]]
+
+    model = str(row.get("model") or "").strip()
+    if not model:
+        errors.append("model is required")
+    elif len(model) > MODEL_MAX_LENGTH:
+        errors.append(f"model must be at most {MODEL_MAX_LENGTH} characters")
+
+    # Exported catalogs name the column brand_name, so an export can be imported back as is
+    brand = row.get("brand") or row.get("brand_name")
+    # Like the fixture loader, any brand is accepted: vendors such as AMD ship several component types
+    brand_id = lookups["brand"].get(brand)
+    if brand_id is None:
+        errors.append(f"unknown brand {brand!r}")
+
+    base_row = {
+        "brand_id": brand_id,
+        "model": model,
+        "quantity": parse_int(row.get("quantity"), "quantity", errors, minimum=0, default=1),
+        "component_type": component_type,
+    }
+    type_row = {
+        column: parse_bool(row.get(column), column, errors)
+        if column in BOOLEAN_COLUMNS
+        else parse_int(row.get(column), column, errors)
+        for column in columns
+    }
+    for reference, column in references.items():
+        type_row[column] = lookups[reference].get(row.get(reference))
+        if type_row[column] is None:
+            errors.append(f"unknown {reference} {row.get(reference)!r}")
+
+    return component_type, base_row, type_row, errors
+
+
+def import_batch(connection, batch, lookups, seen, report, upsert):
+    sections = {}
+    for line, row in batch:
+        if isinstance(row, str):
+            report.fail(line, None, [row])
+            continue
+
+        component_type, base_row, type_row, errors = parse_row(row, lookups)
+        model = base_row["model"] if base_row else row.get("model")
+        if not errors and model in seen:
+            errors.append(f"duplicate of row {seen[model]}")
+        if errors:
+            report.fail(line, model, errors)
+            continue
+
+        seen[model] = line
+        base_rows, type_rows, lines = sections.setdefault(component_type, ([], {}, {}))
+        base_rows.append(base_row)
+        type_rows[model] = type_row
+        lines[model] = line
+
+    for component_type, (base_rows, type_rows, lines) in sections.items():
+        model = COMPONENT_SECTIONS[SECTIONS[component_type]][0]
+        if upsert:
+            written = upsert_component_rows(connection, model, base_rows, type_rows)
+        else:
+            written = [
+                (component_id, model_name, True)
+                for component_id, model_name in insert_component_rows(connection, model, base_rows, type_rows)
+            ]
+        report.component_ids.extend(component_id for component_id, _, _ in written)
+
+        inserted = {model_name: created for _, model_name, created in written}
+        for model_name, line in lines.items():
+            if model_name not in inserted:
+                reason = (
+                    "component with this model exists with another type"
+                    if upsert
+                    else "component with this model already exists"
+                )
+                report.skip(line, model_name, reason)
+            elif inserted[model_name]:
+                report.created += 1
+            else:
+                report.update(line, model_name)
+
+
+def import_components(connection, stream, import_format, upsert=False):
+    """
+    Import components of any types from a CSV or NDJSON text stream.
+
+    Rows are validated and written `IMPORT_BATCH_SIZE` at a time with the fixture loader's set-based
+    inserts; classificator names are looked up once for the whole import. Invalid rows are reported and
+    skipped. Existing models are left untouched, or updated in place with `upsert`. Returns an
+    `ImportReport`.
+    """
+    if import_format not in IMPORT_FORMATS:
+        raise ValueError(f"Unknown import format, expected one of {', '.join(IMPORT_FORMATS)}")
+
+    lookups = load_lookups(connection)
+    report, seen = ImportReport(), {}
+    rows = read_rows(stream, import_format)
+    while batch := list(islice(rows, IMPORT_BATCH_SIZE)):
+        import_batch(connection, batch, lookups, seen, report, upsert)
+    return report
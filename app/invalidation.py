@@ -0,0 +1,130 @@
+import select as selectors
+import threading
+import time
+
+import psycopg2
+from loguru import logger
+from sqlalchemy import event, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.cache import catalog_cache
+from app.models import CacheVersion
+
+CHANNEL = "cache_invalidation"
+MAX_RECONNECT_DELAY = 30.0
+
+
+class InvalidationListener:
+    """
+    Keeps the in-process cache coherent with writes made by other workers.
+
+    Database triggers bump a per-scope counter in `cache_versions` and publish `scope:version` on the
+    `cache_invalidation` channel. A background thread LISTENs on a dedicated connection and bumps the
+    matching local cache scope. While that connection is down the counters are polled instead, and they
+    are re-read after every reconnect so notifications sent in between are not lost.
+
+    Writes made through this process's own pool already bumped the local scope when they committed, so
+    notifications sent by those backends only record the version: bumping again would make the
+    compatibility index drop its incremental refresh and rebuild.
+    """
+
+    def __init__(self, engine, cache=catalog_cache, poll_interval=5.0):
+        self.engine = engine
+        self.cache = cache
+        self.poll_interval = poll_interval
+        self.connected = False
+        self._seen = {}
+        self._local_pids = set()
+        self._stopped = threading.Event()
+        self._thread = None
+
+        event.listen(engine, "connect", self._remember_backend)
+        # Once a connection leaves the pool its pid may be reused by another worker's backend
+        event.listen(engine, "close", self._forget_backend)
+        event.listen(engine, "detach", self._forget_backend)
+
+    def _remember_backend(self, dbapi_connection, connection_record):
+        connection_record.info["backend_pid"] = dbapi_connection.get_backend_pid()
+        self._local_pids.add(connection_record.info["backend_pid"])
+
+    def _forget_backend(self, dbapi_connection, connection_record):
+        self._local_pids.discard(connection_record.info.get("backend_pid"))
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="cache-invalidation", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+
+    def apply(self, scope, version, pid=None):
+        if self._seen.get(scope) != version:
+            self._seen[scope] = version
+            if pid not in self._local_pids:
+                self.cache.bump(scope)
+
+    def poll_versions(self):
+        with self.engine.connect() as connection:
+            for scope, version in connection.execute(select(CacheVersion.scope, CacheVersion.version)):
+                self.apply(scope, version)
+
+    def _run(self):
+        delay = 1.0
+        while not self._stopped.is_set():
+            try:
+                self._listen()
+                delay = 1.0
+            except (psycopg2.Error, SQLAlchemyError, OSError) as e:
+                logger.warning(f"Cache invalidation listener disconnected: {e}")
+            finally:
+                self.connected = False
+
+            # Fall back to polling the version counters until the next reconnect attempt
+            deadline = time.monotonic() + delay
+            while not self._stopped.is_set() and time.monotonic() < deadline:
+                try:
+                    self.poll_versions()
+                except SQLAlchemyError as e:
+                    logger.debug(f"Cache version polling failed: {e}")
+                self._stopped.wait(min(self.poll_interval, max(deadline - time.monotonic(), 0)))
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+    def _listen(self):
+        connection = self.engine.raw_connection()
+        # The listener holds its connection for the lifetime of the process, keep it out of the pool
+        connection.detach()
+        dbapi_connection = connection.dbapi_connection
+        try:
+            dbapi_connection.autocommit = True
+            with dbapi_connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {CHANNEL}")
+
+                self.connected = True
+                logger.info(f"Listening for cache invalidations on '{CHANNEL}'.")
+                self.poll_versions()
+
+                while not self._stopped.is_set():
+                    if not any(selectors.select([dbapi_connection], [], [], self.poll_interval)):
+                        # Idle: make sure the connection is still alive
+                        cursor.execute("SELECT 1")
+                        continue
+
+                    dbapi_connection.poll()
+                    while dbapi_connection.notifies:
+                        notify = dbapi_connection.notifies.pop(0)
+                        scope, _, version = notify.payload.rpartition(":")
+                        self.apply(scope, int(version), notify.pid)
+        finally:
+            connection.close()
+
+
+invalidation_listener = None
+
+
+def start_invalidation_listener(engine, poll_interval):
+    global invalidation_listener
+    if invalidation_listener is None:
+        invalidation_listener = InvalidationListener(engine, poll_interval=poll_interval).start()
+    return invalidation_listener
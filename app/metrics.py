@@ -0,0 +1,122 @@
+import threading
+import time
+from bisect import bisect_left
+
+from flask import Response
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Counter:
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help_text = help_text
+        self._lock = threading.Lock()
+        self.value = 0
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def render(self):
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter", f"{self.name} {self.value}"]
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus exposition format."""
+
+    def __init__(self, name, help_text, buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+
+    def observe(self, value):
+        with self._lock:
+            self._counts[bisect_left(self.buckets, value)] += 1
+            self._sum += value
+
+    def render(self):
+        with self._lock:
+            counts, total = list(self._counts), self._sum
+
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        cumulative = 0
+        for bound, count in zip((*self.buckets, "+Inf"), counts):
+            cumulative += count
+            lines.append(f'{self.name}_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f"{self.name}_sum {total}")
+        lines.append(f"{self.name}_count {cumulative}")
+        return lines
+
+
+pool_checkout_seconds = Histogram(
+    "pc_builder_db_pool_checkout_seconds", "Time spent getting a connection from the pool, including connecting."
+)
+pool_overflow_checkouts = Counter(
+    "pc_builder_db_pool_overflow_checkouts_total", "Checkouts served by an overflow connection beyond pool_size."
+)
+pool_timeouts = Counter("pc_builder_db_pool_timeouts_total", "Checkouts that gave up after pool_timeout.")
+statement_seconds = Histogram("pc_builder_db_statement_seconds", "Execution time of SQL statements.")
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait for a connection and how often the pool runs out."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_timeouts.inc()
+            raise
+        finally:
+            pool_checkout_seconds.observe(time.perf_counter() - started)
+
+        if self.checkedout() > self.size():
+            pool_overflow_checkouts.inc()
+        return connection
+
+
+def instrument_statements(engine):
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_statement(conn, cursor, statement, parameters, context, executemany):
+        conn.info["statement_started"] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def finish_statement(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.pop("statement_started", None)
+        if started is not None:
+            statement_seconds.observe(time.perf_counter() - started)
+
+
+def pool_gauges(pool):
+    gauges = [
+        ("pc_builder_db_pool_size", "Configured number of persistent connections.", pool.size()),
+        ("pc_builder_db_pool_checked_out", "Connections currently in use.", pool.checkedout()),
+        ("pc_builder_db_pool_checked_in", "Idle connections in the pool.", pool.checkedin()),
+        ("pc_builder_db_pool_overflow", "Overflow connections currently open.", max(pool.overflow(), 0)),
+    ]
+    lines = []
+    for name, help_text, value in gauges:
+        lines.extend([f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {value}"])
+    return lines
+
+
+def render_metrics(engine):
+    lines = pool_gauges(engine.pool)
+    for metric in (pool_checkout_seconds, pool_overflow_checkouts, pool_timeouts, statement_seconds):
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def init_metrics(app, engine):
+    @app.route("/metrics")
+    def metrics():
+        """Pool and statement metrics in the Prometheus text format."""
+        return Response(render_metrics(engine), mimetype="text/plain; version=0.0.4")
@@ -0,0 +1,28 @@
+from loguru import logger
+from sqlalchemy import text
+
+from alembic import op
+
+INDEX_STATE = text(
+    """
+    SELECT i.indisvalid FROM pg_index AS i
+    JOIN pg_class AS c ON c.oid = i.indexrelid
+    WHERE c.relname = :name AND c.relnamespace = current_schema()::regnamespace
+    """
+)
+
+
+def create_index_concurrently(name, table, columns, **kwargs):
+    """
+    CREATE INDEX CONCURRENTLY that can be re-run after a failed build.
+
+    A failed concurrent build leaves an INVALID index behind, which IF NOT EXISTS would accept as done:
+    such an index is dropped and built again, a valid one is kept. Must run inside `autocommit_block()`.
+    """
+    valid = op.get_bind().execute(INDEX_STATE, {"name": name}).scalar()
+    if valid:
+        return
+    if valid is not None:
+        logger.warning(f"Index {name} was left invalid by an interrupted build, rebuilding it.")
+        op.drop_index(name, table_name=table, postgresql_concurrently=True)
+    op.create_index(name, table, columns, postgresql_concurrently=True, **kwargs)
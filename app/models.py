@@ -1,7 +1,7 @@
 from datetime import UTC, datetime
 from typing import ClassVar
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, text
+from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Index, String, text
 from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,7 +12,11 @@ class AssemblyComponentAssociation(Base):
     __tablename__ = "assembly_component_association"
 
     assembly_id: Mapped[int] = mapped_column(ForeignKey("assemblies.id", ondelete="CASCADE"), primary_key=True)
-    component_id: Mapped[int] = mapped_column(ForeignKey("components.id", ondelete="CASCADE"), primary_key=True)
+    component_id: Mapped[int] = mapped_column(
+        ForeignKey("components.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
     quantity: Mapped[int] = mapped_column(default=1, nullable=False)
 
     assembly: Mapped["Assembly"] = relationship(back_populates="components_association")
@@ -48,6 +52,8 @@ class Brand(Base):
 
     components: Mapped[list["Component"]] = relationship(back_populates="brand_rel")
 
+    __table_args__ = (Index("ix_brands_component_type_name", "component_type", "name"),)
+
 
 class Assembly(Base):
     __tablename__ = "assemblies"
@@ -77,7 +83,7 @@ class Component(Base):
     __tablename__ = "components"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    brand_id: Mapped[int] = mapped_column(ForeignKey("brands.id", ondelete="CASCADE"), nullable=False)
+    brand_id: Mapped[int] = mapped_column(ForeignKey("brands.id", ondelete="CASCADE"), nullable=False, index=True)
     model: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
     quantity: Mapped[int] = mapped_column(default=1, nullable=False)
     component_type: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -92,6 +98,17 @@ class Component(Base):
         "polymorphic_on": component_type,
         "polymorphic_identity": "component",
     }
+    __table_args__ = (
+        # Catalog sort order and keyset pagination key
+        Index("ix_components_type_brand_model", "component_type", "brand_id", "model"),
+        # Substring (ILIKE) and similarity search on model names, needs the pg_trgm extension
+        Index(
+            "ix_components_model_trgm",
+            "model",
+            postgresql_using="gin",
+            postgresql_ops={"model": "gin_trgm_ops"},
+        ),
+    )
 
     brand_rel: Mapped["Brand"] = relationship(back_populates="components", lazy="joined")
 
@@ -106,13 +123,16 @@ class Motherboard(Component):
     __tablename__ = "motherboards"
 
     id: Mapped[int] = mapped_column(ForeignKey("components.id", ondelete="CASCADE"), primary_key=True)
-    socket_type_id: Mapped[int] = mapped_column(ForeignKey("socket_types.id"), nullable=False)
-    memory_type_id: Mapped[int] = mapped_column(ForeignKey("memory_types.id"), nullable=False)
+    socket_type_id: Mapped[int] = mapped_column(ForeignKey("socket_types.id"), nullable=False, index=True)
+    memory_type_id: Mapped[int] = mapped_column(ForeignKey("memory_types.id"), nullable=False, index=True)
     has_integrated_graphics: Mapped[bool] = mapped_column(Boolean, default=False)
 
     socket_type_rel: Mapped["SocketType"] = relationship(back_populates="motherboards", lazy="joined")
     memory_type_rel: Mapped["MemoryType"] = relationship(back_populates="motherboards", lazy="joined")
 
+    __table_args__ = (
+        Index("ix_motherboards_integrated_graphics", "id", postgresql_where=text("has_integrated_graphics")),
+    )
     __mapper_args__: ClassVar[dict] = {
         "polymorphic_identity": "motherboard",
     }
@@ -122,13 +142,19 @@ class CPU(Component):
     __tablename__ = "cpus"
 
     id: Mapped[int] = mapped_column(ForeignKey("components.id", ondelete="CASCADE"), primary_key=True)
-    socket_type_id: Mapped[int] = mapped_column(ForeignKey("socket_types.id"), nullable=False)
+    socket_type_id: Mapped[int] = mapped_column(ForeignKey("socket_types.id"), nullable=False, index=True)
     cores: Mapped[int] = mapped_column(nullable=False)
     threads: Mapped[int] = mapped_column(nullable=False)
     has_integrated_graphics: Mapped[bool] = mapped_column(default=False)
 
     socket_type_rel: Mapped["SocketType"] = relationship(back_populates="cpus", lazy="joined")
 
+    # Spec filters, see app/queries.py:SPEC_FILTERS; `id` makes the semi-joins index-only
+    __table_args__ = (
+        Index("ix_cpus_cores", "cores", "id"),
+        Index("ix_cpus_threads", "threads", "id"),
+        Index("ix_cpus_integrated_graphics", "id", postgresql_where=text("has_integrated_graphics")),
+    )
     __mapper_args__: ClassVar[dict] = {
         "polymorphic_identity": "cpu",
     }
@@ -141,6 +167,7 @@ class GPU(Component):
     vram: Mapped[int] = mapped_column(nullable=False)
     temperature: Mapped[int] = mapped_column(nullable=True)
 
+    __table_args__ = (Index("ix_gpus_vram", "vram", "id"),)
     __mapper_args__: ClassVar[dict] = {
         "polymorphic_identity": "gpu",
     }
@@ -152,6 +179,7 @@ class Soundcard(Component):
     id: Mapped[int] = mapped_column(ForeignKey("components.id", ondelete="CASCADE"), primary_key=True)
     channels_quantity: Mapped[int] = mapped_column(nullable=False)
 
+    __table_args__ = (Index("ix_soundcards_channels_quantity", "channels_quantity", "id"),)
     __mapper_args__: ClassVar[dict] = {
         "polymorphic_identity": "soundcard",
     }
@@ -161,12 +189,42 @@ class RAM(Component):
     __tablename__ = "rams"
 
     id: Mapped[int] = mapped_column(ForeignKey("components.id", ondelete="CASCADE"), primary_key=True)
-    memory_type_id: Mapped[int] = mapped_column(ForeignKey("memory_types.id"), nullable=False)
+    memory_type_id: Mapped[int] = mapped_column(ForeignKey("memory_types.id"), nullable=False, index=True)
     capacity: Mapped[int] = mapped_column(nullable=False)
     frequency: Mapped[int] = mapped_column(nullable=False)
 
     memory_type_rel: Mapped["MemoryType"] = relationship(back_populates="rams", lazy="joined")
 
+    __table_args__ = (
+        Index("ix_rams_capacity", "capacity", "id"),
+        Index("ix_rams_frequency", "frequency", "id"),
+    )
     __mapper_args__: ClassVar[dict] = {
         "polymorphic_identity": "ram",
     }
+
+
+class SeedFingerprint(Base):
+    __tablename__ = "seed_fingerprints"
+
+    fingerprint: Mapped[str] = mapped_column(String(64), primary_key=True)
+    applied_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=text("TIMEZONE('utc', now())"))
+
+
+class CacheVersion(Base):
+    __tablename__ = "cache_versions"
+
+    scope: Mapped[str] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=text("TIMEZONE('utc', now())"))
+
+
+class ComponentFacetCount(Base):
+    """Catalog facet counts, maintained by triggers (see the component_facet_counts migration)."""
+
+    __tablename__ = "component_facet_counts"
+
+    component_type: Mapped[str] = mapped_column(String(50), primary_key=True)
+    facet: Mapped[str] = mapped_column(String(50), primary_key=True)
+    value_id: Mapped[int] = mapped_column(primary_key=True)
+    count: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
@@ -0,0 +1,62 @@
+import base64
+import binascii
+import json
+
+from sqlalchemy import tuple_
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(values):
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor, columns):
+    """Sort key values of a cursor, checked against the types of the sort `columns`."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError("Malformed cursor") from e
+
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise InvalidCursorError("Malformed cursor")
+    for value, column in zip(values, columns):
+        expected = column.type.python_type
+        # A tampered value must fail here with a 400, not in the database driver; JSON true is an int to Python
+        if not isinstance(value, expected) or (isinstance(value, bool) and expected is not bool):
+            raise InvalidCursorError("Malformed cursor")
+    return values
+
+
+def get_page_size(value, default=DEFAULT_PAGE_SIZE):
+    try:
+        size = int(value) if value is not None else default
+    except (TypeError, ValueError):
+        size = default
+    return min(max(size, 1), MAX_PAGE_SIZE)
+
+
+def keyset_page(session, query, columns, cursor=None, limit=DEFAULT_PAGE_SIZE, key=None):
+    """
+    Return `(rows, next_cursor)` for the page of the `query` select that follows `cursor`.
+
+    `columns` is the sort key and must be unique as a tuple; the page is selected with a row comparison
+    `(c1, c2, ...) > (v1, v2, ...)`, so every page costs an index range scan regardless of its depth.
+    `key` extracts the sort key values from a row and defaults to reading the column names off the row.
+    """
+    if cursor:
+        query = query.where(tuple_(*columns) > tuple_(*decode_cursor(cursor, columns)))
+
+    rows = session.execute(query.order_by(*columns).limit(limit + 1)).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    key = key or (lambda row: [getattr(row, column.key) for column in columns])
+    return rows, encode_cursor(key(rows[-1]))
@@ -0,0 +1,305 @@
+import operator
+from typing import NamedTuple
+
+from sqlalchemy import func, select, union_all
+
+from app.models import (
+    CPU,
+    GPU,
+    RAM,
+    Assembly,
+    AssemblyComponentAssociation,
+    Brand,
+    Component,
+    MemoryType,
+    Motherboard,
+    SocketType,
+    Soundcard,
+)
+
+components = Component.__table__
+motherboards = Motherboard.__table__
+cpus = CPU.__table__
+gpus = GPU.__table__
+rams = RAM.__table__
+soundcards = Soundcard.__table__
+
+
+def component_sort_columns(entity=components.c):
+    return entity.component_type, entity.brand_id, entity.model
+
+
+def filter_components(query, entity=components.c, component_type=None, brand_id=None):
+    if component_type:
+        query = query.filter(entity.component_type == component_type)
+
+    if brand_id:
+        query = query.filter(entity.brand_id == int(brand_id))
+
+    return query
+
+
+class SpecFilter(NamedTuple):
+    field: str
+    operation: object  # binary operator, or None for "value in set"
+    type: type
+    description: str
+
+
+# Per-type columns a spec field lives in; a filter matches components of any of these types
+SPEC_COLUMNS = {
+    "cores": (cpus.c.cores,),
+    "threads": (cpus.c.threads,),
+    "has_integrated_graphics": (motherboards.c.has_integrated_graphics, cpus.c.has_integrated_graphics),
+    "socket_type_id": (motherboards.c.socket_type_id, cpus.c.socket_type_id),
+    "memory_type_id": (motherboards.c.memory_type_id, rams.c.memory_type_id),
+    "vram": (gpus.c.vram,),
+    "capacity": (rams.c.capacity,),
+    "frequency": (rams.c.frequency,),
+    "channels_quantity": (soundcards.c.channels_quantity,),
+}
+
+SPEC_FILTERS = {
+    "min_cores": SpecFilter("cores", operator.ge, int, "Минимальное количество ядер CPU"),
+    "max_cores": SpecFilter("cores", operator.le, int, "Максимальное количество ядер CPU"),
+    "min_threads": SpecFilter("threads", operator.ge, int, "Минимальное количество потоков CPU"),
+    "max_threads": SpecFilter("threads", operator.le, int, "Максимальное количество потоков CPU"),
+    "has_integrated_graphics": SpecFilter(
+        "has_integrated_graphics", operator.eq, bool, "Наличие встроенной графики (CPU и материнские платы)"
+    ),
+    "socket_type_id": SpecFilter("socket_type_id", None, int, "ID типов сокета (можно несколько)"),
+    "memory_type_id": SpecFilter("memory_type_id", None, int, "ID типов памяти (можно несколько)"),
+    "min_vram": SpecFilter("vram", operator.ge, int, "Минимальный объем видеопамяти в ГБ"),
+    "max_vram": SpecFilter("vram", operator.le, int, "Максимальный объем видеопамяти в ГБ"),
+    "min_capacity": SpecFilter("capacity", operator.ge, int, "Минимальный объем RAM в ГБ"),
+    "max_capacity": SpecFilter("capacity", operator.le, int, "Максимальный объем RAM в ГБ"),
+    "min_frequency": SpecFilter("frequency", operator.ge, int, "Минимальная частота RAM в МГц"),
+    "max_frequency": SpecFilter("frequency", operator.le, int, "Максимальная частота RAM в МГц"),
+    "min_channels": SpecFilter("channels_quantity", operator.ge, int, "Минимальное количество каналов"),
+    "max_channels": SpecFilter("channels_quantity", operator.le, int, "Максимальное количество каналов"),
+}
+
+BOOLEAN_VALUES = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "on": True,
+    "false": False,
+    "0": False,
+    "no": False,
+    "off": False,
+}
+
+
+def parse_spec_filters(args):
+    """Read spec filters from request args (a MultiDict); raises ValueError for malformed values."""
+    filters = {}
+    for name, spec in SPEC_FILTERS.items():
+        values = [value for value in args.getlist(name) if value != ""]
+        if not values:
+            continue
+        if spec.type is bool:
+            if values[0].lower() not in BOOLEAN_VALUES:
+                raise ValueError(f"{name} must be a boolean")
+            values = [BOOLEAN_VALUES[value.lower()] for value in values]
+        else:
+            values = [spec.type(value) for value in values]
+        filters[name] = values if spec.operation is None else values[0]
+    return filters
+
+
+def filter_specs(query, filters, entity=components.c):
+    """
+    Apply `SPEC_FILTERS` as semi-joins against the per-type tables.
+
+    Every filter becomes `id IN (SELECT id FROM <type table> WHERE <condition>)`, so it is answered from
+    that table's spec index instead of the outer-joined catalog projection.
+    """
+    for name, value in filters.items():
+        if value is None or value == []:
+            continue
+
+        spec = SPEC_FILTERS[name]
+        matches = [
+            select(column.table.c.id).where(
+                column.in_(value) if spec.operation is None else spec.operation(column, value)
+            )
+            for column in SPEC_COLUMNS[spec.field]
+        ]
+        query = query.where(entity.id.in_(matches[0] if len(matches) == 1 else union_all(*matches)))
+    return query
+
+
+def component_rows_query():
+    """
+    Flat, read-only projection of the catalog: one row per component with the per-type columns
+    and brand/socket/memory type names joined in SQL.
+    """
+    return (
+        select(
+            components.c.id,
+            components.c.component_type,
+            components.c.brand_id,
+            components.c.model,
+            components.c.quantity,
+            components.c.created_at,
+            components.c.updated_at,
+            Brand.name.label("brand_name"),
+            func.coalesce(motherboards.c.socket_type_id, cpus.c.socket_type_id).label("socket_type_id"),
+            func.coalesce(motherboards.c.memory_type_id, rams.c.memory_type_id).label("memory_type_id"),
+            SocketType.name.label("socket_type"),
+            MemoryType.name.label("memory_type"),
+            func.coalesce(motherboards.c.has_integrated_graphics, cpus.c.has_integrated_graphics).label(
+                "has_integrated_graphics"
+            ),
+            cpus.c.cores,
+            cpus.c.threads,
+            gpus.c.vram,
+            rams.c.capacity,
+            rams.c.frequency,
+            soundcards.c.channels_quantity,
+        )
+        .select_from(components)
+        .join(Brand.__table__, Brand.id == components.c.brand_id)
+        .outerjoin(motherboards, motherboards.c.id == components.c.id)
+        .outerjoin(cpus, cpus.c.id == components.c.id)
+        .outerjoin(gpus, gpus.c.id == components.c.id)
+        .outerjoin(rams, rams.c.id == components.c.id)
+        .outerjoin(soundcards, soundcards.c.id == components.c.id)
+        .outerjoin(
+            SocketType.__table__,
+            SocketType.id == func.coalesce(motherboards.c.socket_type_id, cpus.c.socket_type_id),
+        )
+        .outerjoin(
+            MemoryType.__table__,
+            MemoryType.id == func.coalesce(motherboards.c.memory_type_id, rams.c.memory_type_id),
+        )
+    )
+
+
+def projection_columns():
+    """`field -> (column, per-type tables it reads)` of the component fields exposed by the API."""
+    return {
+        "id": (components.c.id, ()),
+        "component_type": (components.c.component_type, ()),
+        "brand_id": (components.c.brand_id, ()),
+        "model": (components.c.model, ()),
+        "quantity": (components.c.quantity, ()),
+        "created_at": (components.c.created_at, ()),
+        "updated_at": (components.c.updated_at, ()),
+        "socket_type_id": (
+            func.coalesce(motherboards.c.socket_type_id, cpus.c.socket_type_id),
+            (motherboards, cpus),
+        ),
+        "memory_type_id": (
+            func.coalesce(motherboards.c.memory_type_id, rams.c.memory_type_id),
+            (motherboards, rams),
+        ),
+        "has_integrated_graphics": (
+            func.coalesce(motherboards.c.has_integrated_graphics, cpus.c.has_integrated_graphics),
+            (motherboards, cpus),
+        ),
+        "cores": (cpus.c.cores, (cpus,)),
+        "threads": (cpus.c.threads, (cpus,)),
+        "vram": (gpus.c.vram, (gpus,)),
+        "capacity": (rams.c.capacity, (rams,)),
+        "frequency": (rams.c.frequency, (rams,)),
+        "channels_quantity": (soundcards.c.channels_quantity, (soundcards,)),
+    }
+
+
+# Lookups that can be embedded into a component: name -> (table, join field, embedded columns)
+PROJECTION_INCLUDES = {
+    "brand": (Brand.__table__, "brand_id", ("id", "name")),
+    "socket": (SocketType.__table__, "socket_type_id", ("id", "name")),
+    "memory_type": (MemoryType.__table__, "memory_type_id", ("id", "name")),
+}
+
+
+def component_projection(fields=None, include=()):
+    """
+    Select only the requested component `fields` (all by default) and the `include`d lookups.
+
+    Only the per-type and lookup tables those columns need are joined, so an id-only lookup reads just
+    `components`. Embedded lookup columns are labelled `<include>__<column>`. Raises ValueError for
+    unknown names.
+    """
+    available = projection_columns()
+    fields = list(fields or available)
+    unknown = [name for name in fields if name not in available] + [
+        name for name in include if name not in PROJECTION_INCLUDES
+    ]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+    columns, tables = [], []
+    for name in fields:
+        column, sources = available[name]
+        columns.append(column.label(name))
+        tables.extend(table for table in sources if table not in tables)
+
+    lookups = []
+    for name in include:
+        table, field, lookup_columns = PROJECTION_INCLUDES[name]
+        join_column, sources = available[field]
+        tables.extend(table for table in sources if table not in tables)
+        lookups.append((table, join_column))
+        columns.extend(table.c[column].label(f"{name}__{column}") for column in lookup_columns)
+
+    query = select(*columns).select_from(components)
+    for table in tables:
+        query = query.outerjoin(table, table.c.id == components.c.id)
+    for table, join_column in lookups:
+        query = query.outerjoin(table, table.c.id == join_column)
+    return query
+
+
+def brand_rows(session, component_type=None):
+    query = select(Brand.id, Brand.name, Brand.component_type)
+    if component_type:
+        query = query.where(Brand.component_type == component_type).order_by(Brand.name)
+    else:
+        query = query.order_by(Brand.component_type, Brand.name)
+    return session.execute(query).all()
+
+
+def socket_type_rows(session):
+    return session.execute(select(SocketType.id, SocketType.name).order_by(SocketType.name)).all()
+
+
+def memory_type_rows(session):
+    return session.execute(select(MemoryType.id, MemoryType.name).order_by(MemoryType.name)).all()
+
+
+class AssemblySummary:
+    __slots__ = ("components", "created_at", "id", "name", "quantity", "updated_at")
+
+    def __init__(self, id, name, quantity, created_at, updated_at):
+        self.id = id
+        self.name = name
+        self.quantity = quantity
+        self.created_at = created_at
+        self.updated_at = updated_at
+        # component_type -> component row, see component_rows_query()
+        self.components = {}
+
+
+def assembly_summaries(session):
+    assemblies = {
+        row.id: AssemblySummary(*row)
+        for row in session.execute(
+            select(Assembly.id, Assembly.name, Assembly.quantity, Assembly.created_at, Assembly.updated_at).order_by(
+                Assembly.id
+            )
+        )
+    }
+
+    association = AssemblyComponentAssociation.__table__
+    parts = component_rows_query().add_columns(association.c.assembly_id).join(
+        association, association.c.component_id == components.c.id
+    )
+    for row in session.execute(parts):
+        if row.assembly_id in assemblies:
+            assemblies[row.assembly_id].components.setdefault(row.component_type, row)
+
+    return list(assemblies.values())
@@ -0,0 +1,112 @@
+from sqlalchemy import select, text, tuple_
+from sqlalchemy.dialects import postgresql
+
+from app.models import (
+    CPU,
+    GPU,
+    RAM,
+    AssemblyComponentAssociation,
+    Brand,
+    Component,
+    Motherboard,
+)
+from app.queries import components
+from app.search import search_components
+
+
+def hot_queries():
+    """(description, statement, index the planner is expected to use) for the queries behind the routes."""
+    catalog_order = (Component.component_type, Component.brand_id, Component.model)
+    return [
+        (
+            "catalog page filtered by type",
+            select(Component.id).where(Component.component_type == "cpu").order_by(*catalog_order).limit(51),
+            "ix_components_type_brand_model",
+        ),
+        (
+            "catalog keyset page",
+            select(Component.id)
+            .where(tuple_(*catalog_order) > tuple_("cpu", 1, "A"))
+            .order_by(*catalog_order)
+            .limit(51),
+            "ix_components_type_brand_model",
+        ),
+        (
+            "catalog filtered by brand / brand delete check",
+            select(Component.id).where(Component.brand_id == 1),
+            "ix_components_brand_id",
+        ),
+        (
+            "brand choices for a component type",
+            select(Brand.id, Brand.name).where(Brand.component_type == "cpu").order_by(Brand.name),
+            "ix_brands_component_type_name",
+        ),
+        ("CPUs by socket", select(CPU.__table__.c.id).where(CPU.socket_type_id == 1), "ix_cpus_socket_type_id"),
+        (
+            "motherboards by socket",
+            select(Motherboard.__table__.c.id).where(Motherboard.socket_type_id == 1),
+            "ix_motherboards_socket_type_id",
+        ),
+        (
+            "motherboards by memory type",
+            select(Motherboard.__table__.c.id).where(Motherboard.memory_type_id == 1),
+            "ix_motherboards_memory_type_id",
+        ),
+        (
+            "RAM by memory type",
+            select(RAM.__table__.c.id).where(RAM.memory_type_id == 1),
+            "ix_rams_memory_type_id",
+        ),
+        ("CPUs by minimum cores", select(CPU.__table__.c.id).where(CPU.cores >= 8), "ix_cpus_cores"),
+        ("GPUs by minimum VRAM", select(GPU.__table__.c.id).where(GPU.vram >= 8), "ix_gpus_vram"),
+        ("RAM by minimum capacity", select(RAM.__table__.c.id).where(RAM.capacity >= 16), "ix_rams_capacity"),
+        (
+            "CPUs with integrated graphics",
+            select(CPU.__table__.c.id).where(CPU.has_integrated_graphics),
+            "ix_cpus_integrated_graphics",
+        ),
+        # The composed query the catalog, the API list and ranked search run: every arm of the per-word OR
+        # must be an index condition for the planner to build a BitmapOr instead of scanning components
+        (
+            "catalog search, model arms",
+            search_components(select(components.c.id), "rtx strixx"),
+            "ix_components_model_trgm",
+        ),
+        (
+            "catalog search, brand arm",
+            search_components(select(components.c.id), "rtx strixx"),
+            "ix_components_brand_id",
+        ),
+        (
+            "assemblies using a component",
+            select(AssemblyComponentAssociation.assembly_id).where(AssemblyComponentAssociation.component_id == 1),
+            "ix_assembly_component_association_component_id",
+        ),
+    ]
+
+
+def plan_index_names(plan):
+    names = set()
+    if "Index Name" in plan:
+        names.add(plan["Index Name"])
+    for child in plan.get("Plans", []):
+        names |= plan_index_names(child)
+    return names
+
+
+def check_query_plans(connection):
+    """
+    EXPLAIN every hot query and return `(description, expected_index, used_indexes, ok)` tuples.
+
+    Sequential scans are disabled for the check: on a small development database the planner
+    rightly prefers them, which would hide whether a usable index exists at all.
+    """
+    results = []
+    with connection.begin():
+        connection.execute(text("SET LOCAL enable_seqscan = off"))
+        for description, statement, expected in hot_queries():
+            sql = statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+            plan = connection.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar_one()[0]["Plan"]
+            used = plan_index_names(plan)
+            results.append((description, expected, used, expected in used))
+    return results
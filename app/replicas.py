@@ -0,0 +1,120 @@
+import itertools
+import threading
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+PRIMARY_LSN_QUERY = text("SELECT pg_current_wal_lsn()::text")
+# Replication state of a replica relative to a WAL position the primary had reached just before the check
+REPLICA_STATE_QUERY = text(
+    """
+    SELECT
+        pg_wal_lsn_diff(CAST(:primary_lsn AS pg_lsn), pg_last_wal_replay_lsn()) AS gap,
+        EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) AS replay_age,
+        pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() AS replayed_received
+    """
+)
+
+
+def replica_lag(gap, replay_age, replayed_received, max_gap, was_behind):
+    """
+    Lag in seconds from one check, or None when it cannot be trusted.
+
+    A replica within `max_gap` bytes of the primary's position is current: a quiet primary keeps writing
+    checkpoint and running-xacts records, so an exact match would rarely be seen. Only when the gap stayed
+    above `max_gap` since the previous check (`was_behind`) does the age of the last replayed transaction
+    count; that also catches a replica whose WAL receiver is disconnected. A replica that has not replayed
+    any transaction yet has no such age and counts as current once it replayed all it received.
+    """
+    if gap is None:
+        return None
+    if gap <= max_gap or not was_behind:
+        return 0.0
+    if replay_age is None:
+        return 0.0 if replayed_received else None
+    return float(replay_age)
+
+
+class ReplicaSet:
+    """
+    Read replicas and their replication lag.
+
+    A background thread compares every replica with the `primary` each `check_interval` seconds (see
+    `replica_lag()`). Reads are spread round-robin over the replicas that answered the last check within
+    `max_lag` seconds; when none did, `choose()` returns None and the caller falls back to the primary. Until
+    the first check completes no replica is used.
+    """
+
+    def __init__(self, primary, engines, max_lag=5.0, max_gap=16 * 1024 * 1024, check_interval=2.0):
+        self.primary = primary
+        self.engines = engines
+        self.max_lag = max_lag
+        self.max_gap = max_gap
+        self.check_interval = check_interval
+        self._available = []
+        self._behind = set()
+        self._next = itertools.count()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @property
+    def read_your_writes_window(self):
+        """How long a client that wrote keeps reading from the primary: the worst lag a replica may still have."""
+        return self.max_lag + self.check_interval
+
+    def start(self):
+        if self.engines and self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="replica-lag", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+
+    def choose(self):
+        """A replica engine fit for reads, or None."""
+        available = self._available
+        if not available:
+            return None
+        return available[next(self._next) % len(available)]
+
+    def measure_lag(self, replica, primary_lsn):
+        try:
+            with replica.connect() as connection:
+                state = connection.execute(REPLICA_STATE_QUERY, {"primary_lsn": primary_lsn}).one()
+        except SQLAlchemyError as e:
+            logger.debug(f"Replica lag check failed: {e}")
+            return None
+
+        was_behind = replica in self._behind
+        if state.gap is not None and state.gap > self.max_gap:
+            self._behind.add(replica)
+        else:
+            self._behind.discard(replica)
+        return replica_lag(state.gap, state.replay_age, state.replayed_received, self.max_gap, was_behind)
+
+    def check(self):
+        try:
+            with self.primary.connect() as connection:
+                primary_lsn = connection.execute(PRIMARY_LSN_QUERY).scalar()
+        except SQLAlchemyError as e:
+            # Without the primary's position no lag can be trusted; the primary serves reads meanwhile
+            logger.debug(f"Primary WAL position check failed: {e}")
+            self._available = []
+            return
+
+        available = []
+        for replica in self.engines:
+            lag = self.measure_lag(replica, primary_lsn)
+            if lag is not None and lag <= self.max_lag:
+                available.append(replica)
+
+        if len(available) != len(self._available):
+            logger.info(f"{len(available)} of {len(self.engines)} read replicas are within {self.max_lag}s of lag.")
+        self._available = available
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self.check()
+            self._stopped.wait(self.check_interval)
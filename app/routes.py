@@ -1,6 +1,3 @@
-import json
-import xml.etree.ElementTree as ET
-
 from flask import (
     Response,
     abort,
@@ -8,15 +5,30 @@ from flask import (
     redirect,
     render_template,
     request,
+    stream_with_context,
     url_for,
 )
 from flask_wtf.csrf import generate_csrf
 from loguru import logger
-from sqlalchemy import delete
+from sqlalchemy import delete, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import joinedload, with_polymorphic
 
-from app.database import session_factory
+from app.cache import ASSEMBLIES, CLASSIFICATORS, COMPONENTS, catalog_cache
+from app.compatibility import (
+    evaluate,
+    get_compatibility_payload,
+    refresh_compatibility_index,
+)
+from app.conditional import conditional_page
+from app.database import request_session
+from app.exports import (
+    CATALOG_EXPORT_FORMATS,
+    assembly_to_json,
+    assembly_to_txt,
+    assembly_to_xml,
+    stream_catalog,
+)
+from app.facets import facet_counts
 from app.forms import (
     AssemblySelectForm,
     BrandForm,
@@ -27,7 +39,10 @@ from app.forms import (
     RAMForm,
     SocketForm,
     SoundcardForm,
+    get_brand_choices_for,
+    get_component_choices,
     get_memory_type_choices,
+    get_socket_type_choices,
 )
 from app.models import (
     CPU,
@@ -42,76 +57,69 @@ from app.models import (
     SocketType,
     Soundcard,
 )
+from app.pagination import InvalidCursorError, get_page_size, keyset_page
+from app.queries import (
+    assembly_summaries,
+    brand_rows,
+    component_rows_query,
+    component_sort_columns,
+    filter_components,
+    filter_specs,
+    memory_type_rows,
+    parse_spec_filters,
+    socket_type_rows,
+)
+from app.search import search_components
+from app.services import write_component
 
 
-def populate_component_choices(form, session, selected_ids=None):
-    selected_ids = selected_ids or {}
+def add_component_from_form(form, component_type, label):
+    """Insert the component of a validated add form; an existing model is reported by ON CONFLICT, not an exception."""
+    try:
+        with request_session() as session:
+            write_component(session, component_type, form.data)
+    except (ValueError, SQLAlchemyError) as e:
+        flash(f"Error: {e}", "danger")
+        return False
 
-    def move_selected_first(items, selected_id):
-        if not selected_id:
-            return items
-        return sorted(items, key=lambda x: 0 if x[0] == selected_id else 1)
+    flash(f"{label} added successfully", "success")
+    return True
 
-    motherboards = session.query(Motherboard).all()
-    mb_choices = [
-        (
-            mb.id,
-            f"{mb.brand_rel.name} {mb.model} | Socket: {mb.socket_type_rel.name} | RAM: {mb.memory_type_rel.name}",
-        )
-        for mb in motherboards
-    ]
-    form.motherboard_id.choices = move_selected_first(mb_choices, selected_ids.get("motherboard_id"))
-
-    cpus = session.query(CPU).all()
-    cpu_choices = [
-        (
-            cpu.id,
-            f"{cpu.brand_rel.name} {cpu.model} | Socket: {cpu.socket_type_rel.name} | "
-            f"Cores: {cpu.cores} | Threads: {cpu.threads} | iGPU: {'Yes' if cpu.has_integrated_graphics else 'No'}",
-        )
-        for cpu in cpus
-    ]
-    form.cpu_id.choices = move_selected_first(cpu_choices, selected_ids.get("cpu_id"))
-
-    gpus = session.query(GPU).all()
-    gpu_choices = [(gpu.id, f"{gpu.brand_rel.name} {gpu.model} | VRAM: {gpu.vram}GB") for gpu in gpus]
-    form.gpu_id.choices = move_selected_first(gpu_choices, selected_ids.get("gpu_id"))
-
-    rams = session.query(RAM).all()
-    ram_choices = [
-        (
-            ram.id,
-            f"{ram.brand_rel.name} {ram.model} | {ram.memory_type_rel.name} | {ram.capacity}GB @ {ram.frequency}MHz",
-        )
-        for ram in rams
-    ]
-    form.ram_id.choices = move_selected_first(ram_choices, selected_ids.get("ram_id"))
-
-    soundcards = session.query(Soundcard).all()
-    sound_choices = [(sc.id, f"{sc.brand_rel.name} {sc.model} | Channels: {sc.channels_quantity}") for sc in soundcards]
-    form.soundcard_id.choices = move_selected_first(sound_choices, selected_ids.get("soundcard_id"))
 
+def move_selected_first(items, selected_id):
+    if selected_id:
+        for index, item in enumerate(items):
+            if item[0] == selected_id:
+                return [item, *items[:index], *items[index + 1 :]]
+    return list(items)
 
-def check_compatibility(form, session):
-    errors = []
 
-    motherboard_id = form.motherboard_id.data
-    cpu_id = form.cpu_id.data
-    ram_id = form.ram_id.data
+def populate_component_choices(form, selected_ids=None):
+    selected_ids = selected_ids or {}
 
-    motherboard = session.get(Component, motherboard_id) if motherboard_id else None
-    cpu = session.get(Component, cpu_id) if cpu_id else None
-    ram = session.get(Component, ram_id) if ram_id else None
+    for component_type in ("motherboard", "cpu", "gpu", "ram", "soundcard"):
+        field = f"{component_type}_id"
+        getattr(form, field).choices = move_selected_first(
+            get_component_choices(component_type),
+            selected_ids.get(field),
+        )
 
-    if cpu and motherboard and cpu.socket_type_id != motherboard.socket_type_id:
-        errors.append("❌ CPU and Motherboard have incompatible sockets.")
 
-    if ram and motherboard and ram.memory_type_id != motherboard.memory_type_id:
-        errors.append("❌ RAM and Motherboard have incompatible memory types.")
+def check_compatibility(form, session):
+    build = {
+        "motherboard": form.motherboard_id.data,
+        "cpu": form.cpu_id.data,
+        "ram": form.ram_id.data,
+    }
+    errors = [violation.message for violation in evaluate(session, build)]
 
     return len(errors) == 0, errors
 
 
+def compatibility_url(session):
+    return url_for("get_compatibility_data", v=get_compatibility_payload(session).etag)
+
+
 def get_selected_components_from_form(form, component_names):
     return [(getattr(form, f"{name}_id").data, getattr(form, f"{name}_quantity").data) for name in component_names]
 
@@ -134,39 +142,77 @@ def init_routes(app):
         return render_template("home.html")
 
     @app.route("/components")
+    @conditional_page(COMPONENTS, CLASSIFICATORS)
     def get_components_page():
         component_type_filter = request.args.get("component_type")
         brand_id_filter = request.args.get("brand_id")
+        search = request.args.get("q", "").strip()
+        cursor = request.args.get("cursor")
+        per_page = get_page_size(request.args.get("per_page"))
+        try:
+            spec_filters = parse_spec_filters(request.args)
+        except ValueError:
+            abort(400, description="Invalid filter value")
+
+        with request_session() as session:
+            query = filter_components(
+                component_rows_query(),
+                component_type=component_type_filter,
+                brand_id=brand_id_filter,
+            )
+            query = filter_specs(query, spec_filters)
+            query = search_components(query, search)
 
-        component_entities = with_polymorphic(Component, [Motherboard, CPU, GPU, RAM, Soundcard])
-
-        with session_factory() as session:
-            query = session.query(component_entities)
-
-            if component_type_filter:
-                query = query.filter(component_entities.component_type == component_type_filter)
-
-            if brand_id_filter:
-                query = query.filter(component_entities.brand_id == int(brand_id_filter))
-
-            components = query.order_by(
-                component_entities.component_type,
-                component_entities.brand_id,
-                component_entities.model,
-            ).all()
+            try:
+                components, next_cursor = keyset_page(
+                    session,
+                    query,
+                    component_sort_columns(),
+                    cursor=cursor,
+                    limit=per_page,
+                )
+            except InvalidCursorError:
+                abort(400, description="Invalid cursor")
 
-            all_brands = session.query(Brand).order_by(Brand.name).all()
+            all_brands = session.execute(select(Brand.id, Brand.name).order_by(Brand.name)).all()
+            facets = facet_counts(session, component_type_filter)
 
         return render_template(
             "components/components.html",
             components=components,
             brands=all_brands,
+            type_counts={item["value"]: item["count"] for item in facets["component_type"]},
+            brand_counts={item["id"]: item["count"] for item in facets["brand"]},
             selected_type=component_type_filter,
             selected_brand=brand_id_filter,
+            spec_filters=spec_filters,
+            search=search,
+            per_page=per_page,
+            is_first_page=not cursor,
+            next_cursor=next_cursor,
             csrf_token=generate_csrf(),
             active_page="components",
         )
 
+    @app.route("/components/export")
+    def export_components():
+        export_format = request.args.get("format", "ndjson")
+        if export_format not in CATALOG_EXPORT_FORMATS:
+            abort(400, description=f"Unknown export format, expected one of {', '.join(CATALOG_EXPORT_FORMATS)}")
+        component_type = request.args.get("component_type") or None
+        compress = request.args.get("gzip", "").lower() in ("1", "true", "yes", "on")
+
+        def stream():
+            with request_session() as session:
+                yield from stream_catalog(session, export_format, component_type, compress)
+
+        filename = f"components.{export_format}" + (".gz" if compress else "")
+        return Response(
+            stream_with_context(stream()),
+            mimetype="application/gzip" if compress else CATALOG_EXPORT_FORMATS[export_format],
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
+        )
+
     @app.route("/components/add", methods=["GET", "POST"])
     def add_component():
         return render_template("components/add_component.html")
@@ -174,44 +220,14 @@ def init_routes(app):
     @app.route("/components/add/motherboard", methods=["GET", "POST"])
     def add_component_motherboard():
         form = MotherboardForm()
-
-        with session_factory() as session:
-            motherboard_brands = session.query(Brand).filter_by(component_type="motherboard").order_by(Brand.name).all()
-            socket_types = session.query(SocketType).all()
-            memory_types = session.query(MemoryType).all()
-
-            form.brand_id.choices = [(b.id, b.name) for b in motherboard_brands]
-            form.socket_type_id.choices = [(s.id, s.name) for s in socket_types]
-            form.memory_type_id.choices = [(m.id, m.name) for m in memory_types]
+        form.brand_id.choices = get_brand_choices_for("motherboard")
+        form.socket_type_id.choices = get_socket_type_choices()
+        form.memory_type_id.choices = get_memory_type_choices()
 
         if form.validate_on_submit():
-            try:
-                with session_factory() as session:
-                    motherboard = Motherboard(
-                        brand_id=form.brand_id.data,
-                        model=form.model.data,
-                        quantity=form.quantity.data,
-                        socket_type_id=form.socket_type_id.data,
-                        memory_type_id=form.memory_type_id.data,
-                        has_integrated_graphics=bool(form.has_integrated_graphics.data),
-                    )
-                    session.add(motherboard)
-                    session.commit()
-                    flash("Motherboard added successfully", "success")
-                    return redirect(url_for("get_components_page"))
-            except IntegrityError as e:
-                session.rollback()
-
-                if "unique constraint" in str(e.orig).lower():
-                    flash(
-                        f'Error: Component with model "{form.model.data}" already exists.',
-                        "danger",
-                    )
-                else:
-                    flash(f"Database error: {e}", "danger")
-            except SQLAlchemyError as e:
-                flash(f"Error: {e}", "danger")
-        else:
+            if add_component_from_form(form, "motherboard", "Motherboard"):
+                return redirect(url_for("get_components_page"))
+        elif request.method == "POST":
             logger.info("❌ Form validation failed")
             logger.error(form.errors)
 
@@ -220,130 +236,58 @@ def init_routes(app):
     @app.route("/components/add/cpu", methods=["GET", "POST"])
     def add_component_cpu():
         form = CPUForm()
-        with session_factory() as session:
-            cpu_brands = session.query(Brand).filter_by(component_type="cpu").order_by(Brand.name).all()
-            socket_types = session.query(SocketType).all()
-
-            form.brand_id.choices = [(b.id, b.name) for b in cpu_brands]
-            form.socket_type_id.choices = [(s.id, s.name) for s in socket_types]
+        form.brand_id.choices = get_brand_choices_for("cpu")
+        form.socket_type_id.choices = get_socket_type_choices()
 
-        if request.method == "POST":
-            if form.validate_on_submit():
-                try:
-                    with session_factory() as session:
-                        cpu = CPU(
-                            brand_id=int(form.brand_id.data),
-                            model=form.model.data,
-                            quantity=(int(form.quantity.data) if form.quantity.data else 1),
-                            socket_type_id=int(form.socket_type_id.data),
-                            cores=int(form.cores.data),
-                            threads=int(form.threads.data),
-                            has_integrated_graphics=bool(form.has_integrated_graphics.data),
-                        )
-                        session.add(cpu)
-                        session.commit()
-                        flash("CPU added successfully", "success")
-                        return redirect(url_for("get_components_page"))
-                except SQLAlchemyError as e:
-                    flash(f"Error: {e}", "danger")
-            else:
-                logger.info("❌ Form validation failed")
-                logger.error(form.errors)
+        if form.validate_on_submit():
+            if add_component_from_form(form, "cpu", "CPU"):
+                return redirect(url_for("get_components_page"))
+        elif request.method == "POST":
+            logger.info("❌ Form validation failed")
+            logger.error(form.errors)
 
         return render_template("components/add_component_cpu.html", form=form)
 
     @app.route("/components/add/gpu", methods=["GET", "POST"])
     def add_component_gpu():
         form = GPUForm()
+        form.brand_id.choices = get_brand_choices_for("gpu")
 
-        with session_factory() as session:
-            gpu_brands = session.query(Brand).filter_by(component_type="gpu").order_by(Brand.name).all()
-
-            form.brand_id.choices = [(b.id, b.name) for b in gpu_brands]
-
-        if request.method == "POST":
-            if form.validate_on_submit():
-                try:
-                    with session_factory() as session:
-                        gpu = GPU(
-                            brand_id=int(form.brand_id.data),
-                            model=form.model.data,
-                            quantity=(int(form.quantity.data) if form.quantity.data else 1),
-                            vram=int(form.vram.data),
-                        )
-                        session.add(gpu)
-                        session.commit()
-                        flash("GPU added successfully", "success")
-                        return redirect(url_for("get_components_page"))
-                except SQLAlchemyError as e:
-                    flash(f"Error: {e}", "danger")
-            else:
-                logger.info("❌ Form validation failed")
-                logger.error(form.errors)
+        if form.validate_on_submit():
+            if add_component_from_form(form, "gpu", "GPU"):
+                return redirect(url_for("get_components_page"))
+        elif request.method == "POST":
+            logger.info("❌ Form validation failed")
+            logger.error(form.errors)
 
         return render_template("components/add_component_gpu.html", form=form)
 
     @app.route("/components/add/ram", methods=["GET", "POST"])
     def add_component_ram():
         form = RAMForm()
+        form.brand_id.choices = get_brand_choices_for("ram")
+        form.memory_type_id.choices = get_memory_type_choices()
 
-        with session_factory() as session:
-            ram_brands = session.query(Brand).filter_by(component_type="ram").order_by(Brand.name).all()
-            memory_types = session.query(MemoryType).all()
-            form.brand_id.choices = [(b.id, b.name) for b in ram_brands]
-            form.memory_type_id.choices = [(m.id, m.name) for m in memory_types]
-
-        if request.method == "POST":
-            if form.validate_on_submit():
-                try:
-                    with session_factory() as session:
-                        ram = RAM(
-                            brand_id=form.brand_id.data,
-                            model=form.model.data,
-                            quantity=form.quantity.data,
-                            memory_type_id=form.memory_type_id.data,
-                            capacity=form.capacity.data,
-                            frequency=form.frequency.data,
-                        )
-                        session.add(ram)
-                        session.commit()
-                        flash("RAM added successfully", "success")
-                        return redirect(url_for("get_components_page"))
-                except SQLAlchemyError as e:
-                    flash(f"Error: {e}", "danger")
-            else:
-                logger.info("❌ Form validation failed")
-                logger.error(form.errors)
+        if form.validate_on_submit():
+            if add_component_from_form(form, "ram", "RAM"):
+                return redirect(url_for("get_components_page"))
+        elif request.method == "POST":
+            logger.info("❌ Form validation failed")
+            logger.error(form.errors)
 
         return render_template("components/add_component_ram.html", form=form)
 
     @app.route("/components/add/soundcard", methods=["GET", "POST"])
     def add_component_soundcard():
         form = SoundcardForm()
+        form.brand_id.choices = get_brand_choices_for("soundcard")
 
-        with session_factory() as session:
-            soundcard_brands = session.query(Brand).filter_by(component_type="soundcard").order_by(Brand.name).all()
-            form.brand_id.choices = [(b.id, b.name) for b in soundcard_brands]
-
-        if request.method == "POST":
-            if form.validate_on_submit():
-                try:
-                    with session_factory() as session:
-                        soundcard = Soundcard(
-                            brand_id=int(form.brand_id.data),
-                            model=form.model.data,
-                            quantity=(int(form.quantity.data) if form.quantity.data else 1),
-                            channels_quantity=int(form.channels_quantity.data),
-                        )
-                        session.add(soundcard)
-                        session.commit()
-                        flash("Soundcard added successfully", "success")
-                        return redirect(url_for("get_components_page"))
-                except SQLAlchemyError as e:
-                    flash(f"Error: {e}", "danger")
-            else:
-                logger.info("❌ Form validation failed")
-                logger.error(form.errors)
+        if form.validate_on_submit():
+            if add_component_from_form(form, "soundcard", "Soundcard"):
+                return redirect(url_for("get_components_page"))
+        elif request.method == "POST":
+            logger.info("❌ Form validation failed")
+            logger.error(form.errors)
 
         return render_template("components/add_component_soundcard.html", form=form)
 
@@ -351,51 +295,40 @@ def init_routes(app):
     def edit_component(component_id):
         form = None
 
-        with session_factory() as session:
+        with request_session() as session:
             component = session.get(Component, component_id)
 
             if not component:
                 abort(404, description="Component not found")
 
             if component.component_type == "motherboard":
-                motherboard_brands = (
-                    session.query(Brand).filter_by(component_type="motherboard").order_by(Brand.name).all()
-                )
-                socket_types = session.query(SocketType).order_by(SocketType.name).all()
-                memory_types = session.query(MemoryType).order_by(MemoryType.name).all()
                 form = MotherboardForm(obj=component)
-                form.socket_type_id.choices = [(s.id, s.name) for s in socket_types]
-                form.memory_type_id.choices = [(m.id, m.name) for m in memory_types]
-                form.brand_id.choices = [(b.id, b.name) for b in motherboard_brands]
+                form.socket_type_id.choices = get_socket_type_choices()
+                form.memory_type_id.choices = get_memory_type_choices()
 
             elif component.component_type == "cpu":
-                cpu_brands = session.query(Brand).filter_by(component_type="cpu").order_by(Brand.name).all()
-                socket_types = session.query(SocketType).order_by(SocketType.name).all()
                 form = CPUForm(obj=component)
-                form.socket_type_id.choices = [(s.id, s.name) for s in socket_types]
-                form.brand_id.choices = [(b.id, b.name) for b in cpu_brands]
+                form.socket_type_id.choices = get_socket_type_choices()
 
             elif component.component_type == "ram":
-                ram_brands = session.query(Brand).filter_by(component_type="ram").order_by(Brand.name).all()
-                memory_types = session.query(MemoryType).order_by(MemoryType.name).all()
                 form = RAMForm(obj=component)
-                form.memory_type_id.choices = [(m.id, m.name) for m in memory_types]
-                form.brand_id.choices = [(b.id, b.name) for b in ram_brands]
+                form.memory_type_id.choices = get_memory_type_choices()
 
             elif component.component_type == "gpu":
-                gpu_brands = session.query(Brand).filter_by(component_type="gpu").order_by(Brand.name).all()
                 form = GPUForm(obj=component)
-                form.brand_id.choices = [(b.id, b.name) for b in gpu_brands]
 
             elif component.component_type == "soundcard":
-                soundcard_brands = session.query(Brand).filter_by(component_type="soundcard").order_by(Brand.name).all()
                 form = SoundcardForm(obj=component)
-                form.brand_id.choices = [(b.id, b.name) for b in soundcard_brands]
+
+            if form is not None:
+                form.brand_id.choices = get_brand_choices_for(component.component_type)
 
             if form is not None and form.validate_on_submit():
                 try:
                     form.populate_obj(component)
                     session.commit()
+                    catalog_cache.bump(COMPONENTS)
+                    refresh_compatibility_index(session, [component.id])
                     flash("The component has been edited successfully.", "success")
                     return redirect(url_for("get_components_page"))
                 except SQLAlchemyError as e:
@@ -413,7 +346,7 @@ def init_routes(app):
     @app.route("/components/<int:component_id>/delete", methods=["POST"])
     def delete_component(component_id):
         try:
-            with session_factory() as session:
+            with request_session() as session:
                 component = session.get(Component, component_id)
 
                 if not component:
@@ -436,6 +369,8 @@ def init_routes(app):
 
                 session.delete(component)
                 session.commit()
+                catalog_cache.bump(COMPONENTS)
+                refresh_compatibility_index(session, [component_id])
                 flash("The component has been successfully removed.", "success")
         except SQLAlchemyError as e:
             session.rollback()
@@ -445,12 +380,13 @@ def init_routes(app):
         return redirect(url_for("get_components_page"))
 
     @app.route("/classificators", methods=["GET", "POST"])
+    @conditional_page(CLASSIFICATORS)
     def get_classificators_page():
         brand_form = BrandForm(prefix="brand")
         socket_form = SocketForm(prefix="socket")
         memory_form = MemoryTypeForm(prefix="memory")
 
-        with session_factory() as session:
+        with request_session() as session:
             if request.method == "POST":
                 form_name = request.form.get("form-name")
 
@@ -462,6 +398,7 @@ def init_routes(app):
                     try:
                         session.add(new_brand)
                         session.commit()
+                        catalog_cache.bump(CLASSIFICATORS)
                         flash("Brand added successfully!", "success")
                     except IntegrityError:
                         session.rollback()
@@ -473,6 +410,7 @@ def init_routes(app):
                     try:
                         session.add(new_socket)
                         session.commit()
+                        catalog_cache.bump(CLASSIFICATORS)
                         flash("Socket type added successfully!", "success")
                     except IntegrityError:
                         session.rollback()
@@ -484,15 +422,16 @@ def init_routes(app):
                     try:
                         session.add(new_memory)
                         session.commit()
+                        catalog_cache.bump(CLASSIFICATORS)
                         flash("Memory type added successfully!", "success")
                     except IntegrityError:
                         session.rollback()
                         flash("This memory type already exists!", "danger")
                     return redirect(url_for("get_classificators_page"))
 
-            brands = session.query(Brand).order_by(Brand.component_type, Brand.name).all()
-            sockets = session.query(SocketType).order_by(SocketType.name).all()
-            memories = session.query(MemoryType).order_by(MemoryType.name).all()
+            brands = brand_rows(session)
+            sockets = socket_type_rows(session)
+            memories = memory_type_rows(session)
 
         return render_template(
             "classificators/classificators.html",
@@ -508,7 +447,7 @@ def init_routes(app):
 
     @app.route("/classificators/brand_<int:brand_id>/delete", methods=["POST"])
     def delete_brand(brand_id):
-        with session_factory() as session:
+        with request_session() as session:
             brand = session.query(Brand).get(brand_id)
 
             if brand is None:
@@ -522,12 +461,13 @@ def init_routes(app):
             if brand:
                 session.delete(brand)
                 session.commit()
+                catalog_cache.bump(CLASSIFICATORS)
                 flash(f"Brand '{brand.name}' deleted successfully!", "success")
         return redirect(url_for("get_classificators_page"))
 
     @app.route("/classificators/socket_type_<int:socket_type_id>/delete", methods=["POST"])
     def delete_socket_type(socket_type_id):
-        with session_factory() as session:
+        with request_session() as session:
             socket_type = session.get(SocketType, socket_type_id)
 
             if not socket_type:
@@ -540,12 +480,13 @@ def init_routes(app):
 
             session.delete(socket_type)
             session.commit()
+            catalog_cache.bump(CLASSIFICATORS)
             flash("Socket type deleted successfully.", "success")
             return redirect(url_for("get_classificators_page"))
 
     @app.route("/classificators/memory_type_<int:memory_type_id>/delete", methods=["POST"])
     def delete_memory_type(memory_type_id):
-        with session_factory() as session:
+        with request_session() as session:
             memory_type = session.get(MemoryType, memory_type_id)
 
             if not memory_type:
@@ -558,25 +499,44 @@ def init_routes(app):
 
             session.delete(memory_type)
             session.commit()
+            catalog_cache.bump(CLASSIFICATORS)
             flash("Memory type deleted successfully.", "success")
             return redirect(url_for("get_classificators_page"))
 
     @app.route("/assemblies", methods=["GET", "POST"])
+    @conditional_page(ASSEMBLIES, COMPONENTS, CLASSIFICATORS)
     def get_assemblies_page():
-        with session_factory() as session:
-            assemblies = session.query(Assembly).options(joinedload(Assembly.components_association)).all()
-            return render_template(
-                "assemblies/assemblies.html",
-                assemblies=assemblies,
-                csrf_token=generate_csrf(),
-            )
+        with request_session() as session:
+            assemblies = assembly_summaries(session)
+
+        return render_template(
+            "assemblies/assemblies.html",
+            assemblies=assemblies,
+            csrf_token=generate_csrf(),
+        )
+
+    @app.route("/assemblies/compatibility.json")
+    def get_compatibility_data():
+        with request_session() as session:
+            payload = get_compatibility_payload(session)
+
+        response = Response(payload.body, mimetype="application/json")
+        response.set_etag(payload.etag)
+        if request.args.get("v") == payload.etag:
+            # Versioned URL from the assembly form: its content can never change
+            response.cache_control.public = True
+            response.cache_control.max_age = 31536000
+            response.cache_control.immutable = True
+        else:
+            response.cache_control.no_cache = True
+        return response.make_conditional(request)
 
     @app.route("/assemblies/add/select", methods=["GET", "POST"])
     def add_assembly():
         form = AssemblySelectForm()
 
-        with session_factory() as session:
-            populate_component_choices(form, session)
+        with request_session() as session:
+            populate_component_choices(form)
 
             if request.method == "POST" and form.validate_on_submit():
                 compatible, compatibility_errors = check_compatibility(form, session)
@@ -588,6 +548,7 @@ def init_routes(app):
                         form=form,
                         csrf_token=generate_csrf(),
                         active_page="assemblies",
+                        compatibility_url=compatibility_url(session),
                     )
 
                 try:
@@ -602,6 +563,7 @@ def init_routes(app):
 
                     session.add(assembly)
                     session.commit()
+                    catalog_cache.bump(ASSEMBLIES)
 
                     flash("Assembly created from selected components!", "success")
                     return redirect(url_for("get_assemblies_page"))
@@ -610,16 +572,20 @@ def init_routes(app):
                     session.rollback()
                     flash(f"Failed to create assembly: {e}", "danger")
 
+            url = compatibility_url(session)
+
         return render_template(
             "assemblies/add_assembly.html",
             form=form,
             csrf_token=generate_csrf(),
             active_page="assemblies",
+            compatibility_url=url,
         )
 
     @app.route("/assemblies/<int:assembly_id>")
+    @conditional_page(ASSEMBLIES, COMPONENTS, CLASSIFICATORS)
     def get_assembly(assembly_id):
-        with session_factory() as session:
+        with request_session() as session:
             assembly = session.get(Assembly, assembly_id)
 
             if not assembly:
@@ -634,7 +600,7 @@ def init_routes(app):
 
     @app.route("/assemblies/<int:assembly_id>/delete", methods=["POST"])
     def delete_assembly(assembly_id):
-        with session_factory() as session:
+        with request_session() as session:
             assembly = session.get(Assembly, assembly_id)
 
             if not assembly:
@@ -642,13 +608,14 @@ def init_routes(app):
 
             session.delete(assembly)
             session.commit()
+            catalog_cache.bump(ASSEMBLIES)
             return redirect(url_for("get_assemblies_page"))
 
     @app.route("/assemblies/edit/<int:assembly_id>", methods=["GET", "POST"])
     def edit_assembly(assembly_id):
         form = AssemblySelectForm()
 
-        with session_factory() as session:
+        with request_session() as session:
             assembly = session.query(Assembly).filter_by(id=assembly_id).first()
             if not assembly:
                 flash("Assembly not found.", "danger")
@@ -679,7 +646,7 @@ def init_routes(app):
                 "soundcard_id": soundcard_id,
             }
 
-            populate_component_choices(form, session, selected_ids)
+            populate_component_choices(form, selected_ids)
 
             if request.method == "GET":
                 form.assembly_name.data = assembly.name
@@ -721,6 +688,7 @@ def init_routes(app):
                         assembly=assembly,
                         csrf_token=generate_csrf(),
                         active_page="assemblies",
+                        compatibility_url=compatibility_url(session),
                     )
 
                 try:
@@ -735,6 +703,7 @@ def init_routes(app):
 
                     session.add(assembly)
                     session.commit()
+                    catalog_cache.bump(ASSEMBLIES)
 
                     flash("Assembly updated succesfully!", "success")
                     return redirect(url_for("get_assemblies_page"))
@@ -743,57 +712,26 @@ def init_routes(app):
                     session.rollback()
                     flash(f"Failed to update assembly: {e}", "danger")
 
+            url = compatibility_url(session)
+
         return render_template(
             "assemblies/edit_assembly.html",
             form=form,
             assembly=assembly,
             csrf_token=generate_csrf(),
             active_page="assemblies",
+            compatibility_url=url,
         )
 
     @app.route("/assemblies/<int:assembly_id>/download/xml")
     def download_assembly_xml(assembly_id):
-        with session_factory() as session:
+        with request_session() as session:
             assembly = session.get(Assembly, assembly_id)
 
             if not assembly:
                 abort(404, description="Assembly not found")
 
-            root = ET.Element("assembly", attrib={"id": str(assembly.id), "name": assembly.name})
-
-            for component in assembly.components:
-                comp_el = ET.SubElement(
-                    root,
-                    "component",
-                    attrib={
-                        "type": component.component_type,
-                        "brand": component.brand_rel.name,
-                        "model": component.model,
-                    },
-                )
-
-                if component.component_type == "cpu":
-                    ET.SubElement(comp_el, "cores").text = str(component.cores)
-                    ET.SubElement(comp_el, "threads").text = str(component.threads)
-                    ET.SubElement(comp_el, "integrated_graphics").text = str(component.has_integrated_graphics)
-
-                elif component.component_type == "motherboard":
-                    ET.SubElement(comp_el, "socket").text = component.socket_type_rel.name
-                    ET.SubElement(comp_el, "memory_type").text = component.memory_type_rel.name
-                    ET.SubElement(comp_el, "integrated_graphics").text = str(component.has_integrated_graphics)
-
-                elif component.component_type == "ram":
-                    ET.SubElement(comp_el, "capacity").text = str(component.capacity)
-                    ET.SubElement(comp_el, "frequency").text = str(component.frequency)
-                    ET.SubElement(comp_el, "memory_type").text = component.memory_type_rel.name
-
-                elif component.component_type == "gpu":
-                    ET.SubElement(comp_el, "vram").text = str(component.vram)
-
-                elif component.component_type == "soundcard":
-                    ET.SubElement(comp_el, "channels").text = str(component.channels_quantity)
-
-            xml_str = ET.tostring(root, encoding="utf-8", method="xml")
+            xml_str = assembly_to_xml(assembly)
 
             return Response(
                 xml_str,
@@ -803,53 +741,13 @@ def init_routes(app):
 
     @app.route("/assemblies/<int:assembly_id>/download/json")
     def download_assembly_json(assembly_id):
-        with session_factory() as session:
+        with request_session() as session:
             assembly = session.get(Assembly, assembly_id)
 
             if not assembly:
                 abort(404, description="Assembly not found")
 
-            data = {"id": assembly.id, "name": assembly.name, "components": []}
-
-            for component in assembly.components:
-                comp = {
-                    "type": component.component_type,
-                    "brand": component.brand_rel.name,
-                    "model": component.model,
-                }
-
-                if component.component_type == "cpu":
-                    comp.update(
-                        {
-                            "cores": component.cores,
-                            "threads": component.threads,
-                            "integrated_graphics": component.has_integrated_graphics,
-                        }
-                    )
-                elif component.component_type == "motherboard":
-                    comp.update(
-                        {
-                            "socket": component.socket_type_rel.name,
-                            "memory_type": component.memory_type_rel.name,
-                            "integrated_graphics": component.has_integrated_graphics,
-                        }
-                    )
-                elif component.component_type == "ram":
-                    comp.update(
-                        {
-                            "capacity": component.capacity,
-                            "frequency": component.frequency,
-                            "memory_type": component.memory_type_rel.name,
-                        }
-                    )
-                elif component.component_type == "gpu":
-                    comp.update({"vram": component.vram})
-                elif component.component_type == "soundcard":
-                    comp.update({"channels": component.channels_quantity})
-
-                data["components"].append(comp)
-
-            json_str = json.dumps(data, indent=2)
+            json_str = assembly_to_json(assembly)
 
             return Response(
                 json_str,
@@ -859,41 +757,13 @@ def init_routes(app):
 
     @app.route("/assemblies/<int:assembly_id>/download/txt")
     def download_assembly_txt(assembly_id):
-        with session_factory() as session:
+        with request_session() as session:
             assembly = session.get(Assembly, assembly_id)
 
             if not assembly:
                 abort(404, description="Assembly not found")
 
-            lines = [f"Assembly Name: {assembly.name}", "Components:"]
-
-            for component in assembly.components:
-                lines.append(f"\n  - Type: {component.component_type.upper()}")
-                lines.append(f"    Brand: {component.brand_rel.name}")
-                lines.append(f"    Model: {component.model}")
-
-                if component.component_type == "cpu":
-                    lines.append(f"    Cores: {component.cores}")
-                    lines.append(f"    Threads: {component.threads}")
-                    lines.append(f"    Integrated Graphics: {'Yes' if component.has_integrated_graphics else 'No'}")
-
-                elif component.component_type == "motherboard":
-                    lines.append(f"    Socket: {component.socket_type_rel.name}")
-                    lines.append(f"    Memory Type: {component.memory_type_rel.name}")
-                    lines.append(f"    Integrated Graphics: {'Yes' if component.has_integrated_graphics else 'No'}")
-
-                elif component.component_type == "ram":
-                    lines.append(f"    Capacity: {component.capacity} GB")
-                    lines.append(f"    Frequency: {component.frequency} MHz")
-                    lines.append(f"    Memory Type: {component.memory_type_rel.name}")
-
-                elif component.component_type == "gpu":
-                    lines.append(f"    VRAM: {component.vram} GB")
-
-                elif component.component_type == "soundcard":
-                    lines.append(f"    Channels: {component.channels_quantity}")
-
-            txt_output = "\n".join(lines)
+            txt_output = assembly_to_txt(assembly)
 
             return Response(
                 txt_output,
@@ -0,0 +1,116 @@
+import bisect
+
+from sqlalchemy import any_, func, or_, select
+
+from app.cache import CLASSIFICATORS, COMPONENTS, catalog_cache
+from app.models import Brand
+from app.queries import components
+
+brands = Brand.__table__
+
+MAX_SEARCH_WORDS = 8
+
+
+def search_words(term):
+    return (term or "").split()[:MAX_SEARCH_WORDS]
+
+
+def escape_like(value):
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_components(query, term, entity=components.c):
+    """
+    Keep components whose model (or brand name) matches every word of `term`.
+
+    A word matches as a case-insensitive substring or, to tolerate typos, by pg_trgm word similarity
+    (`model %> word`), both served by the trigram GIN index on `components.model`. The ids of matching
+    brands are collected into an array first: `brand_id = ANY(<array>)` is an index condition on
+    `ix_components_brand_id`, so Postgres can combine the three arms in a BitmapOr. An `IN (subquery)`
+    arm would be planned as a SubPlan filter and force a sequential scan of `components`.
+    """
+    for word in search_words(term):
+        pattern = f"%{escape_like(word)}%"
+        # Uncorrelated even when `brands` is joined (ranked search): Postgres runs it once as an InitPlan
+        brand_matches = select(brands.c.id).where(brands.c.name.ilike(pattern, escape="\\")).correlate(None)
+        brand_ids = func.array(brand_matches.scalar_subquery())
+        query = query.where(
+            or_(
+                entity.model.ilike(pattern, escape="\\"),
+                entity.model.op("%>")(word),
+                entity.brand_id == any_(brand_ids),
+            )
+        )
+    return query
+
+
+def search_rank(term, entity=components.c):
+    """Relevance of a search hit; the query must have `brands` joined."""
+    return func.word_similarity(" ".join(search_words(term)), func.concat(brands.c.name, " ", entity.model))
+
+
+def search_hits_query():
+    return (
+        select(components.c.id, components.c.component_type, brands.c.name.label("brand_name"), components.c.model)
+        .select_from(components)
+        .join(brands, brands.c.id == components.c.brand_id)
+    )
+
+
+def ranked_search(term, limit):
+    """`(id, component_type, brand_name, model, rank)` of the best matches of `term`, best first."""
+    rank = search_rank(term).label("rank")
+    query = search_components(search_hits_query().add_columns(rank), term)
+    return query.order_by(rank.desc(), components.c.model).limit(limit)
+
+
+class AutocompleteIndex:
+    """
+    Sorted in-memory index of model names for prefix completion.
+
+    Every component is indexed under its model and under "<brand> <model>", case-folded, so both "rtx 30"
+    and "nvidia rtx" complete. A lookup is a binary search followed by a scan over the matching run.
+    """
+
+    def __init__(self, rows):
+        entries = []
+        for row in rows:
+            item = {
+                "id": row.id,
+                "component_type": row.component_type,
+                "brand_name": row.brand_name,
+                "model": row.model,
+            }
+            entries.append((row.model.casefold(), row.id, item))
+            entries.append((f"{row.brand_name} {row.model}".casefold(), row.id, item))
+        entries.sort(key=lambda entry: entry[:2])
+        self._keys = [key for key, _, _ in entries]
+        self._items = [item for _, _, item in entries]
+
+    def complete(self, prefix, limit, component_type=None):
+        prefix = " ".join(prefix.split()).casefold()
+        if not prefix:
+            return []
+
+        found, seen = [], set()
+        position = bisect.bisect_left(self._keys, prefix)
+        while position < len(self._keys) and self._keys[position].startswith(prefix) and len(found) < limit:
+            item = self._items[position]
+            if item["id"] not in seen and component_type in (None, item["component_type"]):
+                seen.add(item["id"])
+                found.append(item)
+            position += 1
+        return found
+
+
+def build_autocomplete_index(session):
+    return AutocompleteIndex(session.execute(search_hits_query()).all())
+
+
+def get_autocomplete_index(session):
+    """The autocomplete index of the current catalog, rebuilt after components or brands change."""
+    return catalog_cache.get(
+        "autocomplete_index",
+        lambda: build_autocomplete_index(session),
+        scopes=(COMPONENTS, CLASSIFICATORS),
+    )
@@ -0,0 +1,289 @@
+from sqlalchemy import exists, select
+
+from app.cache import ASSEMBLIES, CLASSIFICATORS, COMPONENTS, catalog_cache
+from app.compatibility import evaluate, refresh_compatibility_index
+from app.database_data import insert_component_rows, upsert_component_rows
+from app.imports import import_components
+from app.models import (
+    CPU,
+    GPU,
+    RAM,
+    Assembly,
+    AssemblyComponentAssociation,
+    Brand,
+    Component,
+    MemoryType,
+    Motherboard,
+    SocketType,
+    Soundcard,
+)
+from app.queries import component_rows_query, components
+
+COMPONENT_MODELS = {
+    "motherboard": Motherboard,
+    "cpu": CPU,
+    "gpu": GPU,
+    "ram": RAM,
+    "soundcard": Soundcard,
+}
+BASE_FIELDS = ("brand_id", "model", "quantity")
+COMPONENT_FIELDS = {
+    "motherboard": ("socket_type_id", "memory_type_id", "has_integrated_graphics"),
+    "cpu": ("socket_type_id", "cores", "threads", "has_integrated_graphics"),
+    "gpu": ("vram",),
+    "ram": ("memory_type_id", "capacity", "frequency"),
+    "soundcard": ("channels_quantity",),
+}
+CLASSIFICATOR_MODELS = {
+    "brand": Brand,
+    "socket_type": SocketType,
+    "memory_type": MemoryType,
+}
+ASSEMBLY_SLOTS = ("motherboard", "cpu", "gpu", "ram", "soundcard")
+
+
+class NotFoundError(LookupError):
+    pass
+
+
+class ConflictError(ValueError):
+    pass
+
+
+class IncompatibleBuildError(ValueError):
+    def __init__(self, errors):
+        super().__init__("Incompatible components")
+        self.errors = errors
+
+
+def component_row(session, component_id):
+    row = session.execute(component_rows_query().where(components.c.id == component_id)).first()
+    if row is None:
+        raise NotFoundError(f"Component {component_id} not found")
+    return row
+
+
+def validate_component(session, values):
+    """Check the references among `values`; only the fields being written need to be passed."""
+    # Same rule as the fixture loader and the bulk importer: any brand is accepted, since vendors such as
+    # AMD ship several component types
+    for field, model in (("brand_id", Brand), ("socket_type_id", SocketType), ("memory_type_id", MemoryType)):
+        if field in values and session.get(model, values[field]) is None:
+            raise ValueError(f"Unknown {field} {values[field]}")
+
+
+def component_written(session, component_id):
+    catalog_cache.bump(COMPONENTS)
+    refresh_compatibility_index(session, [component_id])
+
+
+def write_component(session, component_type, data, upsert=False):
+    """
+    Insert a component, or with `upsert` insert or update it by model name; returns `(id, inserted)`.
+
+    Duplicates are resolved by `ON CONFLICT (model)` in the database, so an existing model costs neither
+    an extra lookup nor a failed transaction.
+    """
+    fields = BASE_FIELDS + COMPONENT_FIELDS[component_type]
+    values = {field: data[field] for field in fields if data.get(field) is not None}
+    values.setdefault("quantity", 1)
+    validate_component(session, values)
+
+    model = COMPONENT_MODELS[component_type]
+    base_row = {field: values[field] for field in BASE_FIELDS} | {"component_type": component_type}
+    type_rows = {
+        values["model"]: {field: values[field] for field in COMPONENT_FIELDS[component_type] if field in values}
+    }
+    if upsert:
+        written = upsert_component_rows(session.connection(), model, [base_row], type_rows)
+        if not written:
+            raise ConflictError(f'Component with model "{values["model"]}" exists with another component type.')
+        component_id, _, inserted = written[0]
+    else:
+        created = insert_component_rows(session.connection(), model, [base_row], type_rows)
+        if not created:
+            raise ConflictError(f'Component with model "{values["model"]}" already exists.')
+        (component_id, _), inserted = created[0], True
+
+    session.commit()
+    component_written(session, component_id)
+    return component_id, inserted
+
+
+def create_component(session, component_type, data):
+    return write_component(session, component_type, data)[0]
+
+
+def update_component(session, component_id, data):
+    component = session.get(Component, component_id)
+    if component is None:
+        raise NotFoundError(f"Component {component_id} not found")
+
+    fields = BASE_FIELDS + COMPONENT_FIELDS[component.component_type]
+    changes = {
+        field: data[field]
+        for field in fields
+        if data.get(field) is not None and data[field] != getattr(component, field)
+    }
+    validate_component(session, changes)
+
+    if "model" in changes:
+        duplicate = select(Component.id).where(Component.model == changes["model"], Component.id != component_id)
+        if session.scalar(duplicate) is not None:
+            raise ConflictError(f'Component with model "{changes["model"]}" already exists.')
+
+    for field, value in changes.items():
+        setattr(component, field, value)
+    session.commit()
+    component_written(session, component_id)
+
+
+def delete_component(session, component_id):
+    component = session.get(Component, component_id)
+    if component is None:
+        raise NotFoundError(f"Component {component_id} not found")
+
+    used = select(exists().where(AssemblyComponentAssociation.component_id == component_id))
+    if session.scalar(used):
+        raise ConflictError("Cannot delete component: it's used in assemblies.")
+
+    session.delete(component)
+    session.commit()
+    component_written(session, component_id)
+
+
+def bulk_import_components(session, stream, import_format, upsert=False):
+    report = import_components(session.connection(), stream, import_format, upsert)
+    session.commit()
+    if report.component_ids:
+        catalog_cache.bump(COMPONENTS)
+        refresh_compatibility_index(session, report.component_ids)
+    return report
+
+
+def create_classificator(session, kind, name, component_type=None):
+    model = CLASSIFICATOR_MODELS[kind]
+    if session.scalar(select(model.id).where(model.name == name)) is not None:
+        raise ConflictError(f"{kind} '{name}' already exists.")
+
+    if kind == "brand":
+        if component_type not in COMPONENT_MODELS:
+            raise ValueError(f"Unknown component type {component_type!r}")
+        classificator = Brand(name=name, component_type=component_type)
+    else:
+        classificator = model(name=name)
+
+    session.add(classificator)
+    session.commit()
+    catalog_cache.bump(CLASSIFICATORS)
+    return classificator.id
+
+
+def delete_classificator(session, kind, classificator_id):
+    model = CLASSIFICATOR_MODELS[kind]
+    if session.get(model, classificator_id) is None:
+        raise NotFoundError(f"{kind} {classificator_id} not found")
+
+    usages = {
+        "brand": [Component.brand_id],
+        "socket_type": [CPU.socket_type_id, Motherboard.socket_type_id],
+        "memory_type": [RAM.memory_type_id, Motherboard.memory_type_id],
+    }[kind]
+    if any(session.scalar(select(exists().where(column == classificator_id))) for column in usages):
+        raise ConflictError(f"Cannot delete {kind}: it's used in components.")
+
+    session.delete(session.get(model, classificator_id))
+    session.commit()
+    catalog_cache.bump(CLASSIFICATORS)
+
+
+def assembly_parts(data):
+    """`component_type -> (component_id, quantity)` of an assembly payload (see `assembly_input`)."""
+    parts = {}
+    for slot in ASSEMBLY_SLOTS:
+        if slot == "gpu" and data.get("gpu_is_integrated"):
+            continue
+        if data.get(f"{slot}_id"):
+            parts[slot] = (data[f"{slot}_id"], data.get(f"{slot}_quantity") or 1)
+    return parts
+
+
+def validate_assembly(session, data, assembly_id=None):
+    if not data.get("assembly_name"):
+        raise ValueError("Assembly name is required")
+
+    duplicate = select(Assembly.id).where(Assembly.name == data["assembly_name"], Assembly.id != assembly_id)
+    if session.scalar(duplicate) is not None:
+        raise ConflictError(f"Assembly '{data['assembly_name']}' already exists.")
+
+    parts = assembly_parts(data)
+    ids = [component_id for component_id, _ in parts.values()]
+    types = dict(session.execute(select(Component.id, Component.component_type).where(Component.id.in_(ids))).all())
+    for slot, (component_id, _) in parts.items():
+        if types.get(component_id) != slot:
+            raise ValueError(f"Component {component_id} is not a {slot}")
+
+    errors = [violation.message for violation in evaluate(session, {slot: part[0] for slot, part in parts.items()})]
+    if errors:
+        raise IncompatibleBuildError(errors)
+    return parts
+
+
+def set_assembly_components(assembly, parts):
+    assembly.components_association = [
+        AssemblyComponentAssociation(component_id=component_id, quantity=quantity)
+        for component_id, quantity in parts.values()
+    ]
+
+
+def create_assembly(session, data):
+    parts = validate_assembly(session, data)
+    assembly = Assembly(name=data["assembly_name"], quantity=data.get("assembly_quantity") or 1)
+    set_assembly_components(assembly, parts)
+    session.add(assembly)
+    session.commit()
+    catalog_cache.bump(ASSEMBLIES)
+    return assembly.id
+
+
+def update_assembly(session, assembly_id, data):
+    assembly = session.get(Assembly, assembly_id)
+    if assembly is None:
+        raise NotFoundError(f"Assembly {assembly_id} not found")
+
+    parts = validate_assembly(session, data, assembly_id)
+    assembly.name = data["assembly_name"]
+    assembly.quantity = data.get("assembly_quantity") or 1
+    set_assembly_components(assembly, parts)
+    session.commit()
+    catalog_cache.bump(ASSEMBLIES)
+
+
+def delete_assembly(session, assembly_id):
+    assembly = session.get(Assembly, assembly_id)
+    if assembly is None:
+        raise NotFoundError(f"Assembly {assembly_id} not found")
+
+    session.delete(assembly)
+    session.commit()
+    catalog_cache.bump(ASSEMBLIES)
+
+
+def assembly_detail(session, assembly_id):
+    row = session.execute(
+        select(Assembly.id, Assembly.name, Assembly.quantity, Assembly.created_at, Assembly.updated_at).where(
+            Assembly.id == assembly_id
+        )
+    ).first()
+    if row is None:
+        raise NotFoundError(f"Assembly {assembly_id} not found")
+
+    association = AssemblyComponentAssociation.__table__
+    parts = (
+        component_rows_query()
+        .add_columns(association.c.quantity.label("assembly_quantity"))
+        .join(association, association.c.component_id == components.c.id)
+        .where(association.c.assembly_id == assembly_id)
+        .order_by(components.c.id)
+    )
+    return row, session.execute(parts).all()
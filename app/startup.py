@@ -0,0 +1,105 @@
+import time
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from loguru import logger
+from sqlalchemy import func, inspect, select
+
+from alembic import command
+from app.config import settings
+from app.database import drop_all_tables_cascade, maintenance_engine
+from app.database_data import seed_data
+
+ALEMBIC_DIR = Path(__file__).resolve().parent.parent / "alembic"
+INIT_REVISION = "9b29737a8051"
+
+# Arbitrary application-wide key: serializes migrations and seeding between workers
+STARTUP_LOCK_ID = 7_305_118_223
+STARTUP_LOCK_POLL_INTERVAL = 0.5
+
+
+def get_alembic_config(connection=None):
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+def upgrade_schema(connection):
+    config = get_alembic_config(connection)
+    heads = set(ScriptDirectory.from_config(config).get_heads())
+    current = set(MigrationContext.configure(connection).get_current_heads())
+    has_legacy_schema = not current and inspect(connection).has_table("components")
+    connection.commit()
+
+    if current == heads:
+        logger.info(f"Database schema is up to date ({', '.join(sorted(current))}).")
+        return False
+
+    if has_legacy_schema:
+        # Schema was created by Base.metadata.create_all() before migrations were used on startup
+        logger.warning(f"Unversioned schema found, stamping it as {INIT_REVISION}.")
+        command.stamp(config, INIT_REVISION)
+
+    logger.info(f"Upgrading database schema {sorted(current) or 'base'} -> {sorted(heads)}.")
+    command.upgrade(config, "head")
+    return True
+
+
+def acquire_startup_lock(connection):
+    """
+    Take the startup lock, polling instead of blocking in pg_advisory_lock().
+
+    Between attempts the connection is idle outside a transaction: a worker blocked in a statement holds a
+    snapshot, and CREATE INDEX CONCURRENTLY run by the lock holder would wait for it forever.
+    """
+    waiting = False
+    while True:
+        locked = connection.execute(select(func.pg_try_advisory_lock(STARTUP_LOCK_ID))).scalar()
+        connection.commit()
+        if locked:
+            return
+        if not waiting:
+            logger.info("Another worker is preparing the database, waiting for it.")
+            waiting = True
+        time.sleep(STARTUP_LOCK_POLL_INTERVAL)
+
+
+def prepare_database():
+    mode = settings.startup_mode
+    if mode == "skip":
+        logger.info("STARTUP_MODE=skip, database preparation is disabled.")
+        return
+
+    started = time.perf_counter()
+
+    with maintenance_engine.connect() as connection:
+        acquire_startup_lock(connection)
+        try:
+            if mode == "reset":
+                logger.warning("STARTUP_MODE=reset, dropping all tables.")
+                drop_all_tables_cascade()
+
+            upgrade_schema(connection)
+
+            if settings.seed_on_startup or mode == "reset":
+                seed_data()
+        finally:
+            connection.execute(select(func.pg_advisory_unlock(STARTUP_LOCK_ID)))
+            connection.commit()
+
+    logger.info(f"Database prepared in {time.perf_counter() - started:.3f}s (mode={mode}).")
+
+
+def track_time_to_first_request(app, started):
+    state = {"served": False}
+
+    @app.before_request
+    def log_time_to_first_request():
+        if state["served"]:
+            return
+        state["served"] = True
+        logger.info(f"Time to first request: {time.perf_counter() - started:.3f}s")
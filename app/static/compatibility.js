@@ -0,0 +1,85 @@
+// Client-side filtering of the assembly form, driven by /assemblies/compatibility.json.
+// Options of the left component of every rule (CPU, RAM) are limited to the ones that fit the component
+// selected on the right (motherboard); the "integrated GPU" checkbox is only available when the selected
+// CPU or motherboard has one. The server still validates the submitted build.
+(function () {
+  const script = document.currentScript;
+
+  function select(componentType) {
+    return document.getElementById(`${componentType}_id`);
+  }
+
+  function selectedId(componentType) {
+    const element = select(componentType);
+    return element && element.value ? Number(element.value) : null;
+  }
+
+  function attributeValues(groups) {
+    // component id -> attribute -> value
+    const values = new Map();
+    for (const [attribute, byValue] of Object.entries(groups)) {
+      for (const [value, byType] of Object.entries(byValue)) {
+        for (const ids of Object.values(byType)) {
+          for (const id of ids) {
+            if (!values.has(id)) values.set(id, {});
+            values.get(id)[attribute] = value;
+          }
+        }
+      }
+    }
+    return values;
+  }
+
+  function filterOptions(element, allowed) {
+    let firstAllowed = null;
+    for (const option of element.options) {
+      const visible = allowed === null || allowed.has(Number(option.value));
+      option.hidden = !visible;
+      option.disabled = !visible;
+      if (visible && firstAllowed === null) firstAllowed = option;
+    }
+    if (element.selectedOptions.length && element.selectedOptions[0].disabled && firstAllowed !== null) {
+      element.value = firstAllowed.value;
+      element.dispatchEvent(new Event("change"));
+    }
+  }
+
+  function apply(payload, values) {
+    for (const rule of payload.rules) {
+      const left = select(rule.left);
+      if (!left) continue;
+
+      const rightId = selectedId(rule.right);
+      const value = rightId === null ? undefined : (values.get(rightId) || {})[rule.attribute];
+      const byType = value === undefined ? null : payload.groups[rule.attribute][value] || {};
+      filterOptions(left, byType === null ? null : new Set(byType[rule.left] || []));
+    }
+
+    const integrated = document.getElementById("gpuIntegrated");
+    if (integrated) {
+      const withGraphics = new Set(payload.integrated_graphics);
+      const available = ["cpu", "motherboard"].some((type) => withGraphics.has(selectedId(type)));
+      integrated.disabled = !available;
+      if (!available && integrated.checked) {
+        integrated.checked = false;
+        integrated.dispatchEvent(new Event("change"));
+      }
+    }
+  }
+
+  fetch(script.dataset.compatibilityUrl)
+    .then((response) => (response.ok ? response.json() : Promise.reject(response.status)))
+    .then((payload) => {
+      const values = attributeValues(payload.groups);
+      const types = new Set(["cpu", "motherboard"]);
+      payload.rules.forEach((rule) => types.add(rule.left).add(rule.right));
+      for (const type of types) {
+        const element = select(type);
+        if (element) element.addEventListener("change", () => apply(payload, values));
+      }
+      apply(payload, values);
+    })
+    .catch(() => {
+      // Without the payload the form simply works as before
+    });
+})();
@@ -0,0 +1,48 @@
+// Model suggestions for the catalog search box, served by /api/components/autocomplete.
+(function () {
+  const script = document.currentScript;
+  const input = document.getElementById("q");
+  const list = document.getElementById("q-suggestions");
+  if (!input || !list) return;
+
+  let timer = null;
+  let controller = null;
+
+  function render(items) {
+    list.replaceChildren(
+      ...items.map((item) => {
+        const option = document.createElement("option");
+        option.value = item.model;
+        option.label = `${item.brand_name} ${item.model} (${item.component_type.toUpperCase()})`;
+        return option;
+      })
+    );
+  }
+
+  async function suggest() {
+    const prefix = input.value.trim();
+    if (prefix.length < 2) {
+      render([]);
+      return;
+    }
+
+    if (controller) controller.abort();
+    controller = new AbortController();
+    const url = new URL(script.dataset.autocompleteUrl, window.location.origin);
+    url.searchParams.set("prefix", prefix);
+    const typeSelect = document.getElementById("component_type");
+    if (typeSelect && typeSelect.value) url.searchParams.set("component_type", typeSelect.value);
+
+    try {
+      const response = await fetch(url, { signal: controller.signal });
+      if (response.ok) render(await response.json());
+    } catch (error) {
+      if (error.name !== "AbortError") throw error;
+    }
+  }
+
+  input.addEventListener("input", () => {
+    clearTimeout(timer);
+    timer = setTimeout(suggest, 150);
+  });
+})();
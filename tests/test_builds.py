@@ -0,0 +1,45 @@
+from itertools import islice, product
+
+from app.builds import BuildPart, ranked_combinations
+
+
+def slot(name, *scores):
+    return name, [BuildPart(score, f"{name}-{index}") for index, score in enumerate(sorted(scores, reverse=True))]
+
+
+GROUPS = [
+    [slot("motherboard", 1, 0), slot("cpu", 5, 3, 1), slot("ram", 2, 2)],
+    [slot("motherboard", 0.5), slot("cpu", 6, 0), slot("ram", 4)],
+]
+
+
+def test_ranked_combinations_in_descending_order():
+    scores = [score for score, _ in ranked_combinations(GROUPS)]
+    assert scores == sorted(scores, reverse=True)
+    assert scores[0] == 10.5
+
+
+def test_ranked_combinations_yield_every_build_once():
+    builds = [tuple(part.row for part in build.values()) for _, build in ranked_combinations(GROUPS)]
+    expected = [
+        tuple(part.row for part in parts)
+        for group in GROUPS
+        for parts in product(*(candidates for _, candidates in group))
+    ]
+    assert sorted(builds) == sorted(expected)
+
+
+def test_ranked_combinations_score_is_the_sum_of_parts():
+    for score, build in ranked_combinations(GROUPS):
+        assert list(build) == ["motherboard", "cpu", "ram"]
+        assert score == sum(part.score for part in build.values())
+
+
+def test_ranked_combinations_are_lazy():
+    # A million builds: the best ones come out without walking the cross product
+    huge = [[slot(name, *range(100, 0, -1)) for name in ("motherboard", "cpu", "ram")]]
+    assert [score for score, _ in islice(ranked_combinations(huge), 4)] == [300, 299, 299, 299]
+
+
+def test_no_groups():
+    assert list(ranked_combinations([])) == []
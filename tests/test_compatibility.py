@@ -0,0 +1,70 @@
+import pytest
+
+from app.compatibility import CompatibilityIndex
+from app.models import CPU, RAM, Motherboard
+
+AM5, LGA1700 = 1, 2
+DDR4, DDR5 = 1, 2
+
+
+@pytest.fixture
+def parts(db_session):
+    parts = {
+        "board": Motherboard(brand_id=1, model="ROG STRIX B650", socket_type_id=AM5, memory_type_id=DDR5),
+        "ryzen": CPU(brand_id=2, model="Ryzen 7 7700", socket_type_id=AM5, cores=8, threads=16),
+        "ryzen_x": CPU(brand_id=2, model="Ryzen 9 7950X", socket_type_id=AM5, cores=16, threads=32),
+        "ddr5": RAM(brand_id=1, model="Fury DDR5", memory_type_id=DDR5, capacity=32, frequency=6000),
+        "ddr4": RAM(brand_id=1, model="Fury DDR4", memory_type_id=DDR4, capacity=32, frequency=3200),
+    }
+    db_session.add_all(parts.values())
+    db_session.commit()
+    return parts
+
+
+@pytest.fixture
+def index(db_session, parts):
+    index = CompatibilityIndex()
+    index.rebuild(db_session, (1,))
+    return index
+
+
+def test_compatible(index, parts):
+    board = parts["board"].id
+    assert index.compatible(board, "cpu") == sorted([parts["ryzen"].id, parts["ryzen_x"].id])
+    assert index.compatible(board, "ram") == [parts["ddr5"].id]
+    assert index.compatible(parts["ddr4"].id, "motherboard") == []
+    assert index.compatible(0, "cpu") is None
+    with pytest.raises(ValueError):
+        index.compatible(parts["ryzen"].id, "ram")
+
+
+def test_refresh_applies_a_local_write(db_session, index, parts):
+    parts["ryzen_x"].socket_type_id = LGA1700
+    db_session.delete(parts["ryzen"])
+    added = CPU(brand_id=2, model="Ryzen 5 7600", socket_type_id=AM5, cores=6, threads=12)
+    db_session.add(added)
+    db_session.commit()
+
+    index.refresh(db_session, [parts["ryzen_x"].id, parts["ryzen"].id, added.id], (2,))
+
+    assert index.version == (2,)
+    assert index.compatible(parts["board"].id, "cpu") == [added.id]
+    assert index.compatible(parts["ryzen"].id, "motherboard") is None
+
+
+def test_refresh_ignores_a_missed_write(db_session, index, parts):
+    parts["ryzen_x"].socket_type_id = LGA1700
+    db_session.commit()
+
+    # Another write bumped the version in between: only a rebuild can bring the index up to date
+    index.refresh(db_session, [parts["ryzen_x"].id], (3,))
+
+    assert index.version == (1,)
+    assert parts["ryzen_x"].id in index.compatible(parts["board"].id, "cpu")
+
+
+def test_refresh_before_rebuild_is_ignored(db_session, parts):
+    index = CompatibilityIndex()
+    index.refresh(db_session, [parts["ryzen"].id], (1,))
+    assert index.version is None
+    assert index.compatible(parts["ryzen"].id, "motherboard") is None
@@ -0,0 +1,60 @@
+import pytest
+from flask import session
+
+from app import conditional
+from app.conditional import page_validators
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [7200.0]
+    monkeypatch.setattr(conditional.time, "time", lambda: now[0])
+    return now
+
+
+def etag(app, path="/assemblies", versions=(1, 2, 3), token=None):
+    with app.test_request_context(path):
+        if token is not None:
+            session["csrf_token"] = token
+        return page_validators(list(versions))
+
+
+def test_etag_is_stable(app, clock):
+    assert etag(app) == etag(app)
+
+
+@pytest.mark.parametrize(
+    "changed",
+    [
+        {"versions": (1, 2, 4)},
+        {"path": "/assemblies?sort=name"},
+        {"token": "another session"},
+    ],
+)
+def test_etag_depends_on_page_inputs(app, clock, changed):
+    assert etag(app, token="token") != etag(app, **{"token": "token", **changed})
+
+
+def test_etag_changes_every_half_token_lifetime(app, clock):
+    first = etag(app)
+    clock[0] += 1799
+    assert etag(app) == first
+    clock[0] += 1
+    assert etag(app) != first
+
+
+def test_conditional_page_answers_by_etag_only(app, monkeypatch):
+    monkeypatch.setattr(conditional, "scope_versions", lambda scopes: [1])
+
+    @app.route("/page")
+    @conditional.conditional_page("components")
+    def page():
+        return "page"
+
+    client = app.test_client()
+    response = client.get("/page")
+    assert response.status_code == 200
+    assert response.last_modified is None
+
+    assert client.get("/page", headers={"If-None-Match": response.headers["ETag"]}).status_code == 304
+    assert client.get("/page", headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}).status_code == 200
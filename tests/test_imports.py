@@ -0,0 +1,107 @@
+import pytest
+
+from app import imports
+from app.imports import ImportReport, import_batch, parse_row
+
+LOOKUPS = {
+    "brand": {"ASUS": 1, "AMD": 5},
+    "socket_type": {"AM5": 1},
+    "memory_type": {"DDR5": 2},
+}
+
+
+def cpu_row(model="Ryzen 7 7700", **values):
+    return {
+        "component_type": "cpu",
+        "model": model,
+        "brand": "AMD",
+        "socket_type": "AM5",
+        "cores": "8",
+        "threads": "16",
+        "has_integrated_graphics": "true",
+        **values,
+    }
+
+
+def test_parse_row():
+    component_type, base_row, type_row, errors = parse_row(cpu_row(quantity="3"), LOOKUPS)
+
+    assert errors == []
+    assert component_type == "cpu"
+    assert base_row == {"brand_id": 5, "model": "Ryzen 7 7700", "quantity": 3, "component_type": "cpu"}
+    assert type_row == {"socket_type_id": 1, "cores": 8, "threads": 16, "has_integrated_graphics": True}
+
+
+def test_parse_row_accepts_exported_brand_name():
+    row = cpu_row()
+    row["brand_name"] = row.pop("brand")
+    assert parse_row(row, LOOKUPS)[3] == []
+
+
+@pytest.mark.parametrize(
+    ("values", "error"),
+    [
+        ({"model": " "}, "model is required"),
+        ({"model": "x" * 101}, "model must be at most 100 characters"),
+        ({"brand": "INTEL"}, "unknown brand 'INTEL'"),
+        ({"socket_type": "LGA1700"}, "unknown socket_type 'LGA1700'"),
+        ({"cores": "eight"}, "cores must be an integer"),
+        ({"cores": 8.5}, "cores must be an integer"),
+        ({"cores": "0"}, "cores must be >= 1"),
+        ({"quantity": "-1"}, "quantity must be >= 0"),
+        ({"has_integrated_graphics": "maybe"}, "has_integrated_graphics must be a boolean"),
+    ],
+)
+def test_parse_row_errors(values, error):
+    assert error in parse_row(cpu_row(**values), LOOKUPS)[3]
+
+
+def test_parse_row_unknown_component_type():
+    assert parse_row({"component_type": "psu", "model": "RM850x"}, LOOKUPS)[0] is None
+
+
+@pytest.fixture
+def inserted(monkeypatch):
+    """Models passed to the insert, which creates every one of them."""
+    models = []
+
+    def insert_component_rows(connection, model, base_rows, type_rows):
+        created = [(len(models) + index, row["model"]) for index, row in enumerate(base_rows, start=1)]
+        models.extend(row["model"] for row in base_rows)
+        return created
+
+    monkeypatch.setattr(imports, "insert_component_rows", insert_component_rows)
+    return models
+
+
+def test_import_batch_reports_duplicates(inserted):
+    report, seen = ImportReport(), {}
+    batch = [(2, cpu_row("Ryzen 5 7600")), (3, cpu_row("Ryzen 7 7700")), (4, cpu_row("Ryzen 5 7600"))]
+
+    import_batch(None, batch, LOOKUPS, seen, report, upsert=False)
+
+    assert inserted == ["Ryzen 5 7600", "Ryzen 7 7700"]
+    assert (report.created, report.failed) == (2, 1)
+    assert report.rows == [{"row": 4, "model": "Ryzen 5 7600", "status": "failed", "errors": ["duplicate of row 2"]}]
+
+
+def test_import_batch_reports_duplicates_across_batches(inserted):
+    report, seen = ImportReport(), {}
+
+    import_batch(None, [(2, cpu_row())], LOOKUPS, seen, report, upsert=False)
+    import_batch(None, [(3, cpu_row(cores="x")), (4, cpu_row())], LOOKUPS, seen, report, upsert=False)
+
+    assert inserted == ["Ryzen 7 7700"]
+    assert [(row["row"], row["errors"]) for row in report.rows] == [
+        (3, ["cores must be an integer"]),
+        (4, ["duplicate of row 2"]),
+    ]
+
+
+def test_import_batch_invalid_row_is_not_a_duplicate_source(inserted):
+    report, seen = ImportReport(), {}
+
+    import_batch(None, [(2, cpu_row(cores="x")), (3, cpu_row())], LOOKUPS, seen, report, upsert=False)
+
+    assert inserted == ["Ryzen 7 7700"]
+    assert report.failed == 1
@@ -0,0 +1,41 @@
+import pytest
+
+from app.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    get_page_size,
+)
+from app.queries import components
+
+
+def test_cursor_round_trip():
+    columns = [components.c.model, components.c.id]
+    assert decode_cursor(encode_cursor(["RTX 4090", 17]), columns) == ["RTX 4090", 17]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["RTX 4090"],  # fewer values than sort columns
+        ["RTX 4090", 17, 1],
+        [17, "RTX 4090"],  # values of another sort order
+        ["RTX 4090", "17"],
+        ["RTX 4090", True],
+        ["RTX 4090", None],
+    ],
+)
+def test_cursor_must_match_sort_columns(values):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor(values), [components.c.model, components.c.id])
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", "e30", "bnVsbA"])  # garbage, {}, null
+def test_malformed_cursor(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, [components.c.id])
+
+
+@pytest.mark.parametrize(("value", "expected"), [(None, 50), ("10", 10), ("0", 1), ("1000", 200), ("ten", 50)])
+def test_page_size(value, expected):
+    assert get_page_size(value) == expected